@@ -0,0 +1,83 @@
+/*
+ * Vistas derivadas en el navegador de los datasets versionados
+ * (src/tabs/datasets.py). Cada función recibe el contenido de un
+ * ``dcc.Store`` ``dataset-<nombre>`` y devuelve la figura de una gráfica;
+ * cambiar de tab o redibujar no vuelve a pedir los datos al servidor.
+ */
+var REGION_COLORS = ['#00d4ff', '#f59e0b', '#00ff88', '#ff6b35'];
+
+window.dash_clientside = window.dash_clientside || {};
+window.dash_clientside.aifa = {
+    regionDistribution: function (routes) {
+        if (!routes) {
+            return window.dash_clientside.no_update;
+        }
+        // Suma por código de región (tabla columnar de src/data/routes.py)
+        var totals = routes.regions.map(function () { return 0; });
+        var counts = routes.regions.map(function () { return 0; });
+        routes.region_code.forEach(function (code, i) {
+            totals[code] += routes.passengers[i];
+            counts[code] += 1;
+        });
+        var present = counts.map(function (count, code) { return count ? code : -1; }).filter(function (code) {
+            return code >= 0;
+        });
+        var names = present.map(function (code) { return routes.regions[code]; });
+        var values = present.map(function (code) { return totals[code]; });
+        return {
+            data: [{
+                type: 'bar',
+                x: names,
+                y: values,
+                marker: {color: present.map(function (code) { return REGION_COLORS[code % REGION_COLORS.length]; })},
+                text: values.map(function (value) { return value.toLocaleString('en-US'); }),
+                textposition: 'auto'
+            }],
+            layout: {
+                xaxis: {title: {text: 'Región'}, gridcolor: 'rgba(255,255,255,0.1)'},
+                yaxis: {title: {text: 'Pasajeros Anuales'}, gridcolor: 'rgba(255,255,255,0.1)'},
+                plot_bgcolor: 'rgba(0,0,0,0)',
+                paper_bgcolor: 'rgba(0,0,0,0)',
+                font: {color: 'white'},
+                margin: {l: 40, r: 40, t: 40, b: 40}
+            }
+        };
+    },
+
+    progressGauge: function (kpi) {
+        if (!kpi) {
+            return window.dash_clientside.no_update;
+        }
+        var passengers = kpi.participation_passengers;
+        return {
+            data: [{
+                type: 'indicator',
+                mode: 'gauge+number+delta',
+                value: passengers.current,
+                domain: {x: [0, 1], y: [0, 1]},
+                title: {text: 'Meta ' + passengers.target + '%', font: {color: 'white'}},
+                delta: {reference: passengers.target},
+                gauge: {
+                    axis: {range: [null, 20]},
+                    bar: {color: '#00d4ff'},
+                    steps: [
+                        {range: [0, 10], color: 'rgba(255,71,87,0.3)'},
+                        {range: [10, 15], color: 'rgba(245,158,11,0.3)'},
+                        {range: [15, 20], color: 'rgba(0,255,136,0.3)'}
+                    ],
+                    threshold: {
+                        line: {color: 'red', width: 4},
+                        thickness: 0.75,
+                        value: passengers.target
+                    }
+                }
+            }],
+            layout: {
+                plot_bgcolor: 'rgba(0,0,0,0)',
+                paper_bgcolor: 'rgba(0,0,0,0)',
+                font: {color: 'white'},
+                margin: {l: 20, r: 20, t: 40, b: 20}
+            }
+        };
+    }
+};
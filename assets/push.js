@@ -0,0 +1,52 @@
+/*
+ * Canal de actualizaciones por Server-Sent Events (src/perf/push.py).
+ *
+ * Con la conexión abierta pausa el polling de datos (``data-interval``) y
+ * copia cada versión de datos nueva al ``dcc.Store`` ``data-version``, que
+ * dispara los callbacks de las gráficas. El reloj del header
+ * (``interval-component``) no se toca. Si el servidor no tiene el canal
+ * activo (responde 204) o la conexión se pierde, el polling vuelve a correr.
+ */
+(function () {
+    'use strict';
+
+    var PUSH_URL = '/_events/data-version';
+    var POLL_ID = 'data-interval';
+    var version = null;
+
+    function setProps(id, props) {
+        window.dash_clientside.set_props(id, props);
+    }
+
+    function connect() {
+        var source = new EventSource(PUSH_URL);
+        source.onopen = function () {
+            setProps(POLL_ID, {disabled: true});
+        };
+        source.addEventListener('data-version', function (event) {
+            var next = JSON.parse(event.data).version;
+            // El primer evento fija la versión con la que se dibujó la página
+            if (version !== null && next !== version) {
+                setProps('data-version', {data: next});
+            }
+            version = next;
+        });
+        source.onerror = function () {
+            setProps(POLL_ID, {disabled: false});
+        };
+    }
+
+    function waitForDash() {
+        // set_props necesita el store de Dash y el layout ya montado
+        if (window.dash_clientside && window.dash_clientside.set_props &&
+                (window.dash_stores || []).length && document.getElementById('tab-content')) {
+            connect();
+        } else {
+            window.setTimeout(waitForDash, 250);
+        }
+    }
+
+    if (window.EventSource) {
+        waitForDash();
+    }
+}());
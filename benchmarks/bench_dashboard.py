@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark end-to-end del dashboard vía ``_dash-update-component``.
+
+Usa el test client de Flask sobre ``app.server`` y las mismas peticiones que
+envía el navegador (``src/perf/dispatch.py``). Mide latencia y tamaño de
+respuesta de:
+
+  * ``tab:<id>``               render de cada tab en ``render_tab_content``
+  * ``callback:<id>:<output>`` cada callback de figura que dispara el tab
+  * ``tick:<id>``              un tick completo de los intervalos (reloj y datos) con el tab abierto
+
+Cada medición se hace en frío (cachés vacías) y en caliente (repeticiones).
+Los resultados se guardan en JSON; con ``--compare`` se contrastan contra un
+baseline y el proceso termina con código 1 si hay regresiones.
+
+Uso:
+    python benchmarks/bench_dashboard.py                          # imprime y guarda benchmarks/results.json
+    python benchmarks/bench_dashboard.py --save benchmarks/baseline.json
+    python benchmarks/bench_dashboard.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# El benchmark no debe leer ni ensuciar la caché compartida de la instancia
+os.environ.setdefault('AIFA_DISK_CACHE', '0')
+os.environ.setdefault('AIFA_WARMUP', '0')
+# Los callbacks pesados se miden en línea; con DiskcacheManager solo se mediría el encolado del job
+os.environ.setdefault('AIFA_BACKGROUND', '0')
+
+import dash  # noqa: E402
+import plotly  # noqa: E402
+
+import app as dashboard  # noqa: E402
+from src.perf import dispatch  # noqa: E402
+from src.perf.cache import response_cache  # noqa: E402
+from src.perf.memo import clear_all_caches  # noqa: E402
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results.json')
+
+
+def clear_caches():
+    response_cache.clear()
+    clear_all_caches()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def post_many(client, payloads):
+    """Envía las peticiones en serie; devuelve (segundos, bytes)"""
+    start = time.perf_counter()
+    size = 0
+    for payload in payloads:
+        response = client.post(dispatch.DISPATCH_URL, json=payload)
+        if response.status_code not in (200, 204):
+            raise RuntimeError(f"{payload['output']}: HTTP {response.status_code}")
+        size += len(response.data)
+    return time.perf_counter() - start, size
+
+
+def measure(client, payloads, repeats):
+    clear_caches()
+    cold_seconds, size = post_many(client, payloads)
+    samples = [post_many(client, payloads)[0] for _ in range(repeats)]
+    return {
+        'cold_ms': round(cold_seconds * 1000, 3),
+        'p50_ms': round(statistics.median(samples) * 1000, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000, 3),
+        'max_ms': round(max(samples) * 1000, 3),
+        'bytes': size,
+        'requests': len(payloads),
+    }
+
+
+def run(repeats):
+    client = dashboard.server.test_client()
+    client.get('/')
+    plan = dispatch.build_plan(client)
+    global_interval = [(dep, payload) for dep, payload in plan['global'] if dispatch.is_interval_driven(dep)]
+
+    results = {}
+    for tab, tab_plan in plan['tabs'].items():
+        results[f'tab:{tab}'] = measure(client, [tab_plan['layout']], repeats)
+        for dep, payload in tab_plan['callbacks']:
+            results[f"callback:{tab}:{dep['output']}"] = measure(client, [payload], repeats)
+        # Con el tab abierto el navegador ya guardó los State de la primera respuesta
+        tick = [dispatch.with_response_state(dict(payload, changedPropIds=[dispatch.interval_trigger(dep)]),
+                                             client.post(dispatch.DISPATCH_URL, json=payload))
+                for dep, payload in tab_plan['callbacks'] + global_interval if dispatch.is_interval_driven(dep)]
+        results[f'tick:{tab}'] = measure(client, tick, repeats)
+    return results
+
+
+def compare(results, baseline, tolerance, floor_ms):
+    """Lista de regresiones de latencia (p50) o tamaño respecto al baseline"""
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = max(previous['p50_ms'] * (1 + tolerance), previous['p50_ms'] + floor_ms)
+        if current['p50_ms'] > limit:
+            regressions.append(f"{name}: p50 {previous['p50_ms']:.2f} -> {current['p50_ms']:.2f} ms")
+        if current['bytes'] > previous['bytes']:
+            regressions.append(f"{name}: bytes {previous['bytes']:,} -> {current['bytes']:,}")
+    missing = sorted(set(baseline) - set(results))
+    return regressions, missing
+
+
+def print_table(results):
+    print(f"{'medición':<62}{'frío ms':>10}{'p50 ms':>9}{'p95 ms':>9}{'bytes':>10}")
+    for name, r in results.items():
+        print(f"{name:<62}{r['cold_ms']:>10.2f}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['bytes']:>10,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tabs, callbacks y ticks del dashboard")
+    parser.add_argument('--repeats', type=int, default=20, help='repeticiones en caliente (default: 20)')
+    parser.add_argument('--save', default=DEFAULT_OUTPUT, help='archivo JSON de resultados')
+    parser.add_argument('--compare', metavar='BASELINE', help='baseline JSON contra el cual comparar')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='aumento relativo de p50 tolerado (default: 0.25)')
+    parser.add_argument('--floor-ms', type=float, default=1.0,
+                        help='aumento absoluto de p50 ignorado como ruido (default: 1.0)')
+    args = parser.parse_args()
+
+    results = run(args.repeats)
+    print_table(results)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'dash': dash.__version__,
+            'plotly': plotly.__version__,
+            'machine': platform.machine(),
+            'repeats': args.repeats,
+        },
+        'results': results,
+    }
+    with open(args.save, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print(f"\nResultados guardados en {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions, missing = compare(results, baseline, args.tolerance, args.floor_ms)
+        for name in missing:
+            print(f"⚠️  {name} está en el baseline pero ya no se mide")
+        if regressions:
+            print("❌ Regresiones detectadas:")
+            for line in regressions:
+                print(f"   - {line}")
+            sys.exit(1)
+        print("✅ Sin regresiones respecto al baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga multi-sesión contra ``app:server`` levantado localmente.
+
+Para cada perfil de ``gunicorn.conf.py`` (``AIFA_GUNICORN_PROFILE``) inicia
+gunicorn en un puerto local, espera a ``/healthz/ready`` y simula N sesiones
+de navegador en paralelo. Cada sesión sigue un flujo realista:
+
+  1. carga inicial: ``/``, ``/_dash-layout``, ``/_dash-dependencies`` y los
+     callbacks del tab inicial
+  2. navegación por los nueve tabs (layout + figuras de cada tab) con tiempo
+     de lectura entre cambios
+  3. ticks de los intervalos (reloj y datos) cada ``--tick`` segundos
+  4. clicks en los filtros de rutas
+
+Reporta throughput, latencias p50/p95/p99 y tasa de error por tipo de
+petición y por perfil.
+
+Los workers corren con ``AIFA_BACKGROUND=0``: el cliente HTTP no consulta
+los jobs de ``DiskcacheManager``, así que los callbacks en segundo plano se
+ejecutan en línea y cada respuesta trae la figura completa (no solo el
+handshake del job).
+
+Uso:
+    python benchmarks/loadtest.py --sessions 20 --duration 60
+    python benchmarks/loadtest.py --profiles default gthread sync-2 --json benchmarks/load.json
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, ROOT)
+
+from src.perf import dispatch  # noqa: E402
+from src.perf.warmup import READY_URL  # noqa: E402
+
+ROUTE_FILTERS = ['route-filter-all', 'route-filter-intl', 'route-filter-dom']
+_encode = json.dumps
+
+
+class HttpResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+
+    def get_json(self):
+        return json.loads(self.data) if self.data else None
+
+
+class HttpClient:
+    """Cliente HTTP mínimo con la interfaz del test client de Flask que usa ``dispatch``"""
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def _open(self, request):
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return HttpResponse(response.status, response.read())
+        except urllib.error.HTTPError as exc:
+            return HttpResponse(exc.code, exc.read())
+
+    def get(self, path):
+        return self._open(urllib.request.Request(self.base_url + path))
+
+    def post(self, path, json=None):  # noqa: A002 - misma firma que el test client
+        body = _encode(json).encode('utf-8')
+        return self._open(urllib.request.Request(
+            self.base_url + path, data=body, headers={'Content-Type': 'application/json'}))
+
+
+class Recorder:
+    """Acumula latencias y errores por tipo de petición (thread-safe)"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def timed(self, kind, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = func(*args, **kwargs)
+            ok = response.status_code in (200, 204)
+        except (OSError, urllib.error.URLError):
+            response, ok = None, False
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.samples[kind].append(elapsed)
+            if not ok:
+                self.errors[kind] += 1
+        return response
+
+
+def route_filter_payloads(deps):
+    """Peticiones que genera un click en cada filtro de rutas"""
+    payloads = []
+    for dep in deps:
+        inputs = [i['id'] for i in dep['inputs']]
+        if set(inputs) & set(ROUTE_FILTERS):
+            for clicked in ROUTE_FILTERS:
+                overrides = {(cid, 'n_clicks'): 1 if cid == clicked else None for cid in inputs}
+                payloads.append(dispatch.build_payload(dep, changed=[f'{clicked}.n_clicks'], overrides=overrides))
+    return payloads
+
+
+def run_session(client, plan, filters, recorder, stop_at, tick_seconds, think_seconds, rng):
+    tabs = list(plan['tabs'])
+    recorder.timed('index', client.get, '/')
+    recorder.timed('layout', client.get, dispatch.LAYOUT_URL)
+    recorder.timed('dependencies', client.get, dispatch.DEPENDENCIES_URL)
+
+    responses = {}  # última respuesta por callback: de ahí salen sus State en los ticks
+
+    def open_tab(tab):
+        recorder.timed('tab', client.post, dispatch.DISPATCH_URL, json=plan['tabs'][tab]['layout'])
+        for dep, payload in plan['tabs'][tab]['callbacks']:
+            responses[dep['output']] = recorder.timed('figure', client.post, dispatch.DISPATCH_URL, json=payload)
+
+    current = tabs[0]
+    for dep, payload in plan['global']:
+        responses[dep['output']] = recorder.timed('figure', client.post, dispatch.DISPATCH_URL, json=payload)
+    open_tab(current)
+
+    n_intervals = 0
+    next_tick = time.monotonic() + tick_seconds
+    while time.monotonic() < stop_at:
+        time.sleep(min(rng.uniform(*think_seconds), max(0.0, stop_at - time.monotonic())))
+        if time.monotonic() >= stop_at:
+            break
+        if time.monotonic() >= next_tick:
+            n_intervals += 1
+            next_tick += tick_seconds
+            tick = [(dep, payload) for dep, payload in plan['global'] + plan['tabs'][current]['callbacks']
+                    if dispatch.is_interval_driven(dep)]
+            for dep, payload in tick:
+                payload = dispatch.with_response_state(
+                    dict(payload, changedPropIds=[dispatch.interval_trigger(dep)]), responses.get(dep['output']))
+                payload['inputs'] = [dict(i, value=n_intervals) if i['property'] == 'n_intervals' else i
+                                     for i in payload['inputs']]
+                recorder.timed('tick', client.post, dispatch.DISPATCH_URL, json=payload)
+        elif filters and rng.random() < 0.15:
+            recorder.timed('route-filter', client.post, dispatch.DISPATCH_URL, json=rng.choice(filters))
+        else:
+            current = tabs[(tabs.index(current) + 1) % len(tabs)]
+            open_tab(current)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize(recorder, elapsed):
+    summary = {}
+    kinds = list(recorder.samples) + ['TOTAL']
+    for kind in kinds:
+        samples = ([s for values in recorder.samples.values() for s in values]
+                   if kind == 'TOTAL' else recorder.samples[kind])
+        errors = sum(recorder.errors.values()) if kind == 'TOTAL' else recorder.errors[kind]
+        summary[kind] = {
+            'requests': len(samples),
+            'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+            'p50_ms': round(percentile(samples, 50) * 1000, 2),
+            'p95_ms': round(percentile(samples, 95) * 1000, 2),
+            'p99_ms': round(percentile(samples, 99) * 1000, 2),
+            'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        }
+    return summary
+
+
+def start_server(profile, port):
+    # En línea: sin polling del job, un callback en segundo plano solo devolvería el handshake
+    env = dict(os.environ, PORT=str(port), AIFA_GUNICORN_PROFILE=profile, AIFA_BACKGROUND='0')
+    # El log va a un archivo temporal: un PIPE sin leer puede bloquear a gunicorn
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py', 'app:server'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log)
+    client = HttpClient(f'http://127.0.0.1:{port}')
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            log.seek(0)
+            raise RuntimeError(f"gunicorn ({profile}) terminó: {log.read().decode()[-2000:]}")
+        try:
+            if client.get(READY_URL).status_code == 200:
+                return process, client
+        except OSError:
+            pass
+        time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError(f"gunicorn ({profile}) no estuvo listo en 120s")
+
+
+def run_profile(profile, args):
+    process, client = start_server(profile, args.port)
+    try:
+        plan = dispatch.build_plan(client)
+        filters = route_filter_payloads(client.get(dispatch.DEPENDENCIES_URL).get_json())
+        recorder = Recorder()
+        start = time.monotonic()
+        stop_at = start + args.duration
+        threads = []
+        for i in range(args.sessions):
+            rng = random.Random(args.seed + i)
+            thread = threading.Thread(
+                target=run_session,
+                args=(HttpClient(client.base_url), plan, filters, recorder, stop_at,
+                      args.tick, (args.think_min, args.think_max), rng),
+                daemon=True)
+            threads.append(thread)
+            thread.start()
+            time.sleep(args.ramp_up / max(1, args.sessions))
+        for thread in threads:
+            thread.join()
+        return summarize(recorder, time.monotonic() - start)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def print_summary(profile, summary):
+    print(f"\n=== Perfil {profile} ===")
+    print(f"{'tipo':<16}{'peticiones':>11}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errores':>9}")
+    for kind, s in summary.items():
+        print(f"{kind:<16}{s['requests']:>11}{s['throughput_rps']:>9.1f}{s['p50_ms']:>9.1f}"
+              f"{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['error_rate']:>9.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga multi-sesión del dashboard")
+    parser.add_argument('--profiles', nargs='+', default=['default'],
+                        help='perfiles de gunicorn.conf.py (default: default)')
+    parser.add_argument('--sessions', type=int, default=10, help='sesiones simultáneas (default: 10)')
+    parser.add_argument('--duration', type=float, default=60, help='segundos por perfil (default: 60)')
+    parser.add_argument('--tick', type=float, default=30, help='segundos entre ticks del intervalo (default: 30)')
+    parser.add_argument('--think-min', type=float, default=2.0, help='tiempo de lectura mínimo (s)')
+    parser.add_argument('--think-max', type=float, default=6.0, help='tiempo de lectura máximo (s)')
+    parser.add_argument('--ramp-up', type=float, default=5.0, help='segundos para arrancar todas las sesiones')
+    parser.add_argument('--port', type=int, default=8765, help='puerto local (default: 8765)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', metavar='ARCHIVO', help='guardar resultados en JSON')
+    args = parser.parse_args()
+
+    results = {}
+    for profile in args.profiles:
+        results[profile] = run_profile(profile, args)
+        print_summary(profile, results[profile])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'config': vars(args), 'profiles': results}, f, indent=2)
+            f.write('\n')
+        print(f"\nResultados guardados en {args.json}")
+
+
+if __name__ == '__main__':
+    main()
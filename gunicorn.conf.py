@@ -1,10 +1,50 @@
 import os
 
+# Perfiles de despliegue seleccionables con AIFA_GUNICORN_PROFILE.
+# "default" conserva la configuración de producción original.
+PROFILES = {
+    'default': {'workers': 1, 'worker_class': 'sync', 'threads': 1},
+    'sync-2': {'workers': 2, 'worker_class': 'sync', 'threads': 1},
+    'sync-4': {'workers': 4, 'worker_class': 'sync', 'threads': 1},
+    'gthread': {'workers': 1, 'worker_class': 'gthread', 'threads': 4},
+    'gthread-2': {'workers': 2, 'worker_class': 'gthread', 'threads': 4},
+    # Canal de eventos (src/perf/push.py): cada pestaña conectada ocupa un hilo
+    'gthread-push': {'workers': 1, 'worker_class': 'gthread', 'threads': 32},
+}
+profile = PROFILES[os.environ.get('AIFA_GUNICORN_PROFILE', 'default')]
+# Capacidad por worker para el intervalo de polling adaptativo (src/perf/polling.py)
+os.environ.setdefault('AIFA_WORKER_THREADS', str(profile['threads']))
+
+# Con workers sync una conexión de eventos bloquearía el worker; con hilos se
+# activa el canal y se reservan 4 hilos por worker para los callbacks
+if profile['worker_class'] == 'gthread':
+    os.environ.setdefault('AIFA_PUSH', '1')
+    os.environ.setdefault('AIFA_PUSH_MAX_CLIENTS', str(max(1, profile['threads'] - 4)))
+
 bind = f"0.0.0.0:{os.environ.get('PORT', 8050)}"
-workers = 1
-worker_class = "sync"
+workers = profile['workers']
+worker_class = profile['worker_class']
+threads = profile['threads']
 timeout = 120
 keepalive = 2
 max_requests = 1000
 max_requests_jitter = 100
-preload_app = True
\ No newline at end of file
+preload_app = True
+
+
+def when_ready(server):
+    """Pre-calienta tabs y figuras en el master; los workers heredan la caché al hacer fork"""
+    from src.perf import warmup
+    if warmup.warmup_enabled() and preload_app:
+        import app
+        state = warmup.warm_up(app.app)
+        server.log.info("Warm-up %s en %ss (%s peticiones)",
+                        state['status'], state['duration_seconds'], state['requests'])
+
+
+def post_worker_init(worker):
+    """Sin preload (o si el master no calentó) cada worker calienta antes de aceptar tráfico"""
+    from src.perf import warmup
+    if warmup.warmup_enabled() and not warmup.is_ready():
+        import app
+        warmup.warm_up(app.app)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Exporta una instantánea estática del dashboard para pantallas de solo lectura.
+
+Pide a la app (con el test client de Flask, sin servidor) el layout, cada tab
+y los callbacks que dispara al abrirse, con el mismo plan de peticiones que
+el navegador (``src.perf.dispatch``), y escribe un bundle que cualquier
+servidor de archivos puede servir, sin un proceso de Python:
+
+    <out>/index.html               página de la instantánea
+    <out>/snapshot.js              renderer de los árboles de componentes
+    <out>/plotly.min.js            bundle de Plotly, compartido por todas las figuras
+    <out>/assets/                  CSS, imágenes y callbacks del cliente de assets/
+    <out>/data/layout.json         header, barra de tabs y callbacks del cliente
+    <out>/data/tabs/<tab>.json     contenido del tab y salidas de sus callbacks
+    <out>/vendor/                  tema de Bootstrap y fuentes, copiados de su CDN
+
+El bundle no pide nada a internet: el tema de ``dbc``, las fuentes que
+``assets/style.css`` importa de Google Fonts y los íconos de ``DashIconify``
+se descargan al exportar (con caché en ``--vendor-cache``, así las
+siguientes exportaciones no necesitan red) y las referencias se reescriben a
+las copias locales. Los íconos van como SVG en ``data/layout.json``. Si una
+descarga falla, la referencia queda remota y la exportación termina con error.
+
+Las figuras que la app deriva en el navegador (``clientside_callback`` sobre
+los datasets versionados) se derivan igual en la instantánea, con las mismas
+funciones de ``assets/datasets.js``.
+
+El tab Sistema (telemetría del proceso en vivo, con login) no se exporta.
+
+Uso:
+    python scripts/export_static.py                          # escribe dist/static
+    python scripts/export_static.py --out /srv/sala --tabs strategic financial
+    cd dist/static && python -m http.server                  # vista previa
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import string
+import sys
+import urllib.request
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlsplit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# Los callbacks en segundo plano corren en línea y el warm-up no hace falta:
+# la exportación ya renderiza cada tab una vez
+os.environ.setdefault('AIFA_BACKGROUND', '0')
+os.environ.setdefault('AIFA_WARMUP', '0')
+
+import plotly  # noqa: E402
+
+import app as dashboard  # noqa: E402
+from src.perf.dispatch import (  # noqa: E402
+    DEPENDENCIES_URL, DISPATCH_URL, LAYOUT_URL, TABS_ID, build_payload, build_plan, output_specs,
+)
+
+TITLE = 'Centro de Operaciones AIFA - Dashboard Ejecutivo'
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static_snapshot')
+PLOTLY_BUNDLE = os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+ICONIFY_API = 'https://api.iconify.design'
+# Google Fonts solo sirve woff2 a navegadores que lo declaran
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+CSS_URL = re.compile(r"""url\((['"]?)(https?://[^'")]+)\1\)""")
+EXCLUDED_TABS = ('sistema',)
+ASSET_EXTENSIONS = ('.css', '.jpg', '.jpeg', '.png', '.svg', '.ico', '.html')
+# Los demás .js de assets/ son para el renderer de Dash (p. ej. el canal de eventos)
+CLIENTSIDE_SCRIPTS = ('datasets.js',)
+
+
+def dispatch(client, payload, failures):
+    """Salidas de un callback como ``{id: {propiedad: valor}}``"""
+    response = client.post(DISPATCH_URL, json=payload)
+    if response.status_code == 204:
+        return {}
+    if response.status_code != 200:
+        failures.append(f"{payload['output']}: HTTP {response.status_code}")
+        return {}
+    return response.get_json().get('response', {})
+
+
+def merge_props(target, outputs):
+    for component_id, props in outputs.items():
+        target.setdefault(component_id, {}).update(props)
+    return target
+
+
+def uses_active_tab(dep):
+    return any((i['id'], i['property']) == (TABS_ID, 'active_tab') for i in dep['inputs'])
+
+
+def export_tab(client, plan, tab, failures):
+    tab_plan = plan['tabs'][tab]
+    outputs = dispatch(client, tab_plan['layout'], failures)
+    tree = outputs.pop('tab-content', {}).get('children')
+    props = {}
+    for _, payload in tab_plan['callbacks']:
+        merge_props(props, dispatch(client, payload, failures))
+    # Callbacks del header que dependen del tab abierto (p. ej. los datasets versionados)
+    for dep, _ in plan['global']:
+        if uses_active_tab(dep):
+            merge_props(props, dispatch(client, build_payload(dep, tab=tab), failures))
+    return {'layout': tree, 'props': props}
+
+
+def clientside_callbacks(client):
+    """Callbacks del cliente en el formato que ejecuta ``snapshot.js``"""
+    return [{
+        'function': [dep['clientside_function']['namespace'], dep['clientside_function']['function_name']],
+        'inputs': [[item['id'], item['property']] for item in dep['inputs'] + dep['state']],
+        'outputs': output_specs(dep),
+        'multi': dep['output'].startswith('..'),
+    } for dep in client.get(DEPENDENCIES_URL).get_json() if dep.get('clientside_function')]
+
+
+class Vendor:
+    """Descarga recursos remotos a ``<out>/vendor``, con caché entre exportaciones"""
+
+    def __init__(self, out, cache_dir, failures):
+        self.out = out
+        self.cache_dir = cache_dir
+        self.failures = failures
+
+    def fetch(self, url):
+        """Contenido de ``url``; None (y un error en ``failures``) si no se pudo descargar"""
+        cached = os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest()[:24])
+        if os.path.exists(cached):
+            with open(cached, 'rb') as f:
+                return f.read()
+        try:
+            request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                content = response.read()
+        except OSError as exc:
+            self.failures.append(f"vendor {url}: {exc}")
+            return None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(cached, 'wb') as f:
+            f.write(content)
+        return content
+
+    def save(self, url, content, suffix=''):
+        """Escribe ``content`` en ``vendor/`` y devuelve su nombre de archivo"""
+        base = os.path.basename(urlsplit(url).path) or 'resource'
+        name = f"{hashlib.sha256(url.encode()).hexdigest()[:8]}-{base}{suffix}"
+        os.makedirs(os.path.join(self.out, 'vendor'), exist_ok=True)
+        with open(os.path.join(self.out, 'vendor', name), 'wb') as f:
+            f.write(content)
+        return name
+
+    def stylesheet(self, url):
+        """Copia local de una hoja de estilos remota (y de lo que importa); None si falló"""
+        content = self.fetch(url)
+        if content is None:
+            return None
+        css = self.localize_css(content.decode('utf-8'), '', base_url=url)
+        return self.save(url, css.encode('utf-8'), '' if url.endswith('.css') else '.css')
+
+    def localize_css(self, css, prefix, base_url=None):
+        """Reescribe los ``url(...)`` remotos de ``css`` a copias en ``vendor/`` (``prefix`` lleva hasta ahí)"""
+        def replace(match):
+            url = urljoin(base_url, match.group(2)) if base_url else match.group(2)
+            if css[:match.start()].rstrip().endswith('@import'):
+                name = self.stylesheet(url)
+            else:
+                content = self.fetch(url)
+                name = None if content is None else self.save(url, content)
+            return match.group(0) if name is None else f"url('{prefix}{name}')"
+        return CSS_URL.sub(replace, css)
+
+    def icons(self, names):
+        """``{'prefijo:nombre': {body, width, height, ...}}`` de la API de Iconify"""
+        by_prefix = {}
+        for name in sorted(names):
+            prefix, _, icon = name.partition(':')
+            by_prefix.setdefault(prefix, []).append(icon)
+        icons = {}
+        for prefix, wanted in by_prefix.items():
+            content = self.fetch(f"{ICONIFY_API}/{prefix}.json?icons={','.join(wanted)}")
+            if content is not None:
+                icons.update(iconify_icons(json.loads(content), wanted))
+        return icons
+
+
+def iconify_icons(collection, wanted):
+    """Íconos de una colección de Iconify con sus alias resueltos y las dimensiones por defecto"""
+    defaults = {key: collection[key] for key in ('left', 'top', 'width', 'height') if key in collection}
+    icons, aliases = collection.get('icons', {}), collection.get('aliases', {})
+    result = {}
+    for name in wanted:
+        chain = [name]
+        while chain[-1] not in icons and chain[-1] in aliases and len(chain) < 8:
+            chain.append(aliases[chain[-1]]['parent'])
+        if chain[-1] not in icons:
+            continue
+        data = {'width': 16, 'height': 16, **defaults, **icons[chain[-1]]}
+        for alias in reversed(chain[:-1]):
+            data.update({k: v for k, v in aliases[alias].items() if k != 'parent'})
+        result[f"{collection['prefix']}:{name}"] = data
+    return result
+
+
+def iconify_names(node, found=None):
+    """Íconos de ``DashIconify`` usados en un árbol de componentes (o en sus props)"""
+    found = set() if found is None else found
+    if isinstance(node, dict):
+        if node.get('namespace') == 'dash_iconify' and isinstance(node.get('props', {}).get('icon'), str):
+            found.add(node['props']['icon'])
+        for value in node.values():
+            iconify_names(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            iconify_names(value, found)
+    return found
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    return os.path.getsize(path)
+
+
+def copy_static(out, vendor):
+    shutil.copyfile(PLOTLY_BUNDLE, os.path.join(out, 'plotly.min.js'))
+    shutil.copyfile(os.path.join(TEMPLATE_DIR, 'snapshot.js'), os.path.join(out, 'snapshot.js'))
+    assets_src = os.path.join(ROOT, 'assets')
+    assets_out = os.path.join(out, 'assets')
+    os.makedirs(assets_out, exist_ok=True)
+    for name in sorted(os.listdir(assets_src)):
+        if name.lower().endswith('.css'):
+            # Los @import y url() remotos (p. ej. Google Fonts) apuntan a vendor/
+            with open(os.path.join(assets_src, name), encoding='utf-8') as f:
+                css = vendor.localize_css(f.read(), '../vendor/')
+            with open(os.path.join(assets_out, name), 'w', encoding='utf-8') as f:
+                f.write(css)
+        elif name.lower().endswith(ASSET_EXTENSIONS) or name in CLIENTSIDE_SCRIPTS:
+            shutil.copyfile(os.path.join(assets_src, name), os.path.join(assets_out, name))
+
+
+def write_index(out, generated_at, vendor):
+    with open(os.path.join(TEMPLATE_DIR, 'index.html'), encoding='utf-8') as f:
+        template = string.Template(f.read())
+    stylesheets = []
+    for href in dashboard.app.config.external_stylesheets:
+        name = vendor.stylesheet(href)
+        stylesheets.append(href if name is None else f'vendor/{name}')
+    stylesheets.append('assets/style.css')
+    html = template.substitute(
+        title=TITLE,
+        stylesheets='\n'.join(f'    <link rel="stylesheet" href="{href}">' for href in stylesheets),
+        scripts='\n'.join(f'    <script src="assets/{name}"></script>' for name in CLIENTSIDE_SCRIPTS),
+        generated_at=generated_at,
+    )
+    with open(os.path.join(out, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default=os.path.join(ROOT, 'dist', 'static'),
+                        help='directorio del bundle (default: dist/static)')
+    parser.add_argument('--tabs', nargs='+', metavar='TAB',
+                        help='tabs a exportar (default: todos los del modo actual salvo Sistema)')
+    parser.add_argument('--vendor-cache', default=os.path.join(ROOT, 'dist', 'vendor-cache'),
+                        help='caché de los recursos descargados de CDN (default: dist/vendor-cache)')
+    args = parser.parse_args()
+
+    client = dashboard.server.test_client()
+    plan = build_plan(client)
+    tabs = [tab for tab in plan['tabs'] if tab not in EXCLUDED_TABS and (not args.tabs or tab in args.tabs)]
+    if not tabs:
+        parser.error(f"ningún tab exportable; disponibles: {', '.join(plan['tabs'])}")
+
+    failures = []
+    generated_at = datetime.now(timezone.utc).astimezone().strftime('%d/%m/%Y %H:%M:%S %Z')
+    layout = client.get(LAYOUT_URL).get_json()
+    header_props = {}
+    for _, payload in plan['global']:
+        merge_props(header_props, dispatch(client, payload, failures))
+
+    os.makedirs(args.out, exist_ok=True)
+    vendor = Vendor(args.out, args.vendor_cache, failures)
+    exported = {tab: export_tab(client, plan, tab, failures) for tab in tabs}
+    sizes = {'layout': write_json(os.path.join(args.out, 'data', 'layout.json'), {
+        'layout': layout,
+        'props': header_props,
+        'tabs': tabs,
+        'active_tab': tabs[0],
+        'clientside': clientside_callbacks(client),
+        'icons': vendor.icons(iconify_names([layout, header_props, list(exported.values())])),
+        'generated_at': generated_at,
+    })}
+    for tab, data in exported.items():
+        sizes[tab] = write_json(os.path.join(args.out, 'data', 'tabs', f'{tab}.json'), data)
+    copy_static(args.out, vendor)
+    write_index(args.out, generated_at, vendor)
+
+    print(f"Instantánea escrita en {os.path.abspath(args.out)} ({generated_at})")
+    print(f"{'datos':<16}{'tamaño (B)':>14}")
+    for name, size in sizes.items():
+        print(f"{name:<16}{size:>14,}")
+    print(f"{'plotly.min.js':<16}{os.path.getsize(PLOTLY_BUNDLE):>14,}")
+    for failure in failures:
+        print(f"Error: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Extrae los estilos inline repetidos de app.py y src/tabs/ a clases CSS generadas.
+
+Renderiza todos los tabs (más el contenido protegido de Metodología y el
+panel de destinos del tab geográfico, que llegan por sus callbacks) sin el
+registro de clases, cuenta los dicts ``style={...}`` que aparecen al menos
+``--min-count`` veces, escribe sus clases ``sx-<hash>`` en el bloque
+generado de ``assets/style.css`` y reporta el tamaño JSON de cada tab
+antes y después.
+
+Uso:
+    python scripts/extract_styles.py            # regenera el bloque CSS
+    python scripts/extract_styles.py --check    # no escribe; sale con 1 si el bloque está desactualizado
+"""
+
+import argparse
+import difflib
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Cada render debe construirse con el registro de clases del momento: sin caché
+# en disco (compartida con la instancia) ni warm-up, y en línea
+os.environ['AIFA_DISK_CACHE'] = '0'
+os.environ.setdefault('AIFA_WARMUP', '0')
+os.environ.setdefault('AIFA_BACKGROUND', '0')
+
+from plotly.io.json import to_json_plotly  # noqa: E402
+
+import app as dashboard  # noqa: E402
+from src.perf import styles  # noqa: E402
+from src.perf.cache import bypass_cache, response_cache  # noqa: E402
+from src.perf.memo import clear_all_caches  # noqa: E402
+
+PROTECTED_CONTENT = 'metodologia (protegido)'
+TOP_DESTINATIONS = 'geographic (destinos)'
+
+
+def tab_ids():
+    return [tab.tab_id for tab in dashboard.app.layout['tabs'].children]
+
+
+def render_all():
+    """Renderiza cada tab tal como lo entrega el callback ``render_tab_content``, sin ``cached_output``"""
+    clear_all_caches()
+    response_cache.clear()
+    token = bypass_cache.set(True)
+    try:
+        trees = {tab_id: dashboard.render_tab_content(tab_id) for tab_id in tab_ids()}
+    finally:
+        bypass_cache.reset(token)
+    trees[PROTECTED_CONTENT] = styles.apply_style_classes(dashboard.load_tab('metodologia').render_protected_methodology_content())
+    trees[TOP_DESTINATIONS] = styles.apply_style_classes(dashboard.load_tab('geographic').render_top_destinations())
+    return trees
+
+
+def payload_sizes(trees):
+    return {name: len(to_json_plotly(tree).encode('utf-8')) for name, tree in trees.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--min-count', type=int, default=2,
+                        help='apariciones mínimas para extraer un estilo (default: 2)')
+    parser.add_argument('--check', action='store_true',
+                        help='no modificar assets/style.css; falla si su bloque generado difiere')
+    args = parser.parse_args()
+
+    styles.set_enabled(False)
+    trees = render_all()
+    before = payload_sizes(trees)
+
+    counter = {}
+    for tree in trees.values():
+        styles.collect_styles(tree, counter)
+    recurring = sorted(sig for sig, count in counter.items() if count >= args.min_count)
+
+    rules = [styles.style_to_css(styles.json.loads(sig)) for sig in recurring]
+    drift = []
+    if args.check:
+        _, current = styles.read_generated_block()
+        drift = list(difflib.unified_diff(current.splitlines(), styles.generated_block(rules).splitlines(),
+                                          'assets/style.css', 'generado', lineterm=''))
+    else:
+        styles.write_generated_block(rules)
+
+    styles.set_enabled(True)
+    after = payload_sizes(render_all())
+
+    print(f"Estilos inline distintos: {len(counter)} | extraídos (>= {args.min_count} usos): {len(recurring)}")
+    print(f"{'tab':<26}{'antes (B)':>12}{'después (B)':>14}{'ahorro':>9}")
+    for name in before:
+        saved = 1 - after[name] / before[name] if before[name] else 0
+        print(f"{name:<26}{before[name]:>12,}{after[name]:>14,}{saved:>9.1%}")
+    total_before, total_after = sum(before.values()), sum(after.values())
+    print(f"{'TOTAL':<26}{total_before:>12,}{total_after:>14,}{1 - total_after / total_before:>9.1%}")
+    if args.check:
+        print("(--check: assets/style.css no fue modificado; 'después' refleja el bloque actual)")
+        if drift:
+            print("\n".join(drift))
+            print("❌ El bloque generado de assets/style.css está desactualizado: "
+                  "ejecuta python scripts/extract_styles.py", file=sys.stderr)
+            return 1
+        print("✅ El bloque generado de assets/style.css está al día")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,369 @@
+/*
+ * Renderer de la instantánea estática del dashboard (scripts/export_static.py).
+ *
+ * Dibuja los árboles de componentes que Dash serializa ({type, namespace,
+ * props}) con el DOM y Plotly, sin servidor: data/layout.json trae el header
+ * y los tabs, data/tabs/<tab>.json el contenido de cada tab y, en ``props``,
+ * las salidas de sus callbacks por id de componente (figuras, textos). Los
+ * callbacks del cliente de la app (``assets/datasets.js``) se ejecutan sobre
+ * esas salidas antes de dibujar, como lo haría Dash.
+ *
+ * Parámetros de la URL: ``?tab=<id>`` abre ese tab y ``?rotate=<segundos>``
+ * rota los tabs automáticamente (pantallas de sala).
+ */
+(function () {
+    'use strict';
+
+    var SKIPPED_PROPS = {
+        children: 1, className: 1, style: 1, id: 1, key: 1,
+        n_clicks: 1, n_clicks_timestamp: 1, disable_n_clicks: 1, loading_state: 1
+    };
+    var ATTRIBUTES = {colSpan: 'colspan', rowSpan: 'rowspan', htmlFor: 'for', tabIndex: 'tabindex'};
+    var THEME_COLORS = ['primary', 'secondary', 'success', 'danger', 'warning', 'info', 'light', 'dark'];
+
+    var cache = {};
+    var state = {tabs: [], active: null, content: null, header: null, clientside: [], globalProps: {}, icons: {}};
+
+    window.dash_clientside = window.dash_clientside || {};
+    window.dash_clientside.no_update = window.dash_clientside.no_update || {};
+
+    function asset(url) {
+        return typeof url === 'string' && url.indexOf('/assets/') === 0 ? url.slice(1) : url;
+    }
+
+    function classes() {
+        return Array.prototype.filter.call(arguments, Boolean).join(' ');
+    }
+
+    function element(tag, props, className) {
+        var el = document.createElement(tag);
+        if (props.id) {
+            el.id = props.id;
+        }
+        var cls = classes(className, props.className);
+        if (cls) {
+            el.className = cls;
+        }
+        if (props.style) {
+            Object.assign(el.style, props.style);
+        }
+        return el;
+    }
+
+    function themeClass(prefix, color) {
+        return THEME_COLORS.indexOf(color) >= 0 ? prefix + color : null;
+    }
+
+    function appendChildren(el, children, ctx) {
+        if (children === null || children === undefined) {
+            return el;
+        }
+        (Array.isArray(children) ? children : [children]).forEach(function (child) {
+            var node = render(child, ctx);
+            if (node) {
+                el.appendChild(node);
+            }
+        });
+        return el;
+    }
+
+    function renderHtml(type, props, ctx) {
+        var el = element(type.toLowerCase(), props);
+        Object.keys(props).forEach(function (key) {
+            var value = props[key];
+            if (SKIPPED_PROPS[key] || (typeof value !== 'string' && typeof value !== 'number')) {
+                return;
+            }
+            el.setAttribute(ATTRIBUTES[key] || key, key === 'src' || key === 'href' ? asset(value) : value);
+        });
+        return appendChildren(el, props.children, ctx);
+    }
+
+    function columnClasses(props) {
+        var result = [];
+        [['width', ''], ['xs', ''], ['sm', '-sm'], ['md', '-md'], ['lg', '-lg'], ['xl', '-xl'], ['xxl', '-xxl']]
+            .forEach(function (pair) {
+                var spec = props[pair[0]];
+                if (spec === null || spec === undefined) {
+                    return;
+                }
+                var size = typeof spec === 'object' ? spec.size : spec;
+                if (size !== null && size !== undefined) {
+                    result.push(size === true ? 'col' + pair[1] : 'col' + pair[1] + '-' + size);
+                }
+                if (typeof spec === 'object' && spec.offset !== undefined) {
+                    result.push('offset' + pair[1] + '-' + spec.offset);
+                }
+            });
+        return result.length ? result.join(' ') : 'col';
+    }
+
+    function progressBar(props) {
+        var max = props.max || 100;
+        var bar = element('div', {}, classes('progress-bar', themeClass('bg-', props.color),
+                                             props.striped && 'progress-bar-striped'));
+        bar.style.width = Math.max(0, Math.min(100, 100 * (props.value || 0) / max)) + '%';
+        if (props.label) {
+            bar.textContent = props.label;
+        }
+        return bar;
+    }
+
+    var BOOTSTRAP = {
+        Row: function (props, ctx) {
+            var el = element('div', props, classes('row', props.justify && 'justify-content-' + props.justify,
+                                                   props.align && 'align-items-' + props.align));
+            return appendChildren(el, props.children, ctx);
+        },
+        Col: function (props, ctx) {
+            return appendChildren(element('div', props, columnClasses(props)), props.children, ctx);
+        },
+        Card: function (props, ctx) {
+            return appendChildren(element('div', props, 'card'), props.children, ctx);
+        },
+        CardBody: function (props, ctx) {
+            return appendChildren(element('div', props, 'card-body'), props.children, ctx);
+        },
+        CardHeader: function (props, ctx) {
+            return appendChildren(element('div', props, 'card-header'), props.children, ctx);
+        },
+        CardFooter: function (props, ctx) {
+            return appendChildren(element('div', props, 'card-footer'), props.children, ctx);
+        },
+        Badge: function (props, ctx) {
+            var el = element('span', props, classes('badge', themeClass('bg-', props.color || 'primary'),
+                                                    props.pill && 'rounded-pill'));
+            if (props.color && !themeClass('bg-', props.color)) {
+                el.style.backgroundColor = props.color;
+            }
+            return appendChildren(el, props.children, ctx);
+        },
+        Button: function (props, ctx) {
+            var color = props.color || 'primary';
+            var el = element('button', props, classes('btn', (props.outline ? 'btn-outline-' : 'btn-') + color,
+                                                      props.size && 'btn-' + props.size));
+            el.type = 'button';
+            el.disabled = true;
+            return appendChildren(el, props.children, ctx);
+        },
+        Input: function (props) {
+            var el = element('input', props, 'form-control');
+            el.type = props.type || 'text';
+            el.placeholder = props.placeholder || '';
+            el.disabled = true;
+            return el;
+        },
+        Label: function (props, ctx) {
+            return appendChildren(element('label', props, 'form-label'), props.children, ctx);
+        },
+        Progress: function (props, ctx) {
+            if (props.bar) {
+                return progressBar(props);
+            }
+            var el = element('div', props, 'progress');
+            if (props.children) {
+                return appendChildren(el, props.children, ctx);
+            }
+            el.appendChild(progressBar(props));
+            return el;
+        },
+        Table: function (props, ctx) {
+            var el = element('table', props, classes('table', props.striped && 'table-striped',
+                                                     props.hover && 'table-hover', props.bordered && 'table-bordered',
+                                                     props.dark && 'table-dark', props.size && 'table-' + props.size));
+            return appendChildren(el, props.children, ctx);
+        },
+        Modal: function (props, ctx) {
+            return props.is_open ? appendChildren(element('div', props, 'modal-content'), props.children, ctx) : null;
+        },
+        Tabs: function (props) {
+            var nav = element('ul', props, 'nav nav-tabs');
+            state.header = {};
+            (props.children || []).forEach(function (tab) {
+                var tabProps = tab.props;
+                if (state.tabs.indexOf(tabProps.tab_id) < 0) {
+                    return;
+                }
+                var item = document.createElement('li');
+                var link = document.createElement('a');
+                item.className = 'nav-item';
+                link.className = 'nav-link';
+                link.href = '?tab=' + encodeURIComponent(tabProps.tab_id);
+                link.textContent = tabProps.label;
+                link.addEventListener('click', function (event) {
+                    event.preventDefault();
+                    showTab(tabProps.tab_id);
+                });
+                item.appendChild(link);
+                nav.appendChild(item);
+                state.header[tabProps.tab_id] = {link: link, props: tabProps};
+            });
+            return nav;
+        }
+    };
+
+    var CORE = {
+        Graph: function (props, ctx) {
+            var el = element('div', props);
+            ctx.graphs.push({el: el, figure: props.figure || {}, config: props.config || {}});
+            return el;
+        },
+        Markdown: function (props) {
+            var el = element('div', props);
+            el.textContent = [].concat(props.children || []).join('\n');
+            return el;
+        }
+    };
+
+    var ICONIFY = {
+        // SVG de data/layout.json (``icons``): el bundle no consulta la API de Iconify
+        DashIconify: function (props) {
+            var el = element('span', props, 'snapshot-icon');
+            var icon = state.icons[props.icon];
+            if (!icon) {
+                return el;
+            }
+            var ratio = icon.width / icon.height;
+            var height = props.height || (props.width ? props.width / ratio : '1em');
+            var width = props.width || (props.height ? props.height * ratio : '1em');
+            var transforms = [];
+            var rotate = parseFloat(props.rotate || 0) + (icon.rotate || 0) * 90;
+            if (rotate) {
+                transforms.push('rotate(' + rotate + 'deg)');
+            }
+            var flip = props.flip || '';
+            var hFlip = (flip.indexOf('horizontal') >= 0) !== Boolean(icon.hFlip);
+            var vFlip = (flip.indexOf('vertical') >= 0) !== Boolean(icon.vFlip);
+            if (hFlip || vFlip) {
+                transforms.push('scale(' + (hFlip ? -1 : 1) + ',' + (vFlip ? -1 : 1) + ')');
+            }
+            el.innerHTML = '<svg xmlns="http://www.w3.org/2000/svg" width="' + width + '" height="' + height +
+                '" viewBox="' + [icon.left || 0, icon.top || 0, icon.width, icon.height].join(' ') +
+                '" style="vertical-align:-0.125em' + (transforms.length ? ';transform:' + transforms.join(' ') : '') +
+                '">' + icon.body + '</svg>';
+            return el;
+        }
+    };
+
+    var LIBRARIES = {
+        dash_bootstrap_components: BOOTSTRAP,
+        dash_core_components: CORE,
+        dash_iconify: ICONIFY
+    };
+
+    function render(node, ctx) {
+        if (node === null || node === undefined || node === false) {
+            return null;
+        }
+        if (typeof node !== 'object') {
+            return document.createTextNode(String(node));
+        }
+        if (Array.isArray(node)) {
+            return appendChildren(document.createDocumentFragment(), node, ctx);
+        }
+        var props = Object.assign({}, node.props, ctx.props[node.props && node.props.id]);
+        if (node.namespace === 'dash_html_components') {
+            return renderHtml(node.type, props, ctx);
+        }
+        var renderer = (LIBRARIES[node.namespace] || {})[node.type];
+        if (renderer) {
+            return renderer(props, ctx);
+        }
+        // Componentes sin representación estática (Interval, Store, ...)
+        if (node.namespace === 'dash_core_components') {
+            return null;
+        }
+        return appendChildren(element('div', props), props.children, ctx);
+    }
+
+    function runClientside(props) {
+        var clientside = window.dash_clientside;
+        state.clientside.forEach(function (callback) {
+            var func = (clientside[callback.function[0]] || {})[callback.function[1]];
+            var args = callback.inputs.map(function (input) {
+                return (props[input[0]] || state.globalProps[input[0]] || {})[input[1]];
+            });
+            if (!func || args.indexOf(undefined) >= 0) {
+                return;
+            }
+            var result = func.apply(null, args);
+            var values = callback.multi ? result : [result];
+            callback.outputs.forEach(function (output, i) {
+                if (values[i] !== undefined && values[i] !== clientside.no_update) {
+                    var update = {};
+                    update[output[1]] = values[i];
+                    props[output[0]] = Object.assign({}, props[output[0]], update);
+                }
+            });
+        });
+        return props;
+    }
+
+    function mount(container, tree, props) {
+        var ctx = {props: runClientside(props || {}), graphs: []};
+        Array.prototype.forEach.call(container.querySelectorAll('.js-plotly-plot'), function (el) {
+            window.Plotly.purge(el);
+        });
+        container.replaceChildren(render(tree, ctx) || '');
+        ctx.graphs.forEach(function (graph) {
+            var figure = graph.figure;
+            var config = Object.assign({responsive: true, displaylogo: false}, graph.config);
+            window.Plotly.newPlot(graph.el, figure.data || [], figure.layout || {}, config);
+        });
+    }
+
+    function load(url) {
+        if (!cache[url]) {
+            cache[url] = fetch(url).then(function (response) {
+                if (!response.ok) {
+                    throw new Error(url + ': ' + response.status);
+                }
+                return response.json();
+            });
+        }
+        return cache[url];
+    }
+
+    function showTab(tabId) {
+        state.active = tabId;
+        Object.keys(state.header).forEach(function (id) {
+            var entry = state.header[id];
+            var active = id === tabId;
+            entry.link.classList.toggle('active', active);
+            entry.link.removeAttribute('style');
+            Object.assign(entry.link.style, entry.props.label_style || {},
+                          active ? entry.props.active_label_style || {} : {});
+        });
+        return load('data/tabs/' + tabId + '.json').then(function (data) {
+            if (state.active === tabId) {
+                mount(state.content, data.layout, data.props);
+            }
+        });
+    }
+
+    function start() {
+        var params = new URLSearchParams(window.location.search);
+        load('data/layout.json').then(function (data) {
+            var root = document.getElementById('snapshot-root');
+            state.tabs = data.tabs;
+            state.clientside = data.clientside || [];
+            state.icons = data.icons || {};
+            state.globalProps = data.props;
+            mount(root, data.layout, data.props);
+            state.content = document.getElementById('tab-content');
+            var initial = data.tabs.indexOf(params.get('tab')) >= 0 ? params.get('tab') : data.active_tab;
+            showTab(initial);
+
+            var rotate = parseFloat(params.get('rotate'));
+            if (rotate > 0) {
+                window.setInterval(function () {
+                    showTab(data.tabs[(data.tabs.indexOf(state.active) + 1) % data.tabs.length]);
+                }, rotate * 1000);
+            }
+        }).catch(function (error) {
+            document.getElementById('snapshot-root').textContent = 'No se pudo cargar la instantánea: ' + error;
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', start);
+}());
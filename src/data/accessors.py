@@ -0,0 +1,165 @@
+"""
+Accesores de datos con caché y TTL explícito por fuente.
+
+Los accesores ``get_*`` de cada tab (``src/tabs/<tab>.py``) se declaran con
+``ttl_cached``; los de este módulo sirven a los layouts de ``src/layouts``. Cada fuente se genera la primera vez que se pide y se reutiliza hasta que
+vence su TTL; entonces se regenera en la siguiente llamada (una sola vez,
+aunque la pidan varios hilos). Al cargarse registra su huella con
+``set_data_fingerprint``: si los datos cambiaron cambia ``data_version`` y
+las cachés de respuestas y disco dejan de servir figuras viejas, sin
+reiniciar el worker.
+
+Cada llamada a un accesor queda anotada en ``track_reads``: ``cached_output``
+la usa para saber qué fuentes leyó una respuesta y construir su llave solo
+con las huellas de esas fuentes (``sources_version``).
+
+El TTL de cada fuente se puede ajustar con ``AIFA_DATA_TTL_<FUENTE>`` en
+segundos (p. ej. ``AIFA_DATA_TTL_KPI=60``); ``0`` recarga en cada llamada.
+Importar este módulo, o un tab que lo use, no genera ni carga nada.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from .version import set_data_fingerprint
+
+_accessors = []
+_by_source = {}
+# Fuentes leídas en el bloque ``track_reads`` en curso (None fuera de uno)
+_reads = contextvars.ContextVar('aifa_data_reads', default=None)
+
+
+def fingerprint(value):
+    """Huella corta del contenido de un DataFrame, una tabla columnar o datos serializables a JSON"""
+    if hasattr(value, 'to_columns'):
+        value = value.to_columns()
+    if hasattr(value, 'columns'):
+        import pandas as pd
+        digest = hashlib.sha1(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        digest.update(json.dumps(list(map(str, value.columns))).encode('utf-8'))
+    else:
+        digest = hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+def ttl_cached(source, ttl):
+    """Decorador: cachea el resultado de ``source`` durante ``ttl`` segundos"""
+    ttl = float(os.environ.get(f'AIFA_DATA_TTL_{source.upper()}', ttl))
+
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'value': None, 'expires_at': 0.0, 'loaded': False}
+
+        def load():
+            value = func()
+            set_data_fingerprint(source, fingerprint(value))
+            state.update(value=value, expires_at=time.monotonic() + ttl, loaded=True)
+            return value
+
+        @wraps(func)
+        def accessor():
+            reads = _reads.get()
+            if reads is not None:
+                reads.add(source)
+            if time.monotonic() < state['expires_at']:
+                return state['value']
+            with lock:
+                # Otro hilo pudo haberla recargado mientras se esperaba el lock
+                if time.monotonic() < state['expires_at']:
+                    return state['value']
+                return load()
+
+        def invalidate():
+            """La siguiente llamada vuelve a generar los datos"""
+            state['expires_at'] = 0.0
+
+        accessor.source = source
+        accessor.ttl = ttl
+        accessor.invalidate = invalidate
+        accessor.loaded = lambda: state['loaded']
+        _accessors.append(accessor)
+        _by_source[source] = accessor
+        return accessor
+    return decorator
+
+
+def refresh_loaded():
+    """Recarga las fuentes ya usadas cuyo TTL venció; las que nadie pidió no se cargan"""
+    for accessor in _accessors:
+        if accessor.loaded():
+            accessor()
+
+
+@contextmanager
+def track_reads():
+    """Conjunto de fuentes leídas dentro del bloque; se suman también al bloque exterior"""
+    outer = _reads.get()
+    reads = set()
+    token = _reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _reads.reset(token)
+        if outer is not None:
+            outer.update(reads)
+
+
+def note_reads(sources):
+    """Anota ``sources`` como leídas (p. ej. las que reporta un proceso del pool de figuras)"""
+    reads = _reads.get()
+    if reads is not None:
+        reads.update(sources)
+
+
+def load_sources(sources):
+    """Carga ``sources`` (o las refresca si venció su TTL); False si alguna no está registrada en este proceso"""
+    accessors = [_by_source.get(source) for source in sources]
+    if None in accessors:
+        return False
+    for accessor in accessors:
+        accessor()
+    return True
+
+
+# Fuentes de ``simulated_data`` para los layouts de ``src/layouts``; los tabs
+# de ``src/tabs`` declaran las suyas (``kpi``, ``routes``...) con sus propios datos
+@ttl_cached('simulated_kpi', ttl=300)
+def get_kpi_data():
+    from .simulated_data import generate_kpi_data
+    return generate_kpi_data()
+
+
+@ttl_cached('simulated_historical', ttl=3600)
+def get_historical_data():
+    from .simulated_data import generate_historical_data
+    return generate_historical_data()
+
+
+@ttl_cached('simulated_airport_comparison', ttl=3600)
+def get_airport_comparison():
+    from .simulated_data import generate_airport_comparison
+    return generate_airport_comparison()
+
+
+@ttl_cached('simulated_routes', ttl=900)
+def get_route_data():
+    from .simulated_data import generate_route_data
+    return generate_route_data()
+
+
+@ttl_cached('simulated_state_penetration', ttl=3600)
+def get_state_penetration():
+    from .simulated_data import generate_state_penetration
+    return generate_state_penetration()
+
+
+@ttl_cached('simulated_financial', ttl=3600)
+def get_financial_data():
+    from .simulated_data import generate_financial_data
+    return generate_financial_data()
@@ -0,0 +1,150 @@
+"""
+Tabla columnar de rutas AIFA: una sola fuente para el tab geográfico, el mapa
+de red, el dataset ``routes`` del navegador y los layouts de ``src/layouts``.
+
+Cada columna es un arreglo NumPy; país, región y tipo de ruta se guardan como
+códigos enteros sobre categorías fijas. Al construirse la tabla ordena las
+filas por región una vez (índice de grupos: orden + offsets), así filtrar por
+región es un slice y agregar por región es un ``np.bincount``, sin recorrer
+las rutas ni comparar texto. Escala igual con ocho rutas que con miles.
+
+Uso::
+
+    table = route_table()
+    table.aggregate('passengers')              # {'USA': 255000, 'México': ...}
+    table.rows(region='USA', route_type='international')
+    table.records(order_by='passengers')       # lista de dicts para la UI
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+HUB = {'name': 'AIFA', 'lat': 19.7373, 'lon': -99.0068}
+HOME_COUNTRY = 'México'
+
+# Categorías fijas: los códigos no cambian al agregar rutas
+REGIONS = ('USA', 'México', 'LATAM', 'Europa')
+ROUTE_TYPES = ('domestic', 'international')
+COUNTRY_REGIONS = {
+    'México': 'México',
+    'USA': 'USA',
+    'Colombia': 'LATAM',
+    'Perú': 'LATAM',
+    'Venezuela': 'LATAM',
+    'Panamá': 'LATAM',
+    'España': 'Europa',
+}
+COUNTRIES = tuple(COUNTRY_REGIONS)
+_COUNTRY_TO_REGION = np.array([REGIONS.index(COUNTRY_REGIONS[c]) for c in COUNTRIES], dtype=np.int8)
+
+# (ciudad, país, lat, lon, pasajeros/año, vuelos/mes, factor de carga %)
+ROUTES = [
+    ('Guadalajara', 'México', 20.5218, -103.3111, 125000, 42, 82.3),
+    ('Monterrey', 'México', 25.7785, -100.1069, 98000, 35, 78.5),
+    ('Cancún', 'México', 21.0368, -86.8770, 156000, 28, 89.2),
+    ('Los Angeles', 'USA', 34.0522, -118.2437, 87000, 21, 85.7),
+    ('Houston', 'USA', 29.9844, -95.3414, 76000, 19, 81.3),
+    ('Miami', 'USA', 25.7617, -80.1918, 92000, 17, 87.4),
+    ('Bogotá', 'Colombia', 4.7110, -74.0721, 45000, 14, 79.8),
+    ('Lima', 'Perú', -12.0464, -77.0428, 38000, 10, 82.1),
+    ('Madrid', 'España', 40.4168, -3.7038, 67000, 14, 84.6),
+]
+
+NUMERIC_COLUMNS = ('lat', 'lon', 'passengers', 'frequency', 'load_factor')
+
+
+def encode(values, categories):
+    """Códigos enteros de ``values`` sobre ``categories`` (ValueError si falta alguna)"""
+    values = np.asarray(values)
+    lookup = np.asarray(categories)
+    order = np.argsort(lookup)
+    positions = np.searchsorted(lookup, values, sorter=order)
+    codes = order[np.minimum(positions, len(order) - 1)]
+    unknown = lookup[codes] != values
+    if unknown.any():
+        raise ValueError(f"Categorías desconocidas: {sorted(set(values[unknown]))}")
+    return codes.astype(np.int8)
+
+
+class RouteTable:
+    """Rutas en columnas NumPy con códigos categóricos e índice por región"""
+
+    def __init__(self, city, country, lat, lon, passengers, frequency, load_factor):
+        country_code = encode(country, COUNTRIES)
+        region_code = _COUNTRY_TO_REGION[country_code]
+        # Filas ordenadas por región: cada región es un bloque contiguo
+        order = np.argsort(region_code, kind='stable')
+        self.city = np.asarray(city, dtype=object)[order]
+        self.country_code = country_code[order]
+        self.region_code = region_code[order]
+        self.type_code = (self.country_code != COUNTRIES.index(HOME_COUNTRY)).astype(np.int8)
+        self.lat = np.asarray(lat, dtype=np.float64)[order]
+        self.lon = np.asarray(lon, dtype=np.float64)[order]
+        self.passengers = np.asarray(passengers, dtype=np.int64)[order]
+        self.frequency = np.asarray(frequency, dtype=np.int32)[order]
+        self.load_factor = np.asarray(load_factor, dtype=np.float64)[order]
+        self.region_offsets = np.concatenate(([0], np.cumsum(np.bincount(self.region_code, minlength=len(REGIONS)))))
+
+    @classmethod
+    def from_records(cls, routes):
+        """Construye la tabla desde tuplas ``(ciudad, país, lat, lon, pasajeros, vuelos, factor)``"""
+        return cls(*zip(*routes))
+
+    def __len__(self):
+        return len(self.city)
+
+    @cached_property
+    def city_index(self):
+        """Fila de cada ciudad (se calcula una vez por tabla)"""
+        return {city: i for i, city in enumerate(self.city.tolist())}
+
+    def region_slice(self, region):
+        code = REGIONS.index(region)
+        return slice(self.region_offsets[code], self.region_offsets[code + 1])
+
+    def rows(self, region=None, route_type=None):
+        """Índices de las filas de una región y/o tipo de ruta"""
+        indices = np.arange(len(self))
+        if region is not None:
+            indices = indices[self.region_slice(region)]
+        if route_type is not None:
+            indices = indices[self.type_code[indices] == ROUTE_TYPES.index(route_type)]
+        return indices
+
+    def aggregate(self, column, by='region'):
+        """Suma de ``column`` por región o tipo de ruta, solo grupos con rutas"""
+        codes, labels = (self.region_code, REGIONS) if by == 'region' else (self.type_code, ROUTE_TYPES)
+        values = getattr(self, column)
+        totals = np.bincount(codes, weights=values, minlength=len(labels)).astype(values.dtype)
+        counts = np.bincount(codes, minlength=len(labels))
+        return {label: totals[i].item() for i, label in enumerate(labels) if counts[i]}
+
+    def records(self, indices=None, order_by=None, descending=True):
+        """Filas como dicts (para componentes y figuras); opcionalmente ordenadas"""
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices)
+        if order_by is not None:
+            keys = getattr(self, order_by)[indices]
+            indices = indices[np.argsort(-keys if descending else keys, kind='stable')]
+        return [{
+            'city': self.city[i],
+            'country': COUNTRIES[self.country_code[i]],
+            'region': REGIONS[self.region_code[i]],
+            'type': ROUTE_TYPES[self.type_code[i]],
+            **{column: getattr(self, column)[i].item() for column in NUMERIC_COLUMNS},
+        } for i in indices]
+
+    def to_columns(self):
+        """Columnas serializables a JSON: códigos y categorías en vez de texto repetido"""
+        return {
+            'city': self.city.tolist(),
+            'countries': list(COUNTRIES), 'country_code': self.country_code.tolist(),
+            'regions': list(REGIONS), 'region_code': self.region_code.tolist(),
+            'types': list(ROUTE_TYPES), 'type_code': self.type_code.tolist(),
+            **{column: getattr(self, column).tolist() for column in NUMERIC_COLUMNS},
+        }
+
+
+def route_table():
+    """Tabla con las rutas actuales del AIFA"""
+    return RouteTable.from_records(ROUTES)
@@ -3,6 +3,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 
+from .routes import COUNTRIES, HUB, REGIONS, ROUTE_TYPES, route_table
+
 def generate_kpi_data():
     """Generate simulated KPI data for AIFA"""
     return {
@@ -43,24 +45,30 @@ def generate_kpi_data():
         }
     }
 
-def generate_historical_data():
-    """Generate historical trend data"""
-    dates = pd.date_range(end=datetime.now(), periods=12, freq='ME')
+def _elapsed_months(dates):
+    """Meses transcurridos desde la primera fecha (fracción por día dentro del mes)"""
+    months = dates.year * 12 + dates.month + dates.day / dates.days_in_month
+    return (months - months[0]).to_numpy()
+
+def generate_historical_data(periods=12, freq='ME', seed=None):
+    """Generate historical trend data
+
+    ``periods``/``freq`` definen la serie (p. ej. ``periods=3 * 365, freq='D'``);
+    la tendencia es de +0.4 puntos por mes sin importar la frecuencia.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=datetime.now(), periods=periods, freq=freq)
     
     # Market participation trend
     base_participation = 8.0
-    participation_data = []
+    value = base_participation + _elapsed_months(dates) * 0.4 + rng.normal(0, 0.3, periods)
     
-    for i in range(12):
-        value = base_participation + (i * 0.4) + np.random.normal(0, 0.3)
-        participation_data.append({
-            'date': dates[i],
-            'passengers': max(0, value + np.random.normal(0, 0.2)),
-            'operations': max(0, value - 1.5 + np.random.normal(0, 0.15)),
-            'cargo': max(0, value - 2.0 + np.random.normal(0, 0.25))
-        })
-    
-    return pd.DataFrame(participation_data)
+    return pd.DataFrame({
+        'date': dates,
+        'passengers': np.maximum(0, value + rng.normal(0, 0.2, periods)),
+        'operations': np.maximum(0, value - 1.5 + rng.normal(0, 0.15, periods)),
+        'cargo': np.maximum(0, value - 2.0 + rng.normal(0, 0.25, periods))
+    })
 
 def generate_airport_comparison():
     """Generate comparison data with other Mexican airports"""
@@ -76,84 +84,100 @@ def generate_airport_comparison():
     return pd.DataFrame(airports)
 
 def generate_route_data():
-    """Generate route network data"""
-    routes = [
-        {'city': 'Guadalajara', 'country': 'México', 'lat': 20.5218, 'lon': -103.3111, 
-         'passengers': 125000, 'frequency': 42, 'load_factor': 82.3},
-        {'city': 'Monterrey', 'country': 'México', 'lat': 25.7785, 'lon': -100.1069,
-         'passengers': 98000, 'frequency': 35, 'load_factor': 78.5},
-        {'city': 'Cancún', 'country': 'México', 'lat': 21.0368, 'lon': -86.8770,
-         'passengers': 156000, 'frequency': 28, 'load_factor': 89.2},
-        {'city': 'Los Angeles', 'country': 'USA', 'lat': 34.0522, 'lon': -118.2437,
-         'passengers': 87000, 'frequency': 21, 'load_factor': 85.7},
-        {'city': 'Houston', 'country': 'USA', 'lat': 29.9844, 'lon': -95.3414,
-         'passengers': 76000, 'frequency': 19, 'load_factor': 81.3},
-        {'city': 'Miami', 'country': 'USA', 'lat': 25.7617, 'lon': -80.1918,
-         'passengers': 92000, 'frequency': 17, 'load_factor': 87.4},
-        {'city': 'Bogotá', 'country': 'Colombia', 'lat': 4.7110, 'lon': -74.0721,
-         'passengers': 45000, 'frequency': 14, 'load_factor': 79.8},
-        {'city': 'Lima', 'country': 'Perú', 'lat': -12.0464, 'lon': -77.0428,
-         'passengers': 38000, 'frequency': 10, 'load_factor': 82.1}
-    ]
+    """Generate route network data (tabla de rutas de ``routes.py`` con columnas categóricas)"""
+    table = route_table()
+    routes = pd.DataFrame({
+        'city': table.city,
+        'country': pd.Categorical.from_codes(table.country_code, COUNTRIES),
+        'region': pd.Categorical.from_codes(table.region_code, REGIONS),
+        'type': pd.Categorical.from_codes(table.type_code, ROUTE_TYPES),
+        'lat': table.lat,
+        'lon': table.lon,
+        'passengers': table.passengers,
+        'frequency': table.frequency,
+        'load_factor': table.load_factor,
+    })
     
     # Add AIFA location
-    for route in routes:
-        route['origin_lat'] = 19.7369
-        route['origin_lon'] = -99.0256
+    routes['origin_lat'] = HUB['lat']
+    routes['origin_lon'] = HUB['lon']
     
-    return pd.DataFrame(routes)
+    return routes
 
-def generate_state_penetration():
-    """Generate state penetration data for Mexico"""
-    states = {
-        'Ciudad de México': 45.2,
-        'Estado de México': 38.7,
-        'Jalisco': 12.3,
-        'Nuevo León': 8.9,
-        'Puebla': 7.2,
-        'Querétaro': 6.8,
-        'Guanajuato': 5.9,
-        'Veracruz': 4.2,
-        'Hidalgo': 15.3,
-        'Michoacán': 3.8,
-        'Chihuahua': 2.1,
-        'Coahuila': 1.9,
-        'San Luis Potosí': 3.4,
-        'Aguascalientes': 2.8,
-        'Morelos': 4.5,
-        'Tlaxcala': 8.9
-    }
-    
-    data = []
-    for state, penetration in states.items():
-        data.append({
-            'state': state,
-            'penetration': penetration,
-            'passengers': int(penetration * 25000 + np.random.randint(-5000, 5000))
-        })
+# Penetración (%) por entidad; las primeras 16 son las que muestra el dashboard
+STATE_PENETRATION = {
+    'Ciudad de México': 45.2,
+    'Estado de México': 38.7,
+    'Jalisco': 12.3,
+    'Nuevo León': 8.9,
+    'Puebla': 7.2,
+    'Querétaro': 6.8,
+    'Guanajuato': 5.9,
+    'Veracruz': 4.2,
+    'Hidalgo': 15.3,
+    'Michoacán': 3.8,
+    'Chihuahua': 2.1,
+    'Coahuila': 1.9,
+    'San Luis Potosí': 3.4,
+    'Aguascalientes': 2.8,
+    'Morelos': 4.5,
+    'Tlaxcala': 8.9,
+    'Guerrero': 3.1,
+    'Oaxaca': 2.6,
+    'Chiapas': 1.7,
+    'Tabasco': 2.2,
+    'Yucatán': 1.8,
+    'Quintana Roo': 2.4,
+    'Campeche': 1.1,
+    'Sinaloa': 1.6,
+    'Sonora': 1.4,
+    'Baja California': 1.3,
+    'Baja California Sur': 0.9,
+    'Durango': 1.5,
+    'Zacatecas': 2.0,
+    'Nayarit': 1.2,
+    'Colima': 0.8,
+    'Tamaulipas': 1.9
+}
+
+def generate_state_penetration(size=16, seed=None):
+    """Generate state penetration data for Mexico
+
+    ``size`` es el número de entidades, de 1 a 32 (todas las de
+    ``STATE_PENETRATION``); fuera de ese rango lanza ``ValueError``.
+    """
+    if not 1 <= size <= len(STATE_PENETRATION):
+        raise ValueError(f"size debe estar entre 1 y {len(STATE_PENETRATION)}, no {size}")
+    rng = np.random.default_rng(seed)
+    states = list(STATE_PENETRATION)[:size]
+    penetration = np.array([STATE_PENETRATION[state] for state in states])
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'state': states,
+        'penetration': penetration,
+        'passengers': (penetration * 25000 + rng.integers(-5000, 5000, len(states))).astype(int)
+    })
 
-def generate_financial_data():
-    """Generate financial performance data"""
-    months = pd.date_range(end=datetime.now(), periods=12, freq='ME')
+def generate_financial_data(periods=12, freq='ME', seed=None):
+    """Generate financial performance data
+
+    Igual que ``generate_historical_data``: ``periods``/``freq`` definen la
+    serie y el ingreso crece 8 M MXN por mes.
+    """
+    rng = np.random.default_rng(seed)
+    months = pd.date_range(end=datetime.now(), periods=periods, freq=freq)
     
-    financial_data = []
     base_revenue = 150  # Million MXN
+    revenue = base_revenue + _elapsed_months(months) * 8 + rng.normal(0, 10, periods)
+    costs = revenue * 0.75 + rng.normal(0, 5, periods)
     
-    for i, month in enumerate(months):
-        revenue = base_revenue + (i * 8) + np.random.normal(0, 10)
-        costs = revenue * 0.75 + np.random.normal(0, 5)
-        
-        financial_data.append({
-            'month': month,
-            'revenue': revenue,
-            'costs': costs,
-            'ebitda': revenue - costs,
-            'margin': ((revenue - costs) / revenue) * 100
-        })
-    
-    return pd.DataFrame(financial_data)
+    return pd.DataFrame({
+        'month': months,
+        'revenue': revenue,
+        'costs': costs,
+        'ebitda': revenue - costs,
+        'margin': ((revenue - costs) / revenue) * 100
+    })
 
 def generate_operational_metrics():
     """Generate operational performance metrics"""
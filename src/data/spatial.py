@@ -0,0 +1,198 @@
+"""
+Índice espacial de destinos sobre la tabla de rutas (``src/data/routes.py``).
+
+Dos estructuras, ambas con distancia haversine (gran círculo, km):
+
+  * ``BallTree``: árbol de bolas sobre lat/lon para consultas desde
+    cualquier punto: destinos dentro de un radio y vecinos más cercanos.
+    Cada nodo guarda un centro y el radio que cubre sus puntos; como la
+    haversine es una métrica, un nodo se descarta (o se acepta completo)
+    con una sola distancia al centro, sin revisar sus rutas.
+  * ``RouteSpatialIndex``: el árbol más un índice de anillos alrededor del
+    hub: rutas ordenadas por distancia al AIFA con sumas acumuladas de
+    pasajeros y vuelos. Los totales de una banda de distancia (doméstica,
+    regional, largo alcance) salen de dos búsquedas binarias, O(log n).
+
+Uso::
+
+    index = route_index(route_table())
+    index.within(2000)                          # rutas a <= 2,000 km del AIFA
+    index.nearest(19.43, -99.13, k=3)           # 3 destinos más cercanos a un punto
+    index.bands()                               # totales por banda de distancia
+"""
+
+import heapq
+
+import numpy as np
+
+from .routes import HUB
+
+EARTH_RADIUS_KM = 6371.0088
+LEAF_SIZE = 16
+
+# (clave, etiqueta, desde km, hasta km)
+DISTANCE_BANDS = (
+    ('domestic', 'Doméstico', 0.0, 1500.0),
+    ('regional', 'Regional', 1500.0, 5000.0),
+    ('long_haul', 'Largo alcance', 5000.0, np.inf),
+)
+BAND_COLUMNS = ('passengers', 'frequency')
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Distancia de gran círculo en km (acepta arreglos)"""
+    lat1, lon1, lat2, lon2 = (np.radians(v) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _unit_vectors(lat, lon):
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+class BallTree:
+    """Árbol de bolas haversine sobre puntos lat/lon"""
+
+    def __init__(self, lat, lon, leaf_size=LEAF_SIZE):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(self.lat))
+        # Nodos en arreglos paralelos: rango [start, end) de ``order``, centro, radio e hijos (-1 = hoja)
+        self._start, self._end, self._center, self._radius, self._children = [], [], [], [], []
+        self._vectors = _unit_vectors(self.lat, self.lon)
+        if len(self.lat):
+            self._build(0, len(self.lat))
+        self._center = np.array(self._center).reshape(-1, 2)
+        self._radius = np.array(self._radius)
+
+    def __len__(self):
+        return len(self.lat)
+
+    def _build(self, start, end):
+        node = len(self._start)
+        points = self.order[start:end]
+        # Centro: media de los vectores unitarios proyectada a la esfera
+        mean = self._vectors[points].mean(axis=0)
+        norm = np.linalg.norm(mean)
+        if norm < 1e-9:
+            center = (self.lat[points[0]], self.lon[points[0]])
+        else:
+            x, y, z = mean / norm
+            center = (np.degrees(np.arcsin(z)), np.degrees(np.arctan2(y, x)))
+        self._start.append(start)
+        self._end.append(end)
+        self._center.append(center)
+        self._radius.append(haversine_km(center[0], center[1], self.lat[points], self.lon[points]).max())
+        self._children.append(None)
+        if end - start > self.leaf_size:
+            # Partir por la mediana sobre el eje de mayor dispersión
+            vectors = self._vectors[points]
+            axis = np.argmax(vectors.max(axis=0) - vectors.min(axis=0))
+            middle = (end - start) // 2
+            self.order[start:end] = points[np.argpartition(vectors[:, axis], middle)]
+            self._children[node] = (self._build(start, start + middle), self._build(start + middle, end))
+        return node
+
+    def _distances(self, lat, lon, start, end):
+        points = self.order[start:end]
+        return points, haversine_km(lat, lon, self.lat[points], self.lon[points])
+
+    def query_radius(self, lat, lon, radius_km):
+        """Índices de los puntos a <= ``radius_km`` de (lat, lon), ordenados por distancia"""
+        found, distances = [], []
+        stack = [0] if len(self) else []
+        while stack:
+            node = stack.pop()
+            start, end = self._start[node], self._end[node]
+            to_center = haversine_km(lat, lon, *self._center[node])
+            if to_center - self._radius[node] > radius_km:
+                continue
+            if self._children[node] is None or to_center + self._radius[node] <= radius_km:
+                points, dist = self._distances(lat, lon, start, end)
+                inside = dist <= radius_km
+                found.append(points[inside])
+                distances.append(dist[inside])
+            else:
+                stack.extend(self._children[node])
+        if not found:
+            return np.array([], dtype=np.int64), np.array([])
+        found, distances = np.concatenate(found), np.concatenate(distances)
+        order = np.argsort(distances, kind='stable')
+        return found[order], distances[order]
+
+    def query_nearest(self, lat, lon, k=1):
+        """``k`` puntos más cercanos a (lat, lon): (índices, distancias) de menor a mayor"""
+        best = []  # heap de máximos: (-distancia, índice)
+        pending = [(0.0, 0)] if len(self) else []
+        while pending:
+            bound, node = heapq.heappop(pending)
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            if self._children[node] is None:
+                points, dist = self._distances(lat, lon, self._start[node], self._end[node])
+                for point, d in zip(points.tolist(), dist.tolist()):
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, point))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, point))
+            else:
+                for child in self._children[node]:
+                    to_center = haversine_km(lat, lon, *self._center[child])
+                    heapq.heappush(pending, (max(0.0, to_center - self._radius[child]), child))
+        best.sort(key=lambda item: (-item[0], item[1]))
+        return np.array([i for _, i in best], dtype=np.int64), np.array([-d for d, _ in best])
+
+
+class RouteSpatialIndex:
+    """Consultas espaciales y bandas de distancia sobre una ``RouteTable``"""
+
+    def __init__(self, table, hub=HUB, leaf_size=LEAF_SIZE):
+        self.table = table
+        self.hub = hub
+        self.tree = BallTree(table.lat, table.lon, leaf_size)
+        self.hub_distance = haversine_km(hub['lat'], hub['lon'], table.lat, table.lon)
+        # Anillos alrededor del hub: rutas por distancia y sumas acumuladas
+        self._by_distance = np.argsort(self.hub_distance, kind='stable')
+        self._sorted_distance = self.hub_distance[self._by_distance]
+        self._prefix = {column: np.concatenate(([0], np.cumsum(getattr(table, column)[self._by_distance])))
+                        for column in BAND_COLUMNS}
+
+    def within(self, radius_km, lat=None, lon=None):
+        """Índices de las rutas a <= ``radius_km`` de un punto (default: el hub), de la más cercana a la más lejana"""
+        if lat is None and lon is None:
+            return self._by_distance[:np.searchsorted(self._sorted_distance, radius_km, side='right')]
+        return self.tree.query_radius(lat, lon, radius_km)[0]
+
+    def nearest(self, lat, lon, k=1):
+        """Las ``k`` rutas más cercanas a un punto: (índices, distancias km)"""
+        return self.tree.query_nearest(lat, lon, k)
+
+    def band_totals(self, low_km, high_km):
+        """Rutas, pasajeros y vuelos con distancia al hub en [low_km, high_km)"""
+        start, end = np.searchsorted(self._sorted_distance, (low_km, high_km), side='left')
+        totals = {column: (self._prefix[column][end] - self._prefix[column][start]).item() for column in BAND_COLUMNS}
+        return {'routes': int(end - start), **totals}
+
+    def bands(self):
+        """Totales por banda de ``DISTANCE_BANDS``"""
+        return [{'key': key, 'label': label, 'low_km': low, 'high_km': high, **self.band_totals(low, high)}
+                for key, label, low, high in DISTANCE_BANDS]
+
+
+_last_index = (None, None)
+
+
+def route_index(table):
+    """Índice espacial de una tabla de rutas, centrado en el AIFA.
+
+    Se reutiliza mientras llegue la misma tabla: ``get_route_table`` devuelve
+    el mismo objeto hasta que su fuente se refresca (y cambia la versión de datos).
+    """
+    global _last_index
+    cached_table, index = _last_index
+    if cached_table is not table:
+        index = RouteSpatialIndex(table)
+        _last_index = (table, index)
+    return index
@@ -0,0 +1,252 @@
+"""
+Generador sintético de alto volumen para pruebas de carga.
+
+Produce, de forma vectorizada y determinista (misma ``seed`` → mismos datos),
+cuatro tablas con patrones diarios, semanales y estacionales:
+
+    flights   movimientos de vuelos (llegadas y salidas)
+    scans     lecturas de pase de abordar en filtros de seguridad y puertas
+    surveys   encuestas de satisfacción por área
+    ledger    asientos contables de ingresos y costos
+
+Los timestamps se muestrean por inversa de la distribución: probabilidad por
+día (mes × día de la semana × tendencia) y por hora (bancos de la mañana y
+de la tarde). Las columnas de texto son ``category`` y las numéricas usan
+tipos de 32 bits para que millones de filas quepan en memoria.
+
+Uso::
+
+    dataset = generate_dataset(flights=1_000_000, seed=7)
+    python -m src.data.synthetic --flights 1000000 --out /tmp/aifa-synthetic
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Factor por mes (ene..dic): picos en vacaciones de verano, semana santa y diciembre
+MONTH_FACTORS = np.array([0.92, 0.84, 0.97, 1.02, 0.93, 0.98, 1.16, 1.14, 0.86, 0.91, 0.96, 1.21])
+# Factor por día de la semana (lun..dom)
+WEEKDAY_FACTORS = np.array([1.06, 0.93, 0.95, 1.01, 1.12, 0.98, 0.95])
+# Perfil horario de operaciones: bancos de 6-9 h y 17-21 h, casi nada de madrugada
+HOURLY_PROFILE = np.array([0.3, 0.15, 0.1, 0.1, 0.4, 1.6, 2.8, 3.0, 2.6, 2.0, 1.8, 1.7,
+                           1.6, 1.6, 1.7, 1.9, 2.3, 2.7, 2.9, 2.6, 2.1, 1.5, 0.9, 0.5])
+ANNUAL_GROWTH = 0.18
+
+DESTINATIONS = pd.DataFrame({
+    'city': ['Guadalajara', 'Monterrey', 'Cancún', 'Tijuana', 'Mérida', 'Puerto Vallarta', 'Los Cabos',
+             'Los Angeles', 'Houston', 'Miami', 'Bogotá', 'Lima', 'Caracas', 'Panamá'],
+    'country': ['México'] * 7 + ['USA'] * 3 + ['Colombia', 'Perú', 'Venezuela', 'Panamá'],
+    'lat': [20.5218, 25.7785, 21.0368, 32.5411, 20.9370, 20.6801, 23.1518,
+            34.0522, 29.9844, 25.7617, 4.7110, -12.0464, 10.6031, 9.0714],
+    'lon': [-103.3111, -100.1069, -86.8770, -116.9700, -89.6577, -105.2541, -109.7215,
+            -118.2437, -95.3414, -80.1918, -74.0721, -77.0428, -66.9906, -79.3835],
+    'weight': [14, 11, 16, 9, 7, 6, 5, 6, 5, 6, 3, 2, 1, 2],
+})
+COUNTRY_CODES, COUNTRIES = pd.factorize(DESTINATIONS['country'])
+AIRLINES = ['Aeroméxico', 'Viva Aerobus', 'Volaris', 'Mexicana', 'Conviasa', 'Copa', 'Arajet']
+AIRLINE_WEIGHTS = np.array([0.27, 0.31, 0.28, 0.08, 0.02, 0.02, 0.02])
+# (modelo, asientos, peso)
+AIRCRAFT = [('A320', 180, 0.38), ('A321', 220, 0.22), ('B737-800', 186, 0.25), ('E190', 100, 0.10), ('B787', 274, 0.05)]
+CHECKPOINTS = ['Filtro A', 'Filtro B', 'Filtro C', 'Puerta 1-12', 'Puerta 13-24', 'Puerta 25-36']
+SURVEY_AREAS = pd.DataFrame({
+    'area': ['Terminal', 'Check-in', 'Seguridad', 'Comercial', 'Embarque', 'Equipaje'],
+    'mean_score': [4.5, 4.2, 3.9, 4.0, 4.4, 4.1],
+    'weight': [0.22, 0.20, 0.18, 0.12, 0.16, 0.12],
+})
+# (cuenta, tipo, monto medio en MXN por asiento, peso)
+LEDGER_ACCOUNTS = [
+    ('TUA', 'ingreso', 182000, 0.24), ('Aterrizaje', 'ingreso', 64000, 0.12),
+    ('Estacionamiento', 'ingreso', 21000, 0.10), ('Comercial', 'ingreso', 38000, 0.12),
+    ('Carga', 'ingreso', 52000, 0.07), ('Personal', 'costo', 71000, 0.13),
+    ('Mantenimiento', 'costo', 46000, 0.09), ('Energía', 'costo', 29000, 0.07),
+    ('Seguridad', 'costo', 33000, 0.06),
+]
+
+
+def _days(start, days):
+    return pd.date_range(start, periods=days, freq='D')
+
+
+def day_weights(dates):
+    """Probabilidad relativa de cada día: mes × día de la semana × crecimiento anual"""
+    elapsed_years = np.arange(len(dates)) / 365.25
+    weights = (MONTH_FACTORS[dates.month.to_numpy() - 1]
+               * WEEKDAY_FACTORS[dates.dayofweek.to_numpy()]
+               * (1 + ANNUAL_GROWTH) ** elapsed_years)
+    return weights / weights.sum()
+
+
+def seasonal_timestamps(rng, size, start='2023-01-01', days=365, hourly=HOURLY_PROFILE):
+    """``size`` timestamps (datetime64[s]) con patrón diario y estacional"""
+    dates = _days(start, days)
+    day = rng.choice(days, size=size, p=day_weights(dates))
+    hour = rng.choice(24, size=size, p=hourly / hourly.sum())
+    seconds = day.astype(np.int64) * 86400 + hour * 3600 + rng.integers(0, 3600, size=size)
+    return np.datetime64(dates[0].date(), 's') + seconds.astype('timedelta64[s]')
+
+
+def _categorical(codes, categories):
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def generate_flights(size, seed=0, start='2023-01-01', days=365):
+    """Movimientos de vuelo: destino, aerolínea, aeronave, pasajeros, demoras y carga"""
+    rng = np.random.default_rng([seed, 1])
+    scheduled = np.sort(seasonal_timestamps(rng, size, start, days))
+    hour = (scheduled.astype('datetime64[h]').astype(np.int64) % 24)
+
+    destination = rng.choice(len(DESTINATIONS), size=size, p=DESTINATIONS['weight'] / DESTINATIONS['weight'].sum())
+    airline = rng.choice(len(AIRLINES), size=size, p=AIRLINE_WEIGHTS)
+    aircraft = rng.choice(len(AIRCRAFT), size=size, p=[a[2] for a in AIRCRAFT])
+    seats = np.array([a[1] for a in AIRCRAFT], dtype=np.int16)[aircraft]
+
+    # Ocupación más alta en temporada alta; beta para mantenerla en (0, 1)
+    month_factor = MONTH_FACTORS[scheduled.astype('datetime64[M]').astype(np.int64) % 12]
+    load_factor = np.clip(rng.beta(9, 2, size=size) * month_factor, 0.3, 1.0)
+    passengers = np.rint(seats * load_factor).astype(np.int16)
+
+    # Demoras: la mayoría a tiempo, cola larga que crece en horas congestionadas
+    congestion = HOURLY_PROFILE[hour] / HOURLY_PROFILE.max()
+    delayed = rng.random(size) < 0.08 + 0.12 * congestion
+    delay = np.where(delayed, rng.gamma(1.6, 18 + 22 * congestion), 0.0)
+
+    international = COUNTRY_CODES[destination] != 0  # 0 = México
+    cargo = rng.gamma(2.0, np.where(international, 2.4, 0.9)).astype(np.float32)
+
+    return pd.DataFrame({
+        'flight_id': np.arange(size, dtype=np.int64),
+        'scheduled': scheduled,
+        'direction': _categorical(rng.integers(0, 2, size=size), ['llegada', 'salida']),
+        'destination': _categorical(destination, DESTINATIONS['city']),
+        'country': _categorical(COUNTRY_CODES[destination], COUNTRIES),
+        'airline': _categorical(airline, AIRLINES),
+        'aircraft': _categorical(aircraft, [a[0] for a in AIRCRAFT]),
+        'seats': seats,
+        'passengers': passengers,
+        'load_factor': load_factor.astype(np.float32),
+        'delay_minutes': delay.astype(np.float32),
+        'cargo_tons': cargo,
+    })
+
+
+def generate_passenger_scans(flights, size, seed=0):
+    """Lecturas de pase de abordar, repartidas entre vuelos según sus pasajeros"""
+    rng = np.random.default_rng([seed, 2])
+    passengers = flights['passengers'].to_numpy(dtype=np.float64)
+    flight = rng.choice(len(flights), size=size, p=passengers / passengers.sum())
+
+    # Llegada al filtro: gamma con media ~95 min antes del vuelo; en puerta ~35 min
+    checkpoint = rng.choice(len(CHECKPOINTS), size=size, p=[0.2, 0.18, 0.12, 0.18, 0.17, 0.15])
+    at_gate = checkpoint >= 3
+    lead_minutes = np.where(at_gate, rng.gamma(4.0, 9.0, size=size), rng.gamma(6.0, 16.0, size=size))
+    scanned = (flights['scheduled'].to_numpy()[flight]
+               - (lead_minutes * 60).astype('timedelta64[s]'))
+
+    hour = scanned.astype('datetime64[h]').astype(np.int64) % 24
+    congestion = HOURLY_PROFILE[hour] / HOURLY_PROFILE.max()
+    wait = np.where(at_gate, rng.exponential(2.0, size=size), rng.gamma(2.0, 2.0 + 6.0 * congestion))
+
+    return pd.DataFrame({
+        'scan_id': np.arange(size, dtype=np.int64),
+        'flight_id': flights['flight_id'].to_numpy()[flight],
+        'scanned_at': scanned,
+        'checkpoint': _categorical(checkpoint, CHECKPOINTS),
+        'wait_minutes': wait.astype(np.float32),
+    })
+
+
+def generate_surveys(size, seed=0, start='2023-01-01', days=365):
+    """Encuestas: calificación 1-5 por área y recomendación 0-10 (NPS)"""
+    rng = np.random.default_rng([seed, 3])
+    answered = seasonal_timestamps(rng, size, start, days)
+    area = rng.choice(len(SURVEY_AREAS), size=size, p=SURVEY_AREAS['weight'])
+    latent = SURVEY_AREAS['mean_score'].to_numpy()[area] + rng.normal(0, 0.7, size=size)
+    score = np.clip(np.rint(latent), 1, 5).astype(np.int8)
+    nps = np.clip(np.rint((latent - 1) * 2.5 + rng.normal(0, 1.2, size=size)), 0, 10).astype(np.int8)
+    return pd.DataFrame({
+        'survey_id': np.arange(size, dtype=np.int64),
+        'answered_at': answered,
+        'area': _categorical(area, SURVEY_AREAS['area']),
+        'score': score,
+        'nps': nps,
+    })
+
+
+def generate_ledger(size, seed=0, start='2023-01-01', days=365):
+    """Asientos contables diarios; los costos se registran con monto negativo"""
+    rng = np.random.default_rng([seed, 4])
+    dates = _days(start, days)
+    day = np.sort(rng.choice(days, size=size, p=day_weights(dates)))
+    account = rng.choice(len(LEDGER_ACCOUNTS), size=size, p=[a[3] for a in LEDGER_ACCOUNTS])
+    mean = np.array([a[2] for a in LEDGER_ACCOUNTS], dtype=np.float64)[account]
+    sign = np.where(np.array([a[1] == 'costo' for a in LEDGER_ACCOUNTS])[account], -1.0, 1.0)
+    amount = sign * rng.lognormal(np.log(mean), 0.35)
+    return pd.DataFrame({
+        'entry_id': np.arange(size, dtype=np.int64),
+        'date': dates.to_numpy()[day],
+        'account': _categorical(account, [a[0] for a in LEDGER_ACCOUNTS]),
+        'kind': _categorical(np.where(sign > 0, 0, 1), ['ingreso', 'costo']),
+        'amount_mxn': amount.round(2),
+    })
+
+
+def generate_dataset(flights=100_000, scans=None, surveys=None, ledger=None, seed=0,
+                     start='2023-01-01', days=365):
+    """Las cuatro tablas con tamaños proporcionales a ``flights`` si no se indican"""
+    flights_df = generate_flights(flights, seed, start, days)
+    return {
+        'flights': flights_df,
+        'scans': generate_passenger_scans(flights_df, scans if scans is not None else flights * 10, seed),
+        'surveys': generate_surveys(surveys if surveys is not None else flights // 2, seed, start, days),
+        'ledger': generate_ledger(ledger if ledger is not None else flights // 4, seed, start, days),
+    }
+
+
+def write_dataset(dataset, directory):
+    """Escribe cada tabla como Parquet (si hay pyarrow) o CSV; devuelve las rutas"""
+    os.makedirs(directory, exist_ok=True)
+    try:
+        import pyarrow  # noqa: F401
+        extension = 'parquet'
+    except ImportError:
+        extension = 'csv'
+    paths = {}
+    for name, frame in dataset.items():
+        path = paths[name] = os.path.join(directory, f'{name}.{extension}')
+        if extension == 'parquet':
+            frame.to_parquet(path, index=False)
+        else:
+            frame.to_csv(path, index=False)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera un dataset sintético reproducible del AIFA")
+    parser.add_argument('--flights', type=int, default=100_000, help='movimientos de vuelo (default: 100000)')
+    parser.add_argument('--scans', type=int, help='lecturas de pase (default: 10 × vuelos)')
+    parser.add_argument('--surveys', type=int, help='encuestas (default: vuelos / 2)')
+    parser.add_argument('--ledger', type=int, help='asientos contables (default: vuelos / 4)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--start', default='2023-01-01', help='primer día (default: 2023-01-01)')
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--out', help='directorio de salida; sin él solo se reporta')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dataset = generate_dataset(args.flights, args.scans, args.surveys, args.ledger,
+                               args.seed, args.start, args.days)
+    elapsed = time.perf_counter() - start
+    for name, frame in dataset.items():
+        print(f"{name:8} {len(frame):>12,} filas  {frame.memory_usage(deep=True).sum() / 1e6:>9.1f} MB")
+    print(f"Generado en {elapsed:.2f} s (seed={args.seed})")
+    if args.out:
+        for name, path in write_dataset(dataset, args.out).items():
+            print(f"  {path}")
+
+
+if __name__ == '__main__':
+    main()
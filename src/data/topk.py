@@ -0,0 +1,160 @@
+"""
+Top-K de destinos por pasajeros, actualizado en streaming.
+
+Cada evento de pasajeros (ciudad, cantidad) suma en un count-min sketch y
+ajusta un heap de mínimos con los K destinos más fuertes:
+
+  * ``CountMinSketch``: ``depth`` filas de ``width`` contadores; la
+    estimación de una ciudad es el mínimo de sus contadores, nunca menor
+    que el valor real. Memoria fija, sin importar cuántas ciudades lleguen.
+  * ``TopK``: heap indexado por ciudad. Si la ciudad ya está en el top su
+    conteo sube y se reacomoda; si no, entra en lugar de la raíz (la más
+    débil) cuando su estimación la supera. O(depth + log K) por evento.
+
+El tracker de destinos (``destination_tracker``) arranca con los pasajeros
+anuales de la tabla de rutas y recibe eventos nuevos con
+``record_passengers`` (p. ej. desde ``POST /_admin/passengers``,
+``src/perf/passenger_feed.py``). ``revision`` cuenta los eventos: el panel
+del tab geográfico tiene su propio callback fuera del layout cacheado y solo
+se vuelve a dibujar cuando cambia (``update_top_destinations`` de
+``src/layouts/geographic.py`` lee el mismo top). El tracker vive en memoria del proceso;
+con varios workers cada uno cuenta los eventos que recibió.
+"""
+
+import hashlib
+import threading
+
+import numpy as np
+
+from .routes import route_table
+
+TOP_K = 8
+SKETCH_WIDTH = 2048
+SKETCH_DEPTH = 4
+
+
+class CountMinSketch:
+    """Conteos aproximados (sobreestimados) en memoria fija"""
+
+    def __init__(self, width=SKETCH_WIDTH, depth=SKETCH_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self._rows = np.arange(depth)
+
+    def _columns(self, key):
+        # Un hash por fila, estable entre procesos (a diferencia de hash())
+        digest = hashlib.blake2b(str(key).encode('utf-8'), digest_size=8 * self.depth).digest()
+        return np.frombuffer(digest, dtype=np.uint64) % np.uint64(self.width)
+
+    def add(self, key, count=1):
+        """Suma ``count`` a ``key`` y devuelve su nueva estimación"""
+        columns = self._columns(key)
+        self.table[self._rows, columns] += count
+        return self.table[self._rows, columns].min().item()
+
+    def estimate(self, key):
+        return self.table[self._rows, self._columns(key)].min().item()
+
+
+class TopK:
+    """Los ``k`` elementos con mayor conteo estimado, por eventos"""
+
+    def __init__(self, k=TOP_K, width=SKETCH_WIDTH, depth=SKETCH_DEPTH):
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self._heap = []       # [conteo, clave], la raíz es la más débil del top
+        self._position = {}   # clave -> índice en el heap
+        self._lock = threading.Lock()
+        self.revision = 0     # eventos registrados
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, key):
+        return key in self._position
+
+    def add(self, key, count=1):
+        """Registra un evento de ``count`` para ``key``"""
+        with self._lock:
+            self.revision += 1
+            estimate = self.sketch.add(key, count)
+            position = self._position.get(key)
+            if position is not None:
+                self._heap[position][0] = estimate
+                self._sift_down(position)
+            elif len(self._heap) < self.k:
+                self._heap.append([estimate, key])
+                self._position[key] = len(self._heap) - 1
+                self._sift_up(len(self._heap) - 1)
+            elif estimate > self._heap[0][0]:
+                del self._position[self._heap[0][1]]
+                self._heap[0] = [estimate, key]
+                self._position[key] = 0
+                self._sift_down(0)
+
+    def top(self):
+        """``[(clave, conteo), ...]`` de mayor a menor"""
+        with self._lock:
+            items = [(key, count) for count, key in self._heap]
+        return sorted(items, key=lambda item: -item[1])
+
+    def _swap(self, i, j):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._position[heap[i][1]] = i
+        self._position[heap[j][1]] = j
+
+    def _sift_up(self, i):
+        while i > 0:
+            parent = (i - 1) // 2
+            if self._heap[parent][0] <= self._heap[i][0]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        size = len(self._heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < size and self._heap[child][0] < self._heap[smallest][0]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def destination_tracker(table=None):
+    """Top-K de destinos del proceso, sembrado con los pasajeros anuales de la tabla de rutas"""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                tracker = TopK()
+                table = route_table() if table is None else table
+                for city, passengers in zip(table.city, table.passengers.tolist()):
+                    tracker.add(city, passengers)
+                _tracker = tracker
+    return _tracker
+
+
+def record_passengers(city, passengers):
+    """Evento de pasajeros hacia ``city`` (abordajes, vuelos operados)"""
+    destination_tracker().add(city, passengers)
+
+
+def top_destinations(table=None, k=TOP_K):
+    """Registros de ``table`` (default: ``route_table()``) para el top actual, con los pasajeros del tracker"""
+    table = route_table() if table is None else table
+    rows = table.city_index
+    ranked = [(city, count) for city, count in destination_tracker(table).top() if city in rows][:k]
+    records = table.records([rows[city] for city, _ in ranked])
+    for record, (_, count) in zip(records, ranked):
+        record['passengers'] = count
+    return records
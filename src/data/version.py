@@ -0,0 +1,99 @@
+"""
+Versión de datos usada como parte de las llaves de caché.
+
+La versión combina una huella del código (app.py, src/ y style.css) con la
+huella de los datos cargados. Mientras ambas coincidan, todos los workers
+calculan la misma versión y pueden compartir entradas de caché en disco; al
+desplegar código nuevo o al cambiar los datos, las entradas anteriores dejan
+de usarse.
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+_lock = threading.Lock()
+_code_fingerprint = None
+_data_fingerprints = {}
+_version = None
+_changed_at = None
+_listeners = []
+
+
+def code_fingerprint():
+    """Hash del contenido de app.py, los módulos bajo src/ y assets/style.css"""
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        digest = hashlib.sha1()
+        # style.css incluye las clases sx-* que referencian los layouts cacheados
+        paths = [os.path.join(_ROOT, 'app.py'), os.path.join(_ROOT, 'assets', 'style.css')]
+        for directory, _, files in os.walk(os.path.join(_ROOT, 'src')):
+            paths.extend(os.path.join(directory, name) for name in files if name.endswith('.py'))
+        for path in sorted(paths):
+            try:
+                with open(path, 'rb') as f:
+                    digest.update(os.path.relpath(path, _ROOT).encode('utf-8'))
+                    digest.update(f.read())
+            except OSError:
+                continue
+        _code_fingerprint = digest.hexdigest()[:12]
+    return _code_fingerprint
+
+
+def add_version_listener(listener):
+    """Registra ``listener(version)``, llamado cuando una fuente ya cargada trae datos distintos"""
+    _listeners.append(listener)
+
+
+def data_changed_at():
+    """``time.monotonic()`` del último cambio de datos (o de la primera carga); ``None`` sin datos"""
+    return _changed_at
+
+
+def set_data_fingerprint(source, fingerprint):
+    """Registra la huella de una fuente de datos; cambia la versión si difiere"""
+    global _version, _changed_at
+    with _lock:
+        # La primera carga de una fuente no es un cambio de datos: solo entra en la versión
+        known = source in _data_fingerprints
+        changed = _data_fingerprints.get(source) != fingerprint
+        if changed:
+            _data_fingerprints[source] = fingerprint
+            _version = None
+            if known or _changed_at is None:
+                _changed_at = time.monotonic()
+    if changed and known and _listeners:
+        version = data_version()
+        for listener in list(_listeners):
+            listener(version)
+
+
+def _digest(sources):
+    digest = hashlib.sha1(code_fingerprint().encode('utf-8'))
+    digest.update(os.environ.get('AIFA_DATA_VERSION', '').encode('utf-8'))
+    for source in sorted(sources):
+        digest.update(f"{source}={_data_fingerprints.get(source)}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def data_version():
+    """Versión actual: código + ``AIFA_DATA_VERSION`` + huellas de datos"""
+    global _version
+    version = _version
+    if version is None:
+        with _lock:
+            version = _version = _digest(_data_fingerprints)
+    return version
+
+
+def base_version():
+    """Código + ``AIFA_DATA_VERSION``, sin huellas de datos"""
+    return sources_version(())
+
+
+def sources_version(sources):
+    """Versión de lo que solo depende de ``sources``: no cambia al cargarse otras fuentes"""
+    with _lock:
+        return _digest(sources)
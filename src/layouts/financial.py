@@ -1,50 +1,46 @@
-import dash
 from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
-from dash_iconify import DashIconify
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from ..data.simulated_data import generate_financial_data
+from ..data.accessors import get_financial_data
 
-# Generate data
-financial_data = generate_financial_data()
-
-layout = html.Div([
-    html.H4("Análisis Financiero", className="page-title"),
-    html.P("Performance financiero y rentabilidad", className="page-subtitle"),
-    
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Evolución de Ingresos", className="chart-title"),
-                    html.Small("Millones MXN", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="revenue-trend")
-                ])
-            ], className="chart-card")
-        ], width=8),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Margen EBITDA", className="chart-title"),
-                    html.Small("Rentabilidad operativa", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="ebitda-margin")
-                ])
-            ], className="chart-card")
-        ], width=4)
+def layout():
+    """Layout con los datos vigentes (Dash acepta layouts invocables)"""
+    return html.Div([
+        html.H4("Análisis Financiero", className="page-title"),
+        html.P("Performance financiero y rentabilidad", className="page-subtitle"),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Evolución de Ingresos", className="chart-title"),
+                        html.Small("Millones MXN", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="revenue-trend")
+                    ])
+                ], className="chart-card")
+            ], width=8),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Margen EBITDA", className="chart-title"),
+                        html.Small("Rentabilidad operativa", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="ebitda-margin")
+                    ])
+                ], className="chart-card")
+            ], width=4)
+        ])
     ])
-])
 
 @callback(
     Output('revenue-trend', 'figure'),
     Input('revenue-trend', 'id')
 )
 def update_revenue_trend(_):
+    financial_data = get_financial_data()
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
@@ -77,6 +73,7 @@ def update_revenue_trend(_):
     Input('ebitda-margin', 'id')
 )
 def update_ebitda_margin(_):
+    financial_data = get_financial_data()
     current_margin = financial_data['margin'].iloc[-1]
     
     fig = go.Figure(go.Indicator(
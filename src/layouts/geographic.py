@@ -1,84 +1,79 @@
-import dash
 from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
-from dash_iconify import DashIconify
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from ..data.simulated_data import generate_route_data, generate_state_penetration
+from ..data.accessors import get_route_data, get_state_penetration
+from ..data.topk import top_destinations
 
-# Generate data
-route_data = generate_route_data()
-state_data = generate_state_penetration()
-
-layout = html.Div([
-    # World Route Map
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Red de Rutas Internacionales AIFA", className="chart-title"),
-                    html.Small("Conexiones actuales y tráfico de pasajeros", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="world-routes-map")
-                ])
-            ], className="chart-card")
-        ], width=12)
-    ], className="mb-4"),
-    
-    # Mexico Penetration Map and Route Performance
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Penetración por Estados", className="chart-title"),
-                    html.Small("Participación de mercado nacional", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="mexico-penetration-map")
-                ])
-            ], className="chart-card")
-        ], width=8),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Top Destinos", className="chart-title"),
-                    html.Small("Por volumen de pasajeros", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    html.Div(id="top-destinations-list")
-                ])
-            ], className="chart-card")
-        ], width=4)
-    ], className="mb-4"),
-    
-    # Route Performance Charts
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Factor de Carga por Ruta", className="chart-title"),
-                    html.Small("Eficiencia operativa", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="load-factor-chart")
-                ])
-            ], className="chart-card")
-        ], width=6),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Frecuencias vs Pasajeros", className="chart-title"),
-                    html.Small("Optimización de rutas", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="frequency-passengers-chart")
-                ])
-            ], className="chart-card")
-        ], width=6)
+def layout():
+    """Layout con los datos vigentes (Dash acepta layouts invocables)"""
+    return html.Div([
+        # World Route Map
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Red de Rutas Internacionales AIFA", className="chart-title"),
+                        html.Small("Conexiones actuales y tráfico de pasajeros", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="world-routes-map")
+                    ])
+                ], className="chart-card")
+            ], width=12)
+        ], className="mb-4"),
+        
+        # Mexico Penetration Map and Route Performance
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Penetración por Estados", className="chart-title"),
+                        html.Small("Participación de mercado nacional", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="mexico-penetration-map")
+                    ])
+                ], className="chart-card")
+            ], width=8),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Top Destinos", className="chart-title"),
+                        html.Small("Por volumen de pasajeros", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        html.Div(id="top-destinations-list")
+                    ])
+                ], className="chart-card")
+            ], width=4)
+        ], className="mb-4"),
+        
+        # Route Performance Charts
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Factor de Carga por Ruta", className="chart-title"),
+                        html.Small("Eficiencia operativa", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="load-factor-chart")
+                    ])
+                ], className="chart-card")
+            ], width=6),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Frecuencias vs Pasajeros", className="chart-title"),
+                        html.Small("Optimización de rutas", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="frequency-passengers-chart")
+                    ])
+                ], className="chart-card")
+            ], width=6)
+        ])
     ])
-])
 
 # Callbacks
 @callback(
@@ -86,6 +81,7 @@ layout = html.Div([
     Input('world-routes-map', 'id')
 )
 def update_world_routes(_):
+    route_data = get_route_data()
     fig = go.Figure()
     
     # Add route lines
@@ -148,6 +144,7 @@ def update_world_routes(_):
     Input('mexico-penetration-map', 'id')
 )
 def update_mexico_penetration(_):
+    state_data = get_state_penetration()
     # Mexico states geojson simplified
     fig = go.Figure()
     
@@ -183,10 +180,8 @@ def update_mexico_penetration(_):
     Input('top-destinations-list', 'id')
 )
 def update_top_destinations(_):
-    sorted_routes = route_data.sort_values('passengers', ascending=False).head(8)
-    
     destinations = []
-    for _, route in sorted_routes.iterrows():
+    for route in top_destinations():
         destinations.append(
             html.Div([
                 html.Div([
@@ -217,6 +212,7 @@ def update_top_destinations(_):
     Input('load-factor-chart', 'id')
 )
 def update_load_factor(_):
+    route_data = get_route_data()
     sorted_routes = route_data.sort_values('load_factor', ascending=True)
     
     colors = ['#ff4757' if x < 80 else '#f59e0b' if x < 85 else '#00ff88' for x in sorted_routes['load_factor']]
@@ -251,6 +247,7 @@ def update_load_factor(_):
     Input('frequency-passengers-chart', 'id')
 )
 def update_frequency_passengers(_):
+    route_data = get_route_data()
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
@@ -1,11 +1,8 @@
-import dash
 from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
 from dash_iconify import DashIconify
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from ..data.simulated_data import generate_kpi_data, generate_historical_data, generate_airport_comparison
+from ..data.accessors import get_kpi_data, get_historical_data, get_airport_comparison
 
 def create_kpi_card(title, value, change, trend, icon, target=None):
     """Create a KPI card component"""
@@ -43,120 +40,118 @@ def create_kpi_card(title, value, change, trend, icon, target=None):
         ])
     ], className="kpi-card")
 
-# Generate data
-kpi_data = generate_kpi_data()
-historical_data = generate_historical_data()
-comparison_data = generate_airport_comparison()
-
 # Layout
-layout = html.Div([
-    # KPI Cards Row
-    dbc.Row([
-        dbc.Col([
-            create_kpi_card(
-                "Participación Nacional Pasajeros",
-                kpi_data['participation_passengers']['current'],
-                kpi_data['participation_passengers']['change'],
-                kpi_data['participation_passengers']['trend'],
-                "mdi:account-group",
-                kpi_data['participation_passengers']['target']
-            )
-        ], width=4),
-        dbc.Col([
-            create_kpi_card(
-                "Participación Nacional Operaciones",
-                kpi_data['participation_operations']['current'],
-                kpi_data['participation_operations']['change'],
-                kpi_data['participation_operations']['trend'],
-                "mdi:airplane-takeoff",
-                kpi_data['participation_operations']['target']
-            )
-        ], width=4),
-        dbc.Col([
-            create_kpi_card(
-                "Participación Nacional Carga",
-                kpi_data['participation_cargo']['current'],
-                kpi_data['participation_cargo']['change'],
-                kpi_data['participation_cargo']['trend'],
-                "mdi:package-variant",
-                kpi_data['participation_cargo']['target']
-            )
-        ], width=4)
-    ], className="mb-4"),
-    
-    dbc.Row([
-        dbc.Col([
-            create_kpi_card(
-                "Crecimiento vs Mercado",
-                kpi_data['growth_vs_market']['current'],
-                kpi_data['growth_vs_market']['change'],
-                kpi_data['growth_vs_market']['trend'],
-                "mdi:trending-up"
-            )
-        ], width=4),
-        dbc.Col([
-            create_kpi_card(
-                "Puntualidad de Vuelos",
-                kpi_data['punctuality']['current'],
-                kpi_data['punctuality']['change'],
-                kpi_data['punctuality']['trend'],
-                "mdi:clock-check-outline",
-                kpi_data['punctuality']['target']
-            )
-        ], width=4),
-        dbc.Col([
-            create_kpi_card(
-                "Utilización de Rutas",
-                kpi_data['route_utilization']['current'],
-                kpi_data['route_utilization']['change'],
-                kpi_data['route_utilization']['trend'],
-                "mdi:map-marker-path",
-                kpi_data['route_utilization']['target']
-            )
-        ], width=4)
-    ], className="mb-4"),
-    
-    # Charts Row
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Evolución Participación de Mercado", className="chart-title"),
-                    html.Small("Últimos 12 meses", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="participation-trend-chart")
-                ])
-            ], className="chart-card")
-        ], width=8),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Progreso Meta Anual", className="chart-title"),
-                    html.Small("Participación de pasajeros", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="progress-gauge")
-                ])
-            ], className="chart-card")
-        ], width=4)
-    ], className="mb-4"),
-    
-    # Comparison Table
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader([
-                    html.H5("Comparativo Aeropuertos Mexicanos", className="chart-title"),
-                    html.Small("Participación de mercado nacional", className="chart-subtitle")
-                ]),
-                dbc.CardBody([
-                    dcc.Graph(id="airport-comparison-chart")
-                ])
-            ], className="chart-card")
-        ], width=12)
+def layout():
+    """Layout con los datos vigentes (Dash acepta layouts invocables)"""
+    kpi_data = get_kpi_data()
+    return html.Div([
+        # KPI Cards Row
+        dbc.Row([
+            dbc.Col([
+                create_kpi_card(
+                    "Participación Nacional Pasajeros",
+                    kpi_data['participation_passengers']['current'],
+                    kpi_data['participation_passengers']['change'],
+                    kpi_data['participation_passengers']['trend'],
+                    "mdi:account-group",
+                    kpi_data['participation_passengers']['target']
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Participación Nacional Operaciones",
+                    kpi_data['participation_operations']['current'],
+                    kpi_data['participation_operations']['change'],
+                    kpi_data['participation_operations']['trend'],
+                    "mdi:airplane-takeoff",
+                    kpi_data['participation_operations']['target']
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Participación Nacional Carga",
+                    kpi_data['participation_cargo']['current'],
+                    kpi_data['participation_cargo']['change'],
+                    kpi_data['participation_cargo']['trend'],
+                    "mdi:package-variant",
+                    kpi_data['participation_cargo']['target']
+                )
+            ], width=4)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                create_kpi_card(
+                    "Crecimiento vs Mercado",
+                    kpi_data['growth_vs_market']['current'],
+                    kpi_data['growth_vs_market']['change'],
+                    kpi_data['growth_vs_market']['trend'],
+                    "mdi:trending-up"
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Puntualidad de Vuelos",
+                    kpi_data['punctuality']['current'],
+                    kpi_data['punctuality']['change'],
+                    kpi_data['punctuality']['trend'],
+                    "mdi:clock-check-outline",
+                    kpi_data['punctuality']['target']
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Utilización de Rutas",
+                    kpi_data['route_utilization']['current'],
+                    kpi_data['route_utilization']['change'],
+                    kpi_data['route_utilization']['trend'],
+                    "mdi:map-marker-path",
+                    kpi_data['route_utilization']['target']
+                )
+            ], width=4)
+        ], className="mb-4"),
+        
+        # Charts Row
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Evolución Participación de Mercado", className="chart-title"),
+                        html.Small("Últimos 12 meses", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="participation-trend-chart")
+                    ])
+                ], className="chart-card")
+            ], width=8),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Progreso Meta Anual", className="chart-title"),
+                        html.Small("Participación de pasajeros", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="progress-gauge")
+                    ])
+                ], className="chart-card")
+            ], width=4)
+        ], className="mb-4"),
+        
+        # Comparison Table
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Comparativo Aeropuertos Mexicanos", className="chart-title"),
+                        html.Small("Participación de mercado nacional", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="airport-comparison-chart")
+                    ])
+                ], className="chart-card")
+            ], width=12)
+        ])
     ])
-])
 
 # Callbacks for charts
 @callback(
@@ -164,6 +159,7 @@ layout = html.Div([
     Input('participation-trend-chart', 'id')
 )
 def update_participation_trend(_):
+    historical_data = get_historical_data()
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
@@ -223,6 +219,7 @@ def update_participation_trend(_):
     Input('progress-gauge', 'id')
 )
 def update_progress_gauge(_):
+    kpi_data = get_kpi_data()
     current = kpi_data['participation_passengers']['current']
     target = kpi_data['participation_passengers']['target']
     
@@ -262,6 +259,7 @@ def update_progress_gauge(_):
     Input('airport-comparison-chart', 'id')
 )
 def update_airport_comparison(_):
+    comparison_data = get_airport_comparison()
     fig = go.Figure()
     
     colors = ['#ff4757' if x < 0 else '#00ff88' for x in comparison_data['change']]
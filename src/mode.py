@@ -0,0 +1,42 @@
+"""
+Modo de servicio del dashboard, elegido con ``AIFA_MODE``.
+
+``full`` (default) sirve todos los tabs con todas las herramientas de
+rendimiento. ``lite`` es para instancias de borde y pantallas kiosko: solo
+los tabs de KPIs Estratégicos, Análisis Geográfico y Análisis Financiero, y
+defaults que evitan cargar lo que más memoria ocupa (procesos de
+``DiskcacheManager``, pool de figuras, telemetría en memoria). Como los tabs
+se importan al abrirse (``src.tabs``), en lite nunca se cargan los demás ni
+numpy/pandas.
+
+``apply_mode()`` debe llamarse antes de importar ``src.perf``: fija los
+defaults del modo sin pisar variables definidas explícitamente.
+"""
+
+import os
+
+MODES = ('full', 'lite')
+LITE_TABS = ('strategic', 'geographic', 'financial')
+LITE_DEFAULTS = {
+    'AIFA_BACKGROUND': '0',
+    'AIFA_FIGURE_POOL': 'off',
+    'AIFA_TELEMETRY': '0',
+}
+
+
+def current_mode():
+    mode = os.environ.get('AIFA_MODE', 'full').lower()
+    return mode if mode in MODES else 'full'
+
+
+def apply_mode():
+    """Aplica los defaults del modo actual y lo devuelve"""
+    mode = current_mode()
+    if mode == 'lite':
+        for key, value in LITE_DEFAULTS.items():
+            os.environ.setdefault(key, value)
+    return mode
+
+
+def tab_enabled(tab_id):
+    return current_mode() == 'full' or tab_id in LITE_TABS
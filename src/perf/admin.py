@@ -0,0 +1,52 @@
+"""
+Utilidades compartidas por los endpoints de administración (``/_admin/*``).
+
+Las peticiones deben enviar ``AIFA_ADMIN_TOKEN`` en el header
+``X-AIFA-Admin-Token`` o en el parámetro ``?token=``. Sin token configurado
+los endpoints responden 404 y nada se abre a cualquier cliente.
+"""
+
+import hmac
+import logging
+import os
+from functools import wraps
+
+from flask import abort, request
+
+ADMIN_PREFIX = '/_admin'
+TOKEN_HEADER = 'X-AIFA-Admin-Token'
+
+logger = logging.getLogger(__name__)
+
+
+def admin_token():
+    return os.environ.get('AIFA_ADMIN_TOKEN') or None
+
+
+def token_matches(value):
+    """True solo si hay token configurado y ``value`` coincide con él"""
+    token = admin_token()
+    return token is not None and value is not None and hmac.compare_digest(str(value), token)
+
+
+def require_token(feature):
+    """Avisa al activar ``feature`` sin ``AIFA_ADMIN_TOKEN``: sus endpoints quedan cerrados"""
+    if admin_token() is None:
+        logger.warning("%s activo sin AIFA_ADMIN_TOKEN: sus endpoints responden 404", feature)
+        return False
+    return True
+
+
+def admin_required(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if admin_token() is None:
+            abort(404)
+        if not token_matches(request.headers.get(TOKEN_HEADER) or request.args.get('token')):
+            abort(403)
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def flag_enabled(name):
+    return os.environ.get(name, '0').lower() in ('1', 'true', 'yes', 'on')
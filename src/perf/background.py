@@ -0,0 +1,142 @@
+"""
+Callbacks pesados en segundo plano con ``DiskcacheManager`` de Dash.
+
+Si ``diskcache``, ``multiprocess`` y ``psutil`` están instalados
+(``pip install "dash[diskcache]"``), ``background_callback`` registra el
+callback con ``background=True``: Dash lo ejecuta en un proceso aparte, el
+worker web queda libre para peticiones rápidas y el navegador consulta el
+resultado cada ``AIFA_BACKGROUND_POLL_MS`` (default 500). Sin esas
+dependencias, o con ``AIFA_BACKGROUND=0``, el callback corre en línea como
+cualquier otro y ``set_progress`` no hace nada.
+
+Convención para gráficas pesadas (``progress_graph`` + ``graph_progress``):
+el callback se dispara al montarse la gráfica (``Input(<id>, 'id')``),
+reporta avance en ``<id>-progress`` y se cancela al cambiar de tab.
+
+Si la función está envuelta en ``cached_output`` y su resultado ya está en
+caché, la primera petición se responde en línea con ese resultado y no se
+crea un job en el manager.
+"""
+
+import os
+import tempfile
+from functools import wraps
+
+import flask
+from dash import _callback as dash_callback
+from dash import html, dcc
+from dash.dependencies import Input, Output
+
+from .instrument import callback, callback_name, callback_outputs, instrument
+
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'aifa-background')
+# Clases de assets/style.css; se alterna className (no style) para no chocar con las clases sx-*
+PROGRESS_CLASS = 'background-progress'
+PROGRESS_RUNNING_CLASS = 'background-progress running'
+
+_manager = None
+_manager_loaded = False
+
+
+def background_enabled():
+    return os.environ.get('AIFA_BACKGROUND', '1') != '0'
+
+
+def background_manager():
+    """``DiskcacheManager`` compartido, o None si no está disponible"""
+    global _manager, _manager_loaded
+    if not _manager_loaded:
+        _manager_loaded = True
+        if background_enabled():
+            try:
+                import diskcache
+                from dash import DiskcacheManager
+                cache = diskcache.Cache(os.environ.get('AIFA_BACKGROUND_DIR', DEFAULT_DIRECTORY))
+                _manager = DiskcacheManager(cache, expire=int(os.environ.get('AIFA_BACKGROUND_EXPIRE', '600')))
+            except ImportError:
+                _manager = None
+    return _manager
+
+
+def _noop_progress(value):
+    pass
+
+
+def background_callback(*args, progress=None, running=None, cancel=None, **kwargs):
+    """Como ``callback``, en segundo plano cuando hay manager.
+
+    Con ``progress`` la función recibe ``set_progress`` como primer argumento
+    también en el modo en línea, para que su firma no dependa del manager.
+    """
+    manager = background_manager()
+
+    def decorator(func):
+        if manager is not None:
+            options = {key: value for key, value in
+                       (('progress', progress), ('running', running), ('cancel', cancel)) if value}
+            registered = callback(*args, background=True, manager=manager,
+                                  interval=int(os.environ.get('AIFA_BACKGROUND_POLL_MS', '500')),
+                                  **options, **kwargs)(func)
+            if hasattr(func, 'lookup'):
+                _serve_cached_inline(func, bool(progress), args, kwargs)
+            return registered
+        return callback(*args, **kwargs)(_with_noop_progress(func) if progress else func)
+    return decorator
+
+
+def _serve_cached_inline(func, with_progress, args, kwargs):
+    """Despacha en línea, sin job, cuando ``func.lookup`` ya tiene el resultado"""
+    entry = dash_callback.GLOBAL_CALLBACK_MAP[dash_callback.GLOBAL_CALLBACK_LIST[-1]['output']]
+    background_dispatch = entry['callback']
+    # Misma firma registrada sin background en un mapa aparte: Dash arma y valida la respuesta
+    scratch = {}
+    name = callback_name(callback_outputs(args, kwargs)) or func.__name__
+    inline = _with_noop_progress(func) if with_progress else func
+    dash_callback.register_callback([], scratch, False, *args, **kwargs)(instrument(name, 'callback')(inline))
+    inline_dispatch = next(iter(scratch.values()))['callback']
+
+    @wraps(background_dispatch)
+    def dispatch(*call_args, **call_kwargs):
+        # Solo la primera petición; las siguientes consultan un job ya creado (cacheKey)
+        if not flask.request.args.get('cacheKey'):
+            lookup_args = (_noop_progress,) + call_args if with_progress else call_args
+            if func.lookup(*lookup_args)[0]:
+                return inline_dispatch(*call_args, **call_kwargs)
+        return background_dispatch(*call_args, **call_kwargs)
+
+    entry['callback'] = dispatch
+
+
+def _with_noop_progress(func):
+    @wraps(func)
+    def inline(*args):
+        return func(_noop_progress, *args)
+    return inline
+
+
+def progress_graph(graph_id, **graph_kwargs):
+    """``dcc.Graph`` con barra de progreso para un callback en segundo plano"""
+    return html.Div([
+        html.Progress(id=f'{graph_id}-progress', value='0', max='1', className=PROGRESS_CLASS),
+        dcc.Graph(id=graph_id, **graph_kwargs)
+    ])
+
+
+def graph_progress(graph_id, stages=False):
+    """Argumentos de ``background_callback`` para una gráfica de ``progress_graph``.
+
+    Con ``stages`` la función recibe ``set_progress`` y reporta ``(hechas, total)``;
+    sin él la barra solo indica que el job está corriendo.
+    """
+    options = {
+        'running': [(Output(f'{graph_id}-progress', 'className'), PROGRESS_RUNNING_CLASS, PROGRESS_CLASS)],
+        'cancel': [Input('tabs', 'active_tab')],
+    }
+    if stages:
+        options['progress'] = [Output(f'{graph_id}-progress', 'value'), Output(f'{graph_id}-progress', 'max')]
+    return options
+
+
+def mount_input(graph_id):
+    """Input que dispara el callback cuando la gráfica aparece en el layout"""
+    return Input(graph_id, 'id')
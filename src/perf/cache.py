@@ -0,0 +1,202 @@
+"""
+Caché de layouts de tabs y figuras ya serializados.
+
+Los valores se guardan como estructuras JSON puras (dicts/listas) para que
+Dash no tenga que volver a recorrer componentes ni validar figuras Plotly
+en cada respuesta. Hay dos niveles: un LRU en proceso y la caché en disco
+(``disk_cache``) compartida entre workers.
+
+La llave de cada entrada usa la versión de las fuentes de datos que leyó al
+calcularse (``track_reads`` / ``sources_version``), no la versión global: al
+abrir un tab por primera vez se cargan sus fuentes, y eso no invalida lo que
+otros tabs ya tenían en caché. Las fuentes de cada entrada se recuerdan en
+proceso y en disco, así que otro worker con esas fuentes cargadas calcula la
+misma llave. También entra la variante de render (``AIFA_MODE`` y
+``AIFA_STYLE_CLASSES``), para que instancias con otra configuración no se pisen.
+"""
+
+import contextvars
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from plotly.io.json import to_json_plotly
+
+from ..data.accessors import load_sources, track_reads
+from ..data.version import base_version, sources_version
+from ..mode import current_mode
+from . import disk_cache as disk_cache_module
+from . import styles
+from .instrument import span
+from .tracing import current_span
+
+
+class ResponseCache:
+    """LRU thread-safe de respuestas serializadas"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / total if total else 0.0,
+            }
+
+
+response_cache = ResponseCache()
+disk_cache = disk_cache_module.from_environment()
+# (versión base, variante, nombre, *argumentos) -> fuentes que leyó la entrada
+_sources = {}
+
+# Permite recalcular sin caché dentro de una petición (p. ej. al perfilarla)
+bypass_cache = contextvars.ContextVar('aifa_bypass_cache', default=False)
+# Marcas de la llamada en curso: un resultado parcial (p. ej. con una figura fallida) no se guarda
+_uncacheable = contextvars.ContextVar('aifa_uncacheable', default=None)
+
+
+def mark_uncacheable():
+    """El resultado que se está calculando no debe guardarse en caché"""
+    marks = _uncacheable.get()
+    if marks is not None:
+        marks.append(True)
+
+
+def _compute(name, func, args):
+    # Devuelve (texto, valor, guardable); las marcas se propagan al cached_output exterior
+    marks = []
+    token = _uncacheable.set(marks)
+    try:
+        text, value = _serialize(name, func(*args))
+    finally:
+        _uncacheable.reset(token)
+    if marks:
+        mark_uncacheable()
+    return text, value, not marks
+
+
+def render_variant():
+    """Configuración que cambia el árbol renderizado: modo y clases de estilo"""
+    return f"{current_mode()}:{'sx' if styles.is_enabled() else 'inline'}"
+
+
+def _serialize(name, result):
+    with span(name, 'serialization'):
+        text = to_json_plotly(result)
+        return text, json.loads(text)
+
+
+def _known_sources(entry, disk_key):
+    """Fuentes que leyó ``entry`` la última vez, en este proceso o en otro worker; None si no se sabe"""
+    sources = _sources.get(entry)
+    if sources is None and disk_cache is not None:
+        found, text = disk_cache.get(disk_key)
+        if found:
+            sources = _sources[entry] = json.loads(text)
+    return sources
+
+
+def _lookup(entry, suffix, sources_key):
+    """``(found, value, nivel)`` de ``entry`` en el LRU o en disco, sin calcular"""
+    sources = _known_sources(entry, sources_key)
+    if sources is None or not load_sources(sources):
+        return False, None, None
+    version = sources_version(sources)
+    found, value = response_cache.get((version,) + entry[1:])
+    if found:
+        return True, value, 'hit'
+    if disk_cache is not None:
+        found, text = disk_cache.get(f"{version}|{suffix}")
+        if found:
+            value = json.loads(text)
+            response_cache.set((version,) + entry[1:], value)
+            return True, value, 'disk'
+    return False, None, None
+
+
+def cached_output(name, vary_on=()):
+    """Cachea el resultado serializado de un render o callback de figura.
+
+    ``vary_on`` indica qué argumentos posicionales forman parte de la llave;
+    el resto (p. ej. ``n_intervals``) se ignora porque no cambia el resultado.
+    ``wrapper.lookup(*args)`` consulta la caché sin calcular: ``(found, value)``.
+    """
+    def decorator(func):
+        def locate(args):
+            variant = render_variant()
+            varying = tuple(args[i] if i < len(args) else None for i in vary_on)
+            base = base_version()
+            entry = (base, variant, name) + varying
+            suffix = f"{variant}|{name}|{json.dumps(varying, default=str)}"
+            return base, entry, suffix
+
+        def lookup(*args):
+            if bypass_cache.get():
+                return False, None
+            base, entry, suffix = locate(args)
+            return _lookup(entry, suffix, f"{base}|{suffix}|sources")[:2]
+
+        @wraps(func)
+        def wrapper(*args):
+            if bypass_cache.get():
+                current_span().set_attribute('cache', 'bypass')
+                return _serialize(name, func(*args))[1]
+            base, entry, suffix = locate(args)
+            found, value, level = _lookup(entry, suffix, f"{base}|{suffix}|sources")
+            if found:
+                current_span().set_attribute('cache', level)
+                return value
+
+            current_span().set_attribute('cache', 'miss')
+            with track_reads() as reads:
+                text, value, cacheable = _compute(name, func, args)
+            if not cacheable:
+                current_span().set_attribute('cache', 'uncacheable')
+                return value
+            # La llave se calcula después de correr: incluye las fuentes que se cargaron al hacerlo
+            sources = sorted(reads)
+            _sources[entry] = sources
+            version = sources_version(sources)
+            response_cache.set((version,) + entry[1:], value)
+            if disk_cache is not None:
+                disk_cache.set(f"{base}|{suffix}|sources", base, json.dumps(sources))
+                disk_cache.set(f"{version}|{suffix}", base, text)
+            return value
+
+        wrapper.cache_name = name
+        wrapper.lookup = lookup
+        return wrapper
+    return decorator
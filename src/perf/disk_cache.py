@@ -0,0 +1,156 @@
+"""
+Caché persistente en SQLite para layouts y figuras serializados.
+
+Sobrevive al reciclaje de workers (``max_requests``) y se comparte entre
+todos los workers de la instancia. Cada entrada guarda la versión base
+(código + ``AIFA_DATA_VERSION``) con la que se generó; al superar
+``max_bytes`` se eliminan primero las entradas de otras versiones y después
+las menos usadas recientemente.
+
+Configuración por variables de entorno:
+    AIFA_DISK_CACHE=0          desactiva la caché en disco
+    AIFA_CACHE_DIR=<ruta>      directorio (default: <tmp>/aifa-dashboard-cache)
+    AIFA_CACHE_MAX_MB=<n>      tamaño máximo (default: 64)
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'aifa-dashboard-cache')
+FILENAME = 'responses.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+class DiskCache:
+    """Almacén llave/valor en SQLite con expulsión por tamaño"""
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.path = os.path.join(directory, FILENAME)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._local = threading.local()
+        self._evict_lock = threading.Lock()
+        self._bytes_since_evict = 0
+
+    def _connection(self):
+        # Una conexión por hilo y por proceso: las conexiones no sobreviven a fork()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        """Devuelve (encontrado, texto JSON)"""
+        try:
+            conn = self._connection()
+            row = conn.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self.hits += 1
+            return True, row[0]
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Lectura de caché en disco falló", exc_info=True)
+            return False, None
+
+    def set(self, key, version, value):
+        size = len(value.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        try:
+            self._connection().execute(
+                'INSERT OR REPLACE INTO entries (key, version, value, size, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (key, version, value, size, time.time()))
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Escritura de caché en disco falló", exc_info=True)
+            return
+        self._bytes_since_evict += size
+        if self._bytes_since_evict >= self.max_bytes // 20:
+            self.evict(version)
+
+    def evict(self, current_version=None):
+        """Reduce la caché a ``max_bytes``: primero otras versiones, luego LRU"""
+        with self._evict_lock:
+            self._bytes_since_evict = 0
+            try:
+                conn = self._connection()
+                total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+                if total <= self.max_bytes:
+                    return 0
+                removed = 0
+                if current_version is not None:
+                    removed += conn.execute('DELETE FROM entries WHERE version != ?', (current_version,)).rowcount
+                    total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+                excess = total - self.max_bytes
+                if excess > 0:
+                    victims, freed = [], 0
+                    for key, size in conn.execute('SELECT key, size FROM entries ORDER BY accessed_at'):
+                        victims.append((key,))
+                        freed += size
+                        if freed >= excess:
+                            break
+                    conn.executemany('DELETE FROM entries WHERE key = ?', victims)
+                    removed += len(victims)
+                return removed
+            except sqlite3.Error:
+                self.errors += 1
+                logger.warning("Expulsión de caché en disco falló", exc_info=True)
+                return 0
+
+    def clear(self):
+        self._connection().execute('DELETE FROM entries')
+
+    def stats(self):
+        try:
+            entries, size = self._connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        total = self.hits + self.misses
+        return {
+            'path': self.path,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'errors': self.errors,
+            'hit_ratio': self.hits / total if total else 0.0,
+        }
+
+
+def from_environment():
+    """Instancia configurada por variables de entorno, o None si está desactivada"""
+    if os.environ.get('AIFA_DISK_CACHE', '1') == '0':
+        return None
+    directory = os.environ.get('AIFA_CACHE_DIR', DEFAULT_DIRECTORY)
+    max_mb = float(os.environ.get('AIFA_CACHE_MAX_MB', '64'))
+    return DiskCache(directory, int(max_mb * 1024 * 1024))
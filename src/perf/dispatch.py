@@ -0,0 +1,147 @@
+"""
+Construcción de peticiones ``_dash-update-component`` como las que envía el
+navegador, a partir de ``/_dash-dependencies`` y ``/_dash-layout``.
+
+Se usa para pre-calentar cachés y para medir callbacks con el test client
+de Flask sin depender de un navegador.
+"""
+
+DEPENDENCIES_URL = '/_dash-dependencies'
+LAYOUT_URL = '/_dash-layout'
+DISPATCH_URL = '/_dash-update-component'
+TABS_ID = 'tabs'
+TAB_CONTENT_OUTPUT = 'tab-content.children'
+# Reloj del header y polling de datos
+INTERVAL_INPUTS = (('interval-component', 'n_intervals'), ('data-interval', 'n_intervals'))
+
+
+def output_specs(dep):
+    """Lista de (id, propiedad) de las salidas de un callback"""
+    key = dep['output']
+    parts = key[2:-2].split('...') if key.startswith('..') else [key]
+    return [tuple(part.rsplit('.', 1)) for part in parts]
+
+
+def _wire_outputs(dep):
+    specs = [{'id': cid, 'property': prop} for cid, prop in output_specs(dep)]
+    return specs if dep['output'].startswith('..') else specs[0]
+
+
+def default_value(cid, prop, tab=None, n_intervals=0):
+    """Valor inicial que el navegador enviaría para una entrada"""
+    if (cid, prop) == (TABS_ID, 'active_tab'):
+        return tab
+    if prop == 'n_intervals':
+        return n_intervals
+    return None
+
+
+def build_payload(dep, tab=None, n_intervals=0, changed=(), overrides=None):
+    """Cuerpo JSON de ``_dash-update-component`` para un callback"""
+    overrides = overrides or {}
+
+    def wire(items):
+        return [{'id': item['id'], 'property': item['property'],
+                 'value': overrides.get((item['id'], item['property']),
+                                        default_value(item['id'], item['property'], tab, n_intervals))}
+                for item in items]
+
+    return {
+        'output': dep['output'],
+        'outputs': _wire_outputs(dep),
+        'inputs': wire(dep['inputs']),
+        'state': wire(dep['state']),
+        'changedPropIds': list(changed),
+    }
+
+
+def collect_ids(node, ids=None):
+    """IDs de todos los componentes de un árbol serializado"""
+    ids = set() if ids is None else ids
+    if isinstance(node, dict):
+        if 'props' in node and 'type' in node:
+            props = node['props'] or {}
+            if isinstance(props.get('id'), str):
+                ids.add(props['id'])
+            for value in props.values():
+                collect_ids(value, ids)
+    elif isinstance(node, list):
+        for child in node:
+            collect_ids(child, ids)
+    return ids
+
+
+def _find_component(node, component_id):
+    if isinstance(node, dict) and 'props' in node:
+        props = node['props'] or {}
+        if props.get('id') == component_id:
+            return node
+        return _find_component(props.get('children'), component_id)
+    if isinstance(node, list):
+        for child in node:
+            found = _find_component(child, component_id)
+            if found is not None:
+                return found
+    return None
+
+
+def tab_ids_from_layout(layout):
+    tabs = _find_component(layout, TABS_ID)
+    children = tabs['props']['children'] if tabs else []
+    return [child['props']['tab_id'] for child in children]
+
+
+def _dep_ids(dep):
+    return {cid for cid, _ in output_specs(dep)} | {i['id'] for i in dep['inputs']} | {s['id'] for s in dep['state']}
+
+
+def build_plan(client):
+    """Plan de peticiones por tab: layout + callbacks que dispara al abrirse.
+
+    Devuelve ``{'tabs': {tab_id: {'layout': payload, 'callbacks': [(dep, payload)]}},
+    'global': [(dep, payload)]}`` donde ``global`` son callbacks cuyo
+    layout completo vive en el header (p. ej. la hora de actualización).
+    """
+    layout = client.get(LAYOUT_URL).get_json()
+    deps = [dep for dep in client.get(DEPENDENCIES_URL).get_json() if not dep.get('clientside_function')]
+    layout_ids = collect_ids(layout)
+    tab_dep = next(dep for dep in deps if dep['output'] == TAB_CONTENT_OUTPUT)
+
+    plan = {'tabs': {}, 'global': []}
+    for dep in deps:
+        if dep is not tab_dep and _dep_ids(dep) <= layout_ids:
+            plan['global'].append((dep, build_payload(dep)))
+
+    for tab in tab_ids_from_layout(layout):
+        layout_payload = build_payload(tab_dep, tab=tab, changed=[f'{TABS_ID}.active_tab'])
+        response = client.post(DISPATCH_URL, json=layout_payload)
+        body = response.get_json() or {}
+        tab_tree = body.get('response', {}).get('tab-content', {}).get('children')
+        available = layout_ids | collect_ids(tab_tree)
+        callbacks = [(dep, build_payload(dep, tab=tab))
+                     for dep in deps
+                     if dep is not tab_dep and _dep_ids(dep) <= available and not _dep_ids(dep) <= layout_ids]
+        plan['tabs'][tab] = {'layout': layout_payload, 'callbacks': callbacks}
+    return plan
+
+
+def with_response_state(payload, response):
+    """``payload`` con el State que el navegador ya tendría tras ``response`` (p. ej. stores de revisión)"""
+    body = (response.get_json() if response is not None and response.status_code == 200 else None) or {}
+    outputs = body.get('response', {})
+    state = [dict(item, value=outputs[item['id']][item['property']])
+             if item['property'] in outputs.get(item['id'], {}) else item
+             for item in payload['state']]
+    return dict(payload, state=state)
+
+
+def interval_trigger(dep):
+    """``'<id>.n_intervals'`` del intervalo que dispara el callback, o ``None``"""
+    for item in dep['inputs']:
+        if (item['id'], item['property']) in INTERVAL_INPUTS:
+            return f"{item['id']}.{item['property']}"
+    return None
+
+
+def is_interval_driven(dep):
+    return interval_trigger(dep) is not None
@@ -0,0 +1,114 @@
+"""
+Punto único de instrumentación para callbacks, renders de tabs y figuras.
+
+``callback`` reemplaza a ``dash.callback``: registra el callback igual que
+Dash pero lo envuelve con ``instrument`` usando el id de sus salidas como
+nombre, y envuelve también el despacho de Dash (validación y serialización
+de la respuesta) en un span ``dispatch``. ``instrument`` también decora
+directamente ``render_*_tab``, los constructores de figuras y los accesores
+de datos.
+
+Los módulos de diagnóstico (memoria, logging, trazas, telemetría) registran
+hooks con ``register_hook``: cada hook es ``hook(name, kind)`` y devuelve un
+context manager que envuelve la ejecución. Sin hooks registrados el costo es
+una llamada extra a función.
+"""
+
+import itertools
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+import dash
+from dash import _callback as dash_callback
+from dash.dependencies import Output
+
+_hooks = []
+
+
+def register_hook(hook):
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def unregister_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+@contextmanager
+def span(name, kind):
+    """Ejecuta un bloque dentro de los hooks registrados.
+
+    ``kind`` es uno de 'callback', 'layout', 'figure', 'data', 'serialization'
+    o 'dispatch'.
+    """
+    with ExitStack() as stack:
+        for hook in list(_hooks):
+            stack.enter_context(hook(name, kind))
+        yield
+
+
+def instrument(name=None, kind='figure'):
+    """Decorador: ejecuta la función dentro de ``span``"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _hooks:
+                return func(*args, **kwargs)
+            with span(label, kind):
+                return func(*args, **kwargs)
+
+        wrapper.instrument_name = label
+        wrapper.instrument_kind = kind
+        return wrapper
+    return decorator
+
+
+def callback_name(outputs):
+    """Id legible de un callback a partir de sus ``Output``"""
+    if isinstance(outputs, Output):
+        outputs = [outputs]
+    if isinstance(outputs, (list, tuple)):
+        ids = [f"{o.component_id}.{o.component_property}" for o in outputs if isinstance(o, Output)]
+        if ids:
+            return ids[0] if len(ids) == 1 else '..' + '...'.join(ids) + '..'
+    return None
+
+
+def callback_outputs(args, kwargs):
+    """``Output`` de un callback: con ``output=``, en lista o sueltos al inicio"""
+    if 'output' in kwargs:
+        return kwargs['output']
+    if args and isinstance(args[0], (list, tuple)):
+        return args[0]
+    loose = list(itertools.takewhile(lambda arg: isinstance(arg, Output), args))
+    return loose[0] if len(loose) == 1 else loose
+
+
+def callback(*args, **kwargs):
+    """Igual que ``dash.callback`` pero con la función instrumentada"""
+    outputs = callback_outputs(args, kwargs)
+
+    def decorator(func):
+        name = callback_name(outputs) or func.__name__
+        registered = dash.callback(*args, **kwargs)(instrument(name, 'callback')(func))
+        _instrument_dispatch(dash_callback.GLOBAL_CALLBACK_LIST[-1]['output'])
+        return registered
+    return decorator
+
+
+def _instrument_dispatch(callback_id):
+    """Envuelve la función que Dash llama al despachar ``callback_id``"""
+    entry = dash_callback.GLOBAL_CALLBACK_MAP[callback_id]
+    dispatch = entry['callback']
+
+    @wraps(dispatch)
+    def wrapper(*args, **kwargs):
+        if not _hooks:
+            return dispatch(*args, **kwargs)
+        with span(callback_id, 'dispatch'):
+            return dispatch(*args, **kwargs)
+
+    entry['callback'] = wrapper
@@ -0,0 +1,94 @@
+"""
+Memoización de factories de componentes Dash.
+
+Las tarjetas KPI y filas de tabla se construyen decenas de veces por cada
+render de tab con los mismos argumentos. ``memoize_component`` guarda el
+subárbol ya serializado (dicts ``{type, namespace, props}``) para que las
+siguientes llamadas no reconstruyan ni vuelvan a serializar los componentes.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from dash.development.base_component import Component
+
+from .styles import apply_style_classes
+
+_memoized = []
+
+
+def serialize_component(node):
+    """Convierte recursivamente un árbol de componentes en dicts JSON-ready"""
+    if isinstance(node, Component):
+        data = node.to_plotly_json()
+        data['props'] = {key: serialize_component(value) for key, value in data['props'].items()}
+        return data
+    if isinstance(node, (list, tuple)):
+        return [serialize_component(child) for child in node]
+    return node
+
+
+def memoize_component(func=None, *, maxsize=512):
+    """Decorador LRU para factories de componentes con argumentos hashables.
+
+    El valor cacheado es compartido entre llamadas: quien lo recibe no debe
+    modificarlo. Si algún argumento no es hashable se construye sin caché.
+    """
+    if func is None:
+        return lambda f: memoize_component(f, maxsize=maxsize)
+
+    cache = OrderedDict()
+    lock = threading.Lock()
+    stats = {'hits': 0, 'misses': 0}
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        try:
+            hash(key)
+        except TypeError:
+            return serialize_component(apply_style_classes(func(*args, **kwargs)))
+
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                stats['hits'] += 1
+                return cache[key]
+
+        node = serialize_component(apply_style_classes(func(*args, **kwargs)))
+        with lock:
+            stats['misses'] += 1
+            cache[key] = node
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+        return node
+
+    def cache_info():
+        with lock:
+            return {**stats, 'size': len(cache), 'maxsize': maxsize}
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            stats['hits'] = stats['misses'] = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.uncached = func
+    _memoized.append(wrapper)
+    return wrapper
+
+
+def memo_stats():
+    """Hits y misses sumados de todas las factories memoizadas"""
+    infos = [wrapper.cache_info() for wrapper in _memoized]
+    hits = sum(info['hits'] for info in infos)
+    total = hits + sum(info['misses'] for info in infos)
+    return {'hits': hits, 'misses': total - hits, 'hit_ratio': hits / total if total else 0.0}
+
+
+def clear_all_caches():
+    """Vacía la caché de todas las factories memoizadas"""
+    for wrapper in _memoized:
+        wrapper.cache_clear()
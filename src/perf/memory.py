@@ -0,0 +1,200 @@
+"""
+Huella de memoria por tab y por callback con snapshots de tracemalloc.
+
+Con ``AIFA_MEMORY_TRACE=1`` cada render de tab, constructor de figura y
+callback instrumentado se mide así:
+
+  * pico de memoria asignada durante la ejecución (``tracemalloc`` peak),
+    correcto también con llamadas anidadas
+  * snapshots antes y después del span más externo de cada petición; la
+    diferencia se atribuye a la primera línea de ``app.py`` (o de ``src/``)
+    en el traceback de cada asignación
+  * RSS del worker al terminar, más una serie de RSS muestreada en segundo
+    plano cada ``AIFA_MEMORY_SAMPLE_SECONDS`` (default 5)
+
+Los resultados se consultan en ``/_admin/memory`` (JSON, o ``?format=text``);
+sin ``AIFA_ADMIN_TOKEN`` no se activa nada y el endpoint responde 404.
+Las mediciones son exactas con workers ``sync``; con hilos concurrentes los
+picos de peticiones simultáneas se mezclan.
+"""
+
+import functools
+import linecache
+import os
+import resource
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+from flask import Response, jsonify, request
+
+from .admin import ADMIN_PREFIX, admin_required, flag_enabled, require_token
+from .instrument import register_hook
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+PROJECT_FILES = (os.path.join(ROOT, 'app.py'), os.path.join(ROOT, 'src') + os.sep)
+PERF_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+TRACED_KINDS = ('callback', 'layout', 'figure')
+TOP_LINES = 10
+
+_lock = threading.Lock()
+_local = threading.local()
+_spans = {}
+_rss_series = deque(maxlen=int(os.environ.get('AIFA_MEMORY_HISTORY', '720')))
+_sampler_pid = None
+
+
+def memory_trace_enabled():
+    return flag_enabled('AIFA_MEMORY_TRACE')
+
+
+def current_rss():
+    """RSS actual del proceso en bytes (Linux: /proc; otros: máximo histórico)"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if os.uname().sysname == 'Darwin' else usage * 1024
+
+
+def _sample_rss(interval):
+    while True:
+        _rss_series.append((round(time.time(), 1), current_rss()))
+        time.sleep(interval)
+
+
+def _ensure_sampler():
+    # Los hilos no sobreviven a fork(): cada worker arranca su propio muestreo
+    global _sampler_pid
+    if _sampler_pid == os.getpid():
+        return
+    with _lock:
+        if _sampler_pid != os.getpid():
+            _sampler_pid = os.getpid()
+            _rss_series.clear()
+            interval = float(os.environ.get('AIFA_MEMORY_SAMPLE_SECONDS', '5'))
+            threading.Thread(target=_sample_rss, args=(interval,), daemon=True,
+                             name='aifa-rss-sampler').start()
+
+
+@functools.lru_cache(maxsize=None)
+def _relpath(filename):
+    return os.path.relpath(filename, ROOT)
+
+
+def _project_frame(traceback):
+    for frame in reversed(traceback):
+        if frame.filename.startswith(PROJECT_FILES) and not frame.filename.startswith(PERF_DIR):
+            return frame
+    return None
+
+
+def _attribute(before, after):
+    """Bytes netos por línea del proyecto entre dos snapshots"""
+    by_line = {}
+    for stat in after.compare_to(before, 'traceback'):
+        if stat.size_diff == 0:
+            continue
+        frame = _project_frame(stat.traceback)
+        if frame is None:
+            continue
+        key = (_relpath(frame.filename), frame.lineno)
+        size, count = by_line.get(key, (0, 0))
+        by_line[key] = (size + stat.size_diff, count + stat.count_diff)
+    top = sorted(by_line.items(), key=lambda item: abs(item[1][0]), reverse=True)[:TOP_LINES]
+    return [{'file': filename, 'line': lineno, 'size_diff': size, 'count_diff': count,
+             'source': linecache.getline(os.path.join(ROOT, filename), lineno).strip()}
+            for (filename, lineno), (size, count) in top]
+
+
+def _record(name, kind, peak, lines, rss):
+    with _lock:
+        span = _spans.setdefault(name, {'kind': kind, 'calls': 0, 'max_peak': 0, 'total_peak': 0})
+        span['calls'] += 1
+        span['last_peak'] = peak
+        span['max_peak'] = max(span['max_peak'], peak)
+        span['total_peak'] += peak
+        span['last_rss'] = rss
+        span['last_at'] = time.time()
+        if lines:
+            span['top_lines'] = lines
+
+
+@contextmanager
+def memory_hook(name, kind):
+    if kind not in TRACED_KINDS or not tracemalloc.is_tracing():
+        yield
+        return
+    _ensure_sampler()
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        stack[-1]['peak_seen'] = max(stack[-1]['peak_seen'], peak)
+    tracemalloc.reset_peak()
+    frame = {'start': current, 'peak_seen': current}
+    # Los snapshots son caros: solo el span externo atribuye líneas
+    before = None if stack else tracemalloc.take_snapshot()
+    stack.append(frame)
+    try:
+        yield
+    finally:
+        stack.pop()
+        peak = max(frame['peak_seen'], tracemalloc.get_traced_memory()[1])
+        lines = _attribute(before, tracemalloc.take_snapshot()) if before else None
+        if stack:
+            stack[-1]['peak_seen'] = max(stack[-1]['peak_seen'], peak)
+        _record(name, kind, peak - frame['start'], lines, current_rss())
+
+
+def report():
+    with _lock:
+        spans = {name: dict(span, mean_peak=span['total_peak'] // span['calls'])
+                 for name, span in _spans.items()}
+        series = list(_rss_series)
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return {
+        'pid': os.getpid(),
+        'rss': current_rss(),
+        'traced_current': current,
+        'traced_peak': peak,
+        'rss_series': series,
+        'spans': dict(sorted(spans.items(), key=lambda item: item[1]['max_peak'], reverse=True)),
+    }
+
+
+def format_report(data):
+    mb = 1024 * 1024
+    lines = [f"pid {data['pid']} | RSS {data['rss'] / mb:.1f} MB | traced {data['traced_current'] / mb:.1f} MB", ""]
+    for name, span in data['spans'].items():
+        lines.append(f"{name} [{span['kind']}] llamadas={span['calls']} "
+                     f"pico máx={span['max_peak'] / mb:.2f} MB medio={span['mean_peak'] / mb:.2f} MB")
+        for line in span.get('top_lines', []):
+            lines.append(f"    {line['file']}:{line['line']:<6} {line['size_diff'] / 1024:>9.1f} KiB  {line['source'][:80]}")
+    if data['rss_series']:
+        lines.append("")
+        lines.append("RSS (últimas muestras): " + ", ".join(
+            f"{time.strftime('%H:%M:%S', time.localtime(ts))}={rss / mb:.1f}MB" for ts, rss in data['rss_series'][-12:]))
+    return "\n".join(lines) + "\n"
+
+
+def init_app(app):
+    """Activa tracemalloc, registra el hook y el endpoint ``/_admin/memory``"""
+    if not memory_trace_enabled() or not require_token('AIFA_MEMORY_TRACE'):
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(int(os.environ.get('AIFA_MEMORY_FRAMES', '10')))
+    register_hook(memory_hook)
+
+    @app.server.route(f'{ADMIN_PREFIX}/memory')
+    @admin_required
+    def admin_memory():
+        _ensure_sampler()
+        data = report()
+        if request.args.get('format') == 'text':
+            return Response(format_report(data), mimetype='text/plain; charset=utf-8')
+        return jsonify(data)
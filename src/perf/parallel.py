@@ -0,0 +1,114 @@
+"""
+Construcción concurrente de las figuras de un tab.
+
+``build_figures`` recibe las funciones constructoras de un tab (sin
+argumentos) y las ejecuta en un pool, devolviendo los resultados en el mismo
+orden. La latencia del tab pasa a ser la de la figura más lenta más el costo
+del pool, en lugar de la suma.
+
+Configuración:
+    AIFA_FIGURE_POOL=thread    hilos (default): útil cuando los constructores
+                               esperan I/O (APIs, base de datos); la parte de
+                               Plotly sigue atada al GIL
+    AIFA_FIGURE_POOL=process   procesos: paralelismo real de CPU; las figuras
+                               vuelven serializadas como dicts
+    AIFA_FIGURE_POOL=off       secuencial, en el hilo de la petición
+    AIFA_FIGURE_WORKERS=<n>    tamaño del pool (default 6)
+
+Una figura que falla se registra en el log y se devuelve vacía, sin tumbar
+al resto del tab; ese resultado parcial no entra a ``cached_output``, así que
+la siguiente petición vuelve a intentarlo.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from plotly.io.json import to_json_plotly
+
+from ..data.accessors import note_reads, track_reads
+from .cache import mark_uncacheable
+
+logger = logging.getLogger('aifa.parallel')
+
+_pool = None
+_pool_pid = None
+_lock = threading.Lock()
+
+
+def pool_mode():
+    mode = os.environ.get('AIFA_FIGURE_POOL', 'thread').lower()
+    return mode if mode in ('thread', 'process', 'off') else 'thread'
+
+
+def figure_pool():
+    """Pool del proceso actual (se recrea tras un fork), o None en modo secuencial"""
+    global _pool, _pool_pid
+    mode = pool_mode()
+    if mode == 'off':
+        return None
+    if _pool_pid != os.getpid():
+        with _lock:
+            if _pool_pid != os.getpid():
+                workers = int(os.environ.get('AIFA_FIGURE_WORKERS', '6'))
+                executor = ProcessPoolExecutor if mode == 'process' else ThreadPoolExecutor
+                _pool = executor(max_workers=workers, **({} if mode == 'process' else
+                                                         {'thread_name_prefix': 'aifa-figures'}))
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def _build_serialized(builder):
+    # En procesos se devuelve JSON puro (más barato de transferir que un go.Figure)
+    # junto con las fuentes que leyó, para la llave de cached_output en el padre
+    with track_reads() as reads:
+        figure = json.loads(to_json_plotly(builder()))
+    return figure, sorted(reads)
+
+
+def _serialized_result(future):
+    figure, sources = future.result()
+    note_reads(sources)
+    return figure
+
+
+def _safe(builder, result_or_error):
+    try:
+        return result_or_error()
+    except Exception:
+        logger.exception("Error construyendo figura", extra={'figure': getattr(builder, '__name__', repr(builder))})
+        mark_uncacheable()
+        return {}
+
+
+def build_figures(builders, set_progress=None):
+    """Ejecuta ``builders`` (lista de callables sin argumentos) y devuelve sus figuras en orden"""
+    total = len(builders)
+    pool = figure_pool()
+    if pool is None or total < 2:
+        results = []
+        for done, builder in enumerate(builders, 1):
+            results.append(_safe(builder, builder))
+            if set_progress:
+                set_progress((str(done), str(total)))
+        return results
+
+    in_processes = isinstance(pool, ProcessPoolExecutor)
+    if in_processes:
+        futures = {pool.submit(_build_serialized, builder): i for i, builder in enumerate(builders)}
+    else:
+        # Cada tarea corre con una copia del contexto: los spans de trazas cuelgan del callback
+        futures = {pool.submit(contextvars.copy_context().run, builder): i for i, builder in enumerate(builders)}
+
+    results = [None] * total
+    for done, future in enumerate(as_completed(futures), 1):
+        index = futures[future]
+        result = functools.partial(_serialized_result, future) if in_processes else future.result
+        results[index] = _safe(builders[index], result)
+        if set_progress:
+            set_progress((str(done), str(total)))
+    return results
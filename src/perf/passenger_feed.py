@@ -0,0 +1,53 @@
+"""
+Entrada de eventos de pasajeros para el top-K de destinos (``src/data/topk.py``).
+
+``POST /_admin/passengers`` recibe un evento ``{"city": ..., "passengers": n}``
+o una lista de ellos (abordajes, vuelos operados) y los suma al tracker del
+proceso con ``record_passengers``. El panel Principales Destinos del tab
+geográfico se redibuja en el siguiente tick del reloj del header.
+
+Requiere ``AIFA_ADMIN_TOKEN`` como el resto de ``/_admin/*`` (sin token
+responde 404). Solo se aceptan ciudades de la tabla de rutas y cantidades
+enteras positivas; un lote con cualquier evento inválido responde 400 sin
+registrar nada. El tracker es por proceso: con varios workers cada evento
+cuenta solo en el worker que lo recibió.
+"""
+
+from flask import jsonify, request
+
+from .admin import ADMIN_PREFIX, admin_required
+
+PASSENGERS_URL = f'{ADMIN_PREFIX}/passengers'
+
+
+def parse_events(payload, cities):
+    """``[(ciudad, pasajeros), ...]`` de un evento o lista de eventos; ValueError si alguno es inválido"""
+    events = payload if isinstance(payload, list) else [payload]
+    parsed = []
+    for event in events:
+        if not isinstance(event, dict):
+            raise ValueError("cada evento debe ser un objeto {city, passengers}")
+        city, passengers = event.get('city'), event.get('passengers')
+        if city not in cities:
+            raise ValueError(f"ciudad desconocida: {city!r}")
+        if isinstance(passengers, bool) or not isinstance(passengers, int) or passengers <= 0:
+            raise ValueError(f"pasajeros inválidos para {city}: {passengers!r}")
+        parsed.append((city, passengers))
+    return parsed
+
+
+def init_app(app):
+    """Registra ``POST /_admin/passengers``"""
+    @app.server.route(PASSENGERS_URL, methods=['POST'])
+    @admin_required
+    def admin_passengers():
+        # Import diferido: la tabla de rutas trae numpy, que el modo lite no carga al arrancar
+        from ..data.routes import route_table
+        from ..data.topk import destination_tracker, record_passengers
+        try:
+            events = parse_events(request.get_json(silent=True), route_table().city_index)
+        except ValueError as exc:
+            return jsonify({'error': str(exc)}), 400
+        for city, passengers in events:
+            record_passengers(city, passengers)
+        return jsonify({'recorded': len(events), 'revision': destination_tracker().revision})
@@ -0,0 +1,93 @@
+"""
+Intervalo de polling adaptativo, recomendado por el servidor.
+
+Cuando el canal de eventos (``push``) no está disponible, cada consulta del
+polling de datos devuelve el siguiente ``interval`` de ``data-interval``:
+
+  * según la antigüedad de los datos: si una fuente recargada trajo datos
+    distintos hace poco se consulta seguido (``AIFA_POLL_MIN_SECONDS``,
+    default 10); el intervalo crece con el tiempo sin cambios (una cuarta
+    parte de esa antigüedad), así de noche casi no hay peticiones. Sin
+    cambios observados cuenta desde la primera carga de datos, y sin datos
+    cargados se usa el mínimo
+  * según la carga del worker: callbacks en curso por hilo y latencia media
+    reciente (EWMA) frente a ``AIFA_POLL_TARGET_MS`` (default 500); con el
+    worker saturado el intervalo se multiplica por la carga
+  * acotado por ``AIFA_POLL_MAX_SECONDS`` (default 300), el tope del
+    servidor para la contrapresión
+
+Los contadores son por worker y cuestan un par de operaciones por petición.
+"""
+
+import os
+import threading
+import time
+
+from flask import g, request
+
+from ..data.version import data_changed_at
+from .dispatch import DISPATCH_URL
+
+EWMA_ALPHA = 0.2
+LATENCY_HALF_LIFE = 60.0
+AGE_DIVISOR = 4
+
+_lock = threading.Lock()
+_state = {'in_flight': 0, 'latency_ms': 0.0, 'sampled_at': 0.0}
+
+
+def min_seconds():
+    return float(os.environ.get('AIFA_POLL_MIN_SECONDS', '10'))
+
+
+def max_seconds():
+    return float(os.environ.get('AIFA_POLL_MAX_SECONDS', '300'))
+
+
+def target_ms():
+    return float(os.environ.get('AIFA_POLL_TARGET_MS', '500'))
+
+
+def worker_threads():
+    return max(1, int(os.environ.get('AIFA_WORKER_THREADS', '1')))
+
+
+def load_factor(now=None):
+    """Carga del worker: 1.0 = en el límite; se ignora la petición actual"""
+    now = now or time.monotonic()
+    busy = max(0, _state['in_flight'] - 1) / worker_threads()
+    # Sin peticiones recientes la latencia medida pierde peso
+    latency_ms = _state['latency_ms'] * 0.5 ** ((now - _state['sampled_at']) / LATENCY_HALF_LIFE)
+    return max(busy, latency_ms / target_ms())
+
+
+def recommended_interval(now=None):
+    """Siguiente intervalo de polling en milisegundos"""
+    now = now or time.monotonic()
+    changed_at = data_changed_at()
+    age = 0.0 if changed_at is None else now - changed_at
+    seconds = max(min_seconds(), age / AGE_DIVISOR) * max(1.0, load_factor(now))
+    return int(min(seconds, max_seconds()) * 1000)
+
+
+def _begin_request():
+    if request.path == DISPATCH_URL:
+        g.aifa_poll_start = time.perf_counter()
+        with _lock:
+            _state['in_flight'] += 1
+
+
+def _end_request(exc=None):
+    start = g.pop('aifa_poll_start', None)
+    if start is not None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _lock:
+            _state['in_flight'] -= 1
+            _state['latency_ms'] += EWMA_ALPHA * (elapsed_ms - _state['latency_ms'])
+            _state['sampled_at'] = time.monotonic()
+
+
+def init_app(app):
+    """Registra los contadores de carga por petición"""
+    app.server.before_request(_begin_request)
+    app.server.teardown_request(_end_request)
@@ -0,0 +1,187 @@
+"""
+Perfilado bajo demanda de peticiones individuales a ``_dash-update-component``.
+
+Con ``AIFA_PROFILING=1`` y ``AIFA_ADMIN_TOKEN`` definido, una petición que
+incluya el header ``X-AIFA-Profile`` con el token se ejecuta bajo cProfile. El resto de las peticiones no se ve afectado:
+cProfile solo perfila el hilo que lo activa y solo un perfil corre a la vez.
+Con ``X-AIFA-Profile-Cache: bypass`` el callback se recalcula sin pasar por
+la caché de respuestas, para perfilar el trabajo real y no el cache hit.
+
+Los resultados se consultan en:
+    /_admin/profiles                 lista de perfiles guardados
+    /_admin/profiles/<id>            estadísticas en texto (?sort=tottime&limit=60, hasta 1000)
+    /_admin/profiles/<id>.prof       archivo pstats (snakeviz, pstats.Stats)
+"""
+
+import cProfile
+import io
+import itertools
+import marshal
+import os
+import pstats
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response, abort, g, jsonify, request
+from markupsafe import escape
+
+from .admin import ADMIN_PREFIX, admin_required, flag_enabled, require_token, token_matches
+from .cache import bypass_cache
+from .dispatch import DISPATCH_URL
+
+PROFILE_HEADER = 'X-AIFA-Profile'
+PROFILE_ID_HEADER = 'X-AIFA-Profile-Id'
+PROFILE_CACHE_HEADER = 'X-AIFA-Profile-Cache'
+SORT_KEYS = ('cumulative', 'tottime', 'ncalls', 'filename')
+DEFAULT_LIMIT = 60
+MAX_LIMIT = 1000
+
+
+class ProfileStore:
+    """Últimos N perfiles en memoria del worker"""
+
+    def __init__(self, maxlen=50):
+        self.maxlen = maxlen
+        self._profiles = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            record['id'] = f"{os.getpid()}-{next(self._ids)}"
+            self._profiles[record['id']] = record
+            while len(self._profiles) > self.maxlen:
+                self._profiles.popitem(last=False)
+        return record['id']
+
+    def get(self, profile_id):
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self):
+        with self._lock:
+            return [{k: v for k, v in record.items() if k != 'stats'} for record in reversed(self._profiles.values())]
+
+
+store = ProfileStore(int(os.environ.get('AIFA_PROFILING_KEEP', '50')))
+_active = threading.Lock()
+
+
+def profiling_enabled():
+    return flag_enabled('AIFA_PROFILING')
+
+
+def _should_profile():
+    # El header debe llevar el token: sin token configurado nadie puede perfilar
+    value = request.headers.get(PROFILE_HEADER)
+    return (value is not None and request.path == DISPATCH_URL and request.method == 'POST'
+            and token_matches(value))
+
+
+def _start_profile():
+    if not _should_profile() or not _active.acquire(blocking=False):
+        return
+    body = request.get_json(silent=True) or {}
+    g.aifa_profile = {
+        'profiler': cProfile.Profile(),
+        'output': body.get('output'),
+        'inputs': [(i.get('id'), i.get('property'), i.get('value')) for i in body.get('inputs', [])],
+        'started': time.perf_counter(),
+        'cache_token': (bypass_cache.set(True)
+                        if request.headers.get(PROFILE_CACHE_HEADER) == 'bypass' else None),
+    }
+    g.aifa_profile['profiler'].enable()
+
+
+def _finish_profile(response):
+    state = g.pop('aifa_profile', None)
+    if state is None:
+        return response
+    try:
+        state['profiler'].disable()
+        _reset_cache_bypass(state)
+        duration = time.perf_counter() - state['started']
+        stats = pstats.Stats(state['profiler'])
+        profile_id = store.add({
+            'created_at': time.time(),
+            'output': state['output'],
+            'inputs': state['inputs'],
+            'cache_bypassed': state['cache_token'] is not None,
+            'duration_ms': round(duration * 1000, 3),
+            'status': response.status_code,
+            'bytes': response.calculate_content_length(),
+            'total_calls': stats.total_calls,
+            'stats': stats.stats,
+        })
+        response.headers[PROFILE_ID_HEADER] = profile_id
+    finally:
+        _active.release()
+    return response
+
+
+def _reset_cache_bypass(state):
+    if state['cache_token'] is not None:
+        bypass_cache.reset(state['cache_token'])
+
+
+def _discard_profile(exc=None):
+    state = g.pop('aifa_profile', None)
+    if state is not None:
+        state['profiler'].disable()
+        _reset_cache_bypass(state)
+        _active.release()
+
+
+def format_stats(record, sort='cumulative', limit=DEFAULT_LIMIT):
+    stream = io.StringIO()
+    stats = pstats.Stats(stream=stream)
+    stats.stats = record['stats']
+    stats.total_calls = record['total_calls']
+    stats.get_top_level_stats()
+    stats.sort_stats(sort if sort in SORT_KEYS else 'cumulative').print_stats(limit)
+    return stream.getvalue()
+
+
+def init_app(app):
+    """Registra los hooks de perfilado y los endpoints de administración"""
+    if not profiling_enabled() or not require_token('AIFA_PROFILING'):
+        return
+    server = app.server
+    server.before_request(_start_profile)
+    server.after_request(_finish_profile)
+    server.teardown_request(_discard_profile)
+
+    @server.route(f'{ADMIN_PREFIX}/profiles')
+    @admin_required
+    def admin_profiles():
+        records = store.list()
+        if request.args.get('format') == 'json':
+            return jsonify(records)
+        rows = "".join(
+            f"<tr><td><a href='{ADMIN_PREFIX}/profiles/{r['id']}'>{r['id']}</a></td>"
+            f"<td>{time.strftime('%H:%M:%S', time.localtime(r['created_at']))}</td>"
+            f"<td>{escape(r['output'])}</td><td>{r['duration_ms']:.1f}</td>"
+            f"<td>{r['bytes'] or ''}</td><td>{r['total_calls']}</td>"
+            f"<td><a href='{ADMIN_PREFIX}/profiles/{r['id']}.prof'>.prof</a></td></tr>"
+            for r in records)
+        return (f"<html><head><title>AIFA - Perfiles</title></head><body style='font-family:monospace'>"
+                f"<h3>Perfiles de callbacks (pid {os.getpid()})</h3>"
+                f"<table border='1' cellpadding='4'><tr><th>id</th><th>hora</th><th>callback</th>"
+                f"<th>ms</th><th>bytes</th><th>llamadas</th><th></th></tr>{rows}</table></body></html>")
+
+    @server.route(f'{ADMIN_PREFIX}/profiles/<profile_id>')
+    @admin_required
+    def admin_profile_detail(profile_id):
+        if profile_id.endswith('.prof'):
+            record = store.get(profile_id[:-len('.prof')]) or abort(404)
+            return Response(marshal.dumps(record['stats']), mimetype='application/octet-stream',
+                            headers={'Content-Disposition': f'attachment; filename={profile_id}'})
+        record = store.get(profile_id) or abort(404)
+        header = (f"callback: {record['output']}\ninputs: {record['inputs']}\n"
+                  f"caché omitida: {'sí' if record['cache_bypassed'] else 'no'}\n"
+                  f"duración: {record['duration_ms']} ms | status {record['status']} | bytes {record['bytes']}\n\n")
+        # ``limit`` inválido usa el default; fuera de rango se acota a 1..MAX_LIMIT
+        limit = min(max(request.args.get('limit', DEFAULT_LIMIT, type=int), 1), MAX_LIMIT)
+        text = format_stats(record, request.args.get('sort', 'cumulative'), limit)
+        return Response(header + text, mimetype='text/plain; charset=utf-8')
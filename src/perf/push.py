@@ -0,0 +1,137 @@
+"""
+Canal de actualizaciones por Server-Sent Events.
+
+``GET /_events/data-version`` mantiene abierta una conexión por pestaña y
+envía un evento ``data-version`` cuando cambia la versión de datos
+(``src/data/version.py``). El cliente (``assets/push.js``) la copia al
+``dcc.Store`` ``data-version``, que es entrada de los callbacks de datos
+junto con el ``dcc.Interval`` ``data-interval``: las gráficas se refrescan
+al cambiar los datos y, con la conexión abierta, ese intervalo queda en
+pausa. El reloj del header (``interval-component``) sigue corriendo. Un
+dashboard sin cambios no genera peticiones de callbacks de datos.
+
+Mientras haya clientes conectados, cada ``AIFA_PUSH_HEARTBEAT`` segundos
+(default 15) el proceso revisa las fuentes ya cargadas cuyo TTL venció
+(``accessors.refresh_loaded``) y envía un comentario de keep-alive. Cada
+conexión dura como máximo ``AIFA_PUSH_MAX_SECONDS`` (default 300) y el
+navegador se reconecta solo.
+
+Cada conexión ocupa un hilo, así que el canal solo se activa con
+``AIFA_PUSH=1`` (lo fijan los perfiles ``gthread`` de ``gunicorn.conf.py``
+y el servidor de desarrollo) y admite hasta ``AIFA_PUSH_MAX_CLIENTS``
+conexiones por worker (default 16). Sin canal el endpoint responde 204 y
+el cliente sigue con el polling de siempre.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from flask import Response, request, stream_with_context
+
+from ..data import accessors
+from ..data.version import add_version_listener, data_version
+from .admin import flag_enabled
+
+PUSH_URL = '/_events/data-version'
+STORE_ID = 'data-version'
+POLL_ID = 'data-interval'
+RETRY_MS = 5000
+
+logger = logging.getLogger('aifa.push')
+
+_condition = threading.Condition()
+_clients = 0
+_last_refresh = 0.0
+
+
+def push_enabled():
+    return flag_enabled('AIFA_PUSH')
+
+
+def heartbeat_seconds():
+    return float(os.environ.get('AIFA_PUSH_HEARTBEAT', '15'))
+
+
+def max_seconds():
+    return float(os.environ.get('AIFA_PUSH_MAX_SECONDS', '300'))
+
+
+def max_clients():
+    return int(os.environ.get('AIFA_PUSH_MAX_CLIENTS', '16'))
+
+
+def connected_clients():
+    return _clients
+
+
+def _notify(version):
+    with _condition:
+        _condition.notify_all()
+
+
+add_version_listener(_notify)
+
+
+def refresh_sources():
+    """Revisa los TTL una vez por intervalo de heartbeat, no una vez por cliente"""
+    global _last_refresh
+    now = time.monotonic()
+    with _condition:
+        if now - _last_refresh < heartbeat_seconds():
+            return
+        _last_refresh = now
+    try:
+        accessors.refresh_loaded()
+    except Exception:
+        logger.exception("Error al refrescar fuentes de datos")
+
+
+def _event(version):
+    return f"id: {version}\nevent: {STORE_ID}\ndata: {json.dumps({'version': version})}\n\n"
+
+
+def _release():
+    global _clients
+    with _condition:
+        _clients -= 1
+
+
+def _stream(last_version):
+    deadline = time.monotonic() + max_seconds()
+    yield f"retry: {RETRY_MS}\n\n"
+    version = data_version()
+    # Al reconectarse el navegador envía el último id; si no cambió no se repite
+    if version != last_version:
+        yield _event(version)
+    while time.monotonic() < deadline:
+        with _condition:
+            _condition.wait_for(lambda: data_version() != version, timeout=heartbeat_seconds())
+        refresh_sources()
+        current = data_version()
+        if current != version:
+            version = current
+            yield _event(version)
+        else:
+            yield ": ping\n\n"
+
+
+def init_app(app):
+    """Registra el endpoint de eventos en el servidor Flask"""
+    @app.server.route(PUSH_URL)
+    def data_version_events():
+        global _clients
+        if not push_enabled():
+            return Response(status=204)
+        with _condition:
+            if _clients >= max_clients():
+                return Response(status=204)
+            _clients += 1
+        headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        response = Response(stream_with_context(_stream(request.headers.get('Last-Event-ID'))),
+                            mimetype='text/event-stream', headers=headers)
+        # Se llama al cerrar la respuesta, aunque el stream no haya empezado
+        response.call_on_close(_release)
+        return response
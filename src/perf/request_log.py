@@ -0,0 +1,222 @@
+"""
+Logs estructurados (JSON por línea) con id de petición y tiempos por fase.
+
+Cada petición recibe un id (header ``X-Request-ID`` entrante o uno nuevo) que
+se devuelve en la respuesta y se agrega a todo log emitido bajo el logger
+``aifa`` durante la petición. Cada invocación de ``_dash-update-component``
+emite una línea ``event=callback`` con:
+
+  * ``callback``: id de las salidas del callback
+  * ``duration_ms`` total y su reparto en ``data_ms`` (accesores de datos),
+    ``figure_ms`` (construcción de figuras y layouts) y ``serialization_ms``
+    (serialización JSON y el resto del despacho de Dash)
+  * ``bytes`` de la respuesta, ``status`` y ``error`` si algo falló
+
+Los reportes se arman con los spans de ``instrument``. Los logs pasan por una
+cola (``QueueHandler``) y un hilo (``QueueListener``) los escribe, así la
+petición nunca espera a stderr o al disco.
+
+Configuración: ``AIFA_REQUEST_LOG=0`` lo desactiva, ``AIFA_LOG_LEVEL``
+(default INFO) y ``AIFA_LOG_FILE`` (default stderr).
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+
+from dash.exceptions import PreventUpdate
+from flask import g, has_request_context, request
+
+from .dispatch import DISPATCH_URL
+from .instrument import register_hook
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+PHASES = {'data': 'data', 'serialization': 'serialization', 'dispatch': 'serialization',
+          'figure': 'figure', 'layout': 'figure', 'callback': 'figure'}
+
+logger = logging.getLogger('aifa')
+request_logger = logging.getLogger('aifa.request')
+
+# Atributos estándar de LogRecord; el resto se considera un campo extra
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+def request_log_enabled():
+    return os.environ.get('AIFA_REQUEST_LOG', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+def current_request_id():
+    return g.get('aifa_request_id') if has_request_context() else None
+
+
+def error_info(exc_info):
+    exc_type, exc, tb = exc_info
+    return {
+        'type': exc_type.__name__,
+        'message': str(exc),
+        'traceback': ''.join(traceback.format_exception(exc_type, exc, tb))[-4000:],
+    }
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro, con los campos de ``extra`` al primer nivel"""
+
+    def format(self, record):
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info and 'error' not in entry:
+            entry['error'] = error_info(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class RequestContextFilter(logging.Filter):
+    """Agrega el id de petición y anota los errores en el reporte del callback"""
+
+    def filter(self, record):
+        if has_request_context():
+            if not hasattr(record, 'request_id'):
+                record.request_id = g.get('aifa_request_id')
+            timing = g.get('aifa_timing')
+            if record.exc_info and timing is not None and timing['error'] is None:
+                timing['error'] = error_info(record.exc_info)
+        return True
+
+
+class ForkSafeQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que arranca su listener en cada proceso.
+
+    Con ``preload_app`` el módulo se importa en el master de gunicorn y el
+    hilo del listener no sobrevive al fork: cada worker crea el suyo.
+    """
+
+    def __init__(self, target):
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self._pid = None
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def prepare(self, record):
+        # El formato se aplica en el hilo del listener, no en la petición
+        return record
+
+    def enqueue(self, record):
+        if self._pid != os.getpid():
+            self._start()
+        super().enqueue(record)
+
+    def _start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self.queue = queue.SimpleQueue()
+            self._listener = logging.handlers.QueueListener(self.queue, self.target, respect_handler_level=True)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def close(self):
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+        super().close()
+
+
+def configure_logging():
+    """Configura el logger ``aifa`` una sola vez"""
+    if any(isinstance(h, ForkSafeQueueHandler) for h in logger.handlers):
+        return
+    log_file = os.environ.get('AIFA_LOG_FILE')
+    target = logging.FileHandler(log_file, encoding='utf-8') if log_file else logging.StreamHandler()
+    target.setFormatter(JsonFormatter())
+    handler = ForkSafeQueueHandler(target)
+    handler.addFilter(RequestContextFilter())
+    logger.addHandler(handler)
+    logger.setLevel(os.environ.get('AIFA_LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+
+
+@contextmanager
+def timing_hook(name, kind):
+    """Acumula el tiempo exclusivo de cada span en su fase"""
+    timing = g.get('aifa_timing') if has_request_context() else None
+    # Los spans de hilos auxiliares (figuras en paralelo) quedan dentro del tiempo del callback que los espera
+    if timing is None or timing['thread'] != threading.get_ident():
+        yield
+        return
+    stack = timing['stack']
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    except PreventUpdate:
+        raise
+    except Exception as exc:
+        if timing['error'] is None:
+            timing['error'] = dict(error_info((type(exc), exc, exc.__traceback__)), span=name)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        children = stack.pop()
+        timing['phases'][PHASES.get(kind, 'figure')] += elapsed - children
+        if stack:
+            stack[-1] += elapsed
+        else:
+            timing['spans'] += elapsed
+
+
+def _begin_request():
+    g.aifa_request_id = (request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex)[:64]
+    if request.path == DISPATCH_URL:
+        g.aifa_timing = {'start': time.perf_counter(), 'thread': threading.get_ident(),
+                         'stack': [], 'spans': 0.0, 'error': None,
+                         'phases': {'data': 0.0, 'figure': 0.0, 'serialization': 0.0}}
+
+
+def _end_request(response):
+    response.headers[REQUEST_ID_HEADER] = g.get('aifa_request_id', '')
+    timing = g.pop('aifa_timing', None)
+    if timing is None:
+        return response
+    duration = time.perf_counter() - timing['start']
+    phases = timing['phases']
+    # Lo que no ocurrió dentro de un span (Flask, lectura del body) se suma a serialización
+    phases['serialization'] += max(0.0, duration - timing['spans'])
+    body = request.get_json(silent=True) or {}
+    fields = {
+        'event': 'callback',
+        'callback': body.get('output'),
+        'status': response.status_code,
+        'duration_ms': round(duration * 1000, 3),
+        'data_ms': round(phases['data'] * 1000, 3),
+        'figure_ms': round(phases['figure'] * 1000, 3),
+        'serialization_ms': round(phases['serialization'] * 1000, 3),
+        'bytes': response.calculate_content_length(),
+    }
+    if timing['error'] is not None:
+        fields['error'] = timing['error']
+    level = logging.ERROR if response.status_code >= 500 else logging.INFO
+    request_logger.log(level, 'callback %s', fields['callback'], extra=fields)
+    return response
+
+
+def init_app(app):
+    """Configura los logs JSON y registra el id de petición y los tiempos por fase"""
+    configure_logging()
+    if not request_log_enabled():
+        return
+    register_hook(timing_hook)
+    app.server.before_request(_begin_request)
+    app.server.after_request(_end_request)
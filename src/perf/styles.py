@@ -0,0 +1,194 @@
+"""
+Registro de clases CSS generadas a partir de estilos inline repetidos.
+
+``scripts/extract_styles.py`` recorre todos los tabs, detecta los dicts
+``style={...}`` que se repiten y escribe una clase ``sx-<hash>`` por cada uno
+dentro de un bloque generado en ``assets/style.css``. En runtime,
+``apply_style_classes`` sustituye esos dicts por la clase equivalente para
+que no se serialicen en cada respuesta de layout.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from functools import wraps
+
+from dash.development.base_component import Component
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'style.css')
+GENERATED_BEGIN = '/* >>> estilos generados por scripts/extract_styles.py - no editar >>> */'
+GENERATED_END = '/* <<< fin estilos generados <<< */'
+CLASS_PREFIX = 'sx-'
+
+# Propiedades CSS que React no convierte a px cuando el valor es numérico
+UNITLESS_PROPERTIES = {'opacity', 'flex', 'flexGrow', 'flexShrink', 'fontWeight',
+                       'lineHeight', 'order', 'zIndex', 'zoom'}
+
+_enabled = os.environ.get('AIFA_STYLE_CLASSES', '1') != '0'
+_known_classes = None
+_lookup_cache = {}
+_lock = threading.Lock()
+
+
+def style_signature(style):
+    """Representación canónica de un dict de estilos"""
+    return json.dumps(style, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def class_name_for(style):
+    """Nombre de clase determinístico para un dict de estilos"""
+    digest = hashlib.md5(style_signature(style).encode('utf-8')).hexdigest()
+    return f"{CLASS_PREFIX}{digest[:10]}"
+
+
+def _css_property(name):
+    if name.startswith('Webkit') or name.startswith('Moz') or name.startswith('ms'):
+        name = '-' + name[0].lower() + name[1:]
+    return re.sub(r'([A-Z])', lambda m: '-' + m.group(1).lower(), name)
+
+
+def _css_value(name, value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value) if name in UNITLESS_PROPERTIES or value == 0 else f"{value}px"
+    return str(value)
+
+
+def style_to_css(style):
+    """Regla CSS equivalente; ``!important`` conserva la precedencia del estilo inline"""
+    declarations = [f"    {_css_property(k)}: {_css_value(k, v)} !important;" for k, v in style.items()]
+    return f".{class_name_for(style)} {{\n" + "\n".join(declarations) + "\n}"
+
+
+def is_extractable(style):
+    return isinstance(style, dict) and bool(style) and all(
+        isinstance(v, (str, int, float)) and not isinstance(v, bool) for v in style.values())
+
+
+def read_generated_block(path=STYLESHEET_PATH):
+    """Devuelve (css sin bloque generado, bloque generado)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        css = f.read()
+    start = css.find(GENERATED_BEGIN)
+    if start == -1:
+        return css, ''
+    end = css.find(GENERATED_END, start)
+    end = len(css) if end == -1 else end + len(GENERATED_END)
+    return css[:start].rstrip() + css[end:], css[start:end]
+
+
+def generated_block(rules):
+    """Texto del bloque generado para las reglas indicadas"""
+    return "\n\n".join([GENERATED_BEGIN] + list(rules) + [GENERATED_END])
+
+
+def write_generated_block(rules, path=STYLESHEET_PATH):
+    """Reescribe el bloque generado de style.css con las reglas indicadas"""
+    base, _ = read_generated_block(path)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(base.rstrip() + "\n\n" + generated_block(rules) + "\n")
+    reload_registry()
+
+
+def known_classes():
+    global _known_classes
+    if _known_classes is None:
+        with _lock:
+            if _known_classes is None:
+                try:
+                    _, block = read_generated_block()
+                except OSError:
+                    block = ''
+                _known_classes = set(re.findall(r'\.(' + CLASS_PREFIX + r'[0-9a-f]+)\s*\{', block))
+    return _known_classes
+
+
+def reload_registry():
+    global _known_classes
+    with _lock:
+        _known_classes = None
+        _lookup_cache.clear()
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def lookup_class(style):
+    """Clase generada para ``style`` o None si no está registrada"""
+    try:
+        key = tuple(sorted(style.items()))
+        return _lookup_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    name = class_name_for(style) if is_extractable(style) else None
+    result = name if name in known_classes() else None
+    _lookup_cache[key] = result
+    return result
+
+
+def _rewrite(node):
+    if isinstance(node, Component):
+        props = node.__dict__
+        style = props.get('style')
+        if style and 'className' in node._prop_names:
+            name = lookup_class(style)
+            if name:
+                existing = props.get('className')
+                node.className = f"{existing} {name}" if existing else name
+                del node.style
+        for key, value in props.items():
+            if not key.startswith('_') and not key.startswith('available_') and isinstance(value, (Component, list, tuple)):
+                _rewrite(value)
+    elif isinstance(node, (list, tuple)):
+        for child in node:
+            _rewrite(child)
+
+
+def apply_style_classes(node):
+    """Sustituye in-place los estilos inline registrados por su clase CSS.
+
+    Solo recorre componentes; los subárboles ya serializados (dicts de
+    ``memoize_component``) se procesaron al cachearse.
+    """
+    if _enabled and known_classes():
+        _rewrite(node)
+    return node
+
+
+def style_classes(func):
+    """Decorador que aplica ``apply_style_classes`` al resultado de un render"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return apply_style_classes(func(*args, **kwargs))
+    return wrapper
+
+
+def collect_styles(node, counter):
+    """Cuenta las apariciones de cada estilo extraíble en un árbol (componentes o dicts)"""
+    if isinstance(node, Component):
+        style = getattr(node, 'style', None)
+        if is_extractable(style) and 'className' in node._prop_names:
+            counter[style_signature(style)] = counter.get(style_signature(style), 0) + 1
+        for key, value in node.__dict__.items():
+            if not key.startswith('_') and not key.startswith('available_'):
+                collect_styles(value, counter)
+    elif isinstance(node, dict) and 'props' in node and 'type' in node:
+        props = node['props']
+        style = props.get('style')
+        if is_extractable(style):
+            counter[style_signature(style)] = counter.get(style_signature(style), 0) + 1
+        for value in props.values():
+            collect_styles(value, counter)
+    elif isinstance(node, (list, tuple)):
+        for child in node:
+            collect_styles(child, counter)
+    return counter
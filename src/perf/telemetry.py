@@ -0,0 +1,130 @@
+"""
+Telemetría propia del dashboard en buffers circulares (``deque``).
+
+Cada petición a ``_dash-update-component`` agrega una muestra
+``(ts, callback, ms, bytes, status)``; el RSS del worker se muestrea como
+máximo cada ``AIFA_TELEMETRY_RSS_SECONDS`` (default 5) dentro de esas mismas
+peticiones, sin hilos extra. ``summary()`` calcula percentiles, tasas y
+ratios de caché al momento de consultarlos, así el costo por petición es un
+``append``. Los datos son por worker (pid); el tab "Sistema" los muestra.
+
+``AIFA_TELEMETRY=0`` lo desactiva y ``AIFA_TELEMETRY_SIZE`` (default 4096)
+fija el tamaño del buffer de peticiones.
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from flask import g, request
+
+from .cache import disk_cache, response_cache
+from .dispatch import DISPATCH_URL
+from .memo import memo_stats
+from .memory import current_rss
+
+# Los callbacks del propio tab Sistema no se cuentan
+EXCLUDED_PREFIX = 'sistema-'
+RATE_WINDOW_SECONDS = 60
+
+
+def telemetry_enabled():
+    return os.environ.get('AIFA_TELEMETRY', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class Telemetry:
+    def __init__(self, size=4096, rss_size=720, rss_interval=5.0):
+        self.requests = deque(maxlen=size)
+        self.rss = deque(maxlen=rss_size)
+        self.rss_interval = rss_interval
+        self.started_at = time.time()
+        self._last_rss = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, callback, duration_ms, size, status):
+        now = time.time()
+        # deque.append es atómico; el lock solo protege el muestreo de RSS
+        self.requests.append((now, callback, duration_ms, size or 0, status))
+        if now - self._last_rss >= self.rss_interval:
+            with self._lock:
+                if now - self._last_rss >= self.rss_interval:
+                    self._last_rss = now
+                    self.rss.append((now, current_rss()))
+
+    def summary(self, now=None):
+        now = now or time.time()
+        samples = list(self.requests)
+        by_callback = defaultdict(list)
+        for ts, callback, duration_ms, size, status in samples:
+            by_callback[callback].append((duration_ms, size, status))
+
+        callbacks = {}
+        for callback, rows in by_callback.items():
+            durations = [r[0] for r in rows]
+            sizes = [r[1] for r in rows]
+            callbacks[callback] = {
+                'requests': len(rows),
+                'p50_ms': round(percentile(durations, 50), 2),
+                'p95_ms': round(percentile(durations, 95), 2),
+                'p99_ms': round(percentile(durations, 99), 2),
+                'mean_bytes': int(sum(sizes) / len(sizes)),
+                'max_bytes': max(sizes),
+                'errors': sum(1 for r in rows if r[2] >= 500),
+            }
+
+        durations = [s[2] for s in samples]
+        recent = [s for s in samples if now - s[0] <= RATE_WINDOW_SECONDS]
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(now - self.started_at),
+            'requests': len(samples),
+            'requests_per_minute': round(len(recent) * 60 / RATE_WINDOW_SECONDS, 1),
+            'error_rate': (sum(1 for s in samples if s[4] >= 500) / len(samples)) if samples else 0.0,
+            'p50_ms': round(percentile(durations, 50), 2),
+            'p95_ms': round(percentile(durations, 95), 2),
+            'p99_ms': round(percentile(durations, 99), 2),
+            'callbacks': dict(sorted(callbacks.items(), key=lambda item: item[1]['p95_ms'], reverse=True)),
+            'timeline': [(s[0], s[2]) for s in samples],
+            'rss': list(self.rss) or [(now, current_rss())],
+            'caches': {
+                'respuestas': response_cache.stats(),
+                'disco': disk_cache.stats() if disk_cache is not None else None,
+                'componentes': memo_stats(),
+            },
+        }
+
+
+telemetry = Telemetry(size=int(os.environ.get('AIFA_TELEMETRY_SIZE', '4096')),
+                      rss_interval=float(os.environ.get('AIFA_TELEMETRY_RSS_SECONDS', '5')))
+
+
+def _begin_request():
+    if request.path == DISPATCH_URL:
+        g.aifa_telemetry_start = time.perf_counter()
+
+
+def _end_request(response):
+    start = g.pop('aifa_telemetry_start', None)
+    if start is not None:
+        callback = (request.get_json(silent=True) or {}).get('output') or ''
+        if not callback.lstrip('.').startswith(EXCLUDED_PREFIX):
+            telemetry.record(callback, (time.perf_counter() - start) * 1000,
+                             response.calculate_content_length(), response.status_code)
+    return response
+
+
+def init_app(app):
+    """Registra la recolección de telemetría por petición"""
+    if not telemetry_enabled():
+        return
+    app.server.before_request(_begin_request)
+    app.server.after_request(_end_request)
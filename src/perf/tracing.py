@@ -0,0 +1,210 @@
+"""
+Trazas en proceso: spans anidados con atributos, exportados a archivo.
+
+Con ``AIFA_TRACING=1`` cada petición a ``_dash-update-component`` abre un span
+raíz y los spans de ``instrument`` (despacho de Dash, callback, figura,
+accesores de datos, serialización) cuelgan de él. Desde cualquier punto del
+código se pueden agregar spans y atributos::
+
+    with start_span('consulta', kind='data', fuente='api') as span:
+        span.set_attribute('filas', len(rows))
+
+    current_span().set_attribute('filtro', filter_type)
+
+Los spans se escriben en formato Chrome Trace Event (``ph: "X"``) en
+``AIFA_TRACE_DIR/trace-<pid>.json`` (default ``<tmp>/aifa-traces``), un archivo
+por proceso. Se abren con https://ui.perfetto.dev o ``chrome://tracing``.
+"""
+
+import atexit
+import contextvars
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from dash.exceptions import PreventUpdate
+from flask import g, request
+
+from .admin import flag_enabled
+from .dispatch import DISPATCH_URL
+from .instrument import register_hook
+from .request_log import current_request_id
+
+# Los timestamps se toman con perf_counter y se anclan al reloj de pared una vez
+_EPOCH_NS = time.time_ns() - time.perf_counter_ns()
+_ids = itertools.count(1)
+_current = contextvars.ContextVar('aifa_current_span', default=None)
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'aifa-traces')
+
+
+def tracing_enabled():
+    return flag_enabled('AIFA_TRACING')
+
+
+class Span:
+    __slots__ = ('name', 'kind', 'trace_id', 'span_id', 'parent_id', 'attributes', 'start_ns', 'end_ns', 'tid')
+
+    def __init__(self, name, kind, parent=None, trace_id=None, attributes=None):
+        self.name = name
+        self.kind = kind
+        self.span_id = f"{os.getpid():x}-{next(_ids):x}"
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else (trace_id or self.span_id)
+        self.attributes = dict(attributes or {})
+        self.tid = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def to_event(self):
+        return {
+            'name': self.name,
+            'cat': self.kind,
+            'ph': 'X',
+            'ts': (_EPOCH_NS + self.start_ns) / 1000,
+            'dur': (self.end_ns - self.start_ns) / 1000,
+            'pid': os.getpid(),
+            'tid': self.tid,
+            'args': dict(self.attributes, trace_id=self.trace_id, span_id=self.span_id, parent_id=self.parent_id),
+        }
+
+
+class _NoopSpan:
+    def set_attribute(self, key, value):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class TraceFileExporter:
+    """Escribe eventos en un archivo JSON de Chrome Trace por proceso.
+
+    Los eventos se acumulan en memoria y se escriben al cerrar cada span raíz
+    (una petición completa) o cada ``flush_every`` eventos.
+    """
+
+    def __init__(self, directory, flush_every=200):
+        self.directory = directory
+        self.flush_every = flush_every
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._pid = None
+        self._file = None
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, f'trace-{os.getpid()}.json')
+
+    def _open(self):
+        # Tras un fork cada worker abre su propio archivo; lo heredado del master se descarta
+        self._buffer = []
+        self._pid = os.getpid()
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('[' + json.dumps({'name': 'process_name', 'ph': 'M', 'pid': self._pid,
+                                           'args': {'name': f'aifa {self._pid}'}}))
+
+    def export(self, span):
+        event = span.to_event()
+        with self._lock:
+            if self._pid != os.getpid():
+                self._open()
+            self._buffer.append(event)
+            if span.parent_id is None or len(self._buffer) >= self.flush_every:
+                self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._file.write(''.join(',\n' + json.dumps(e, default=str) for e in self._buffer))
+            self._file.flush()
+            self._buffer = []
+
+    def flush(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                self._flush()
+
+    def close(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                self._flush()
+                # El cierre del arreglo es opcional en el formato; se agrega si el proceso termina limpio
+                self._file.write('\n]\n')
+                self._file.close()
+                self._pid = None
+
+
+exporter = None
+
+
+def current_span():
+    return _current.get() or NOOP_SPAN
+
+
+@contextmanager
+def start_span(name, kind='internal', **attributes):
+    """Abre un span hijo del span actual (o raíz) y lo exporta al cerrarse"""
+    if exporter is None:
+        yield NOOP_SPAN
+        return
+    parent = _current.get()
+    span = Span(name, kind, parent, trace_id=current_request_id(), attributes=attributes)
+    token = _current.set(span)
+    try:
+        yield span
+    except PreventUpdate:
+        span.set_attribute('prevent_update', True)
+        raise
+    except Exception as exc:
+        span.set_attribute('error', f'{type(exc).__name__}: {exc}')
+        raise
+    finally:
+        _current.reset(token)
+        span.end_ns = time.perf_counter_ns()
+        exporter.export(span)
+
+
+def tracing_hook(name, kind):
+    return start_span(name, kind)
+
+
+def _begin_request():
+    if request.path != DISPATCH_URL:
+        return
+    body = request.get_json(silent=True) or {}
+    g.aifa_trace = start_span(f"POST {body.get('output')}", 'request', path=request.path,
+                              inputs=[f"{i.get('id')}.{i.get('property')}" for i in body.get('inputs', [])])
+    g.aifa_trace.__enter__()
+
+
+def _end_request(response):
+    if 'aifa_trace' in g:
+        current_span().set_attribute('status', response.status_code)
+        current_span().set_attribute('bytes', response.calculate_content_length())
+    return response
+
+
+def _close_request(exc=None):
+    trace = g.pop('aifa_trace', None)
+    if trace is not None:
+        trace.__exit__(type(exc) if exc else None, exc, exc.__traceback__ if exc else None)
+
+
+def init_app(app):
+    """Activa el exportador y registra el span raíz por petición"""
+    global exporter
+    if not tracing_enabled():
+        return
+    exporter = TraceFileExporter(os.environ.get('AIFA_TRACE_DIR', DEFAULT_DIRECTORY))
+    atexit.register(exporter.close)
+    register_hook(tracing_hook)
+    app.server.before_request(_begin_request)
+    app.server.after_request(_end_request)
+    app.server.teardown_request(_close_request)
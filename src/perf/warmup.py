@@ -0,0 +1,104 @@
+"""
+Pre-calentamiento de layouts y figuras antes de aceptar tráfico.
+
+``warm_up`` recorre todos los tabs con el test client de Flask y dispara
+cada callback que el navegador ejecutaría al abrirlos, de modo que la caché
+de respuestas queda llena. Con ``preload_app = True`` gunicorn lo ejecuta en
+el master (``when_ready``) y los workers reciclados por ``max_requests``
+heredan la caché al hacer fork.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from flask import jsonify
+
+from .dispatch import DISPATCH_URL, build_plan
+
+logger = logging.getLogger(__name__)
+
+READY_URL = '/healthz/ready'
+LIVE_URL = '/healthz/live'
+
+_lock = threading.Lock()
+_state = {
+    'status': 'cold',  # cold | warming | ready | failed
+    'started_at': None,
+    'finished_at': None,
+    'duration_seconds': None,
+    'requests': 0,
+    'errors': [],
+}
+
+
+def warmup_enabled():
+    return os.environ.get('AIFA_WARMUP', '1') != '0'
+
+
+def warmup_state():
+    with _lock:
+        return dict(_state, errors=list(_state['errors']), pid=os.getpid())
+
+
+def is_ready():
+    """Listo cuando el warm-up terminó (aun con errores, que se reportan)"""
+    return _state['finished_at'] is not None or not warmup_enabled()
+
+
+def _post(client, payload, errors):
+    response = client.post(DISPATCH_URL, json=payload)
+    if response.status_code not in (200, 204):
+        errors.append(f"{payload['output']}: HTTP {response.status_code}")
+    return response
+
+
+def warm_up(app):
+    """Renderiza todos los tabs y figuras; devuelve el estado final"""
+    with _lock:
+        if _state['status'] == 'warming' or _state['finished_at'] is not None:
+            return dict(_state, errors=list(_state['errors']), pid=os.getpid())
+        _state.update(status='warming', started_at=time.time())
+
+    start = time.perf_counter()
+    errors = []
+    requests = 0
+    try:
+        client = app.server.test_client()
+        client.get('/')
+        plan = build_plan(client)
+        for dep, payload in plan['global']:
+            _post(client, payload, errors)
+            requests += 1
+        for tab_plan in plan['tabs'].values():
+            # build_plan ya renderizó el layout del tab; solo faltan las figuras
+            requests += 1
+            for dep, payload in tab_plan['callbacks']:
+                _post(client, payload, errors)
+                requests += 1
+        status = 'ready'
+    except Exception as exc:  # noqa: BLE001 - el estado debe reflejar cualquier fallo
+        logger.exception("Warm-up falló")
+        errors.append(repr(exc))
+        status = 'failed'
+
+    with _lock:
+        _state.update(status=status, finished_at=time.time(), requests=requests,
+                      duration_seconds=round(time.perf_counter() - start, 3), errors=errors)
+    logger.info("Warm-up %s: %d peticiones en %.2fs", status, requests, _state['duration_seconds'])
+    return warmup_state()
+
+
+def init_app(app):
+    """Registra los endpoints de salud en el servidor Flask"""
+    server = app.server
+
+    @server.route(LIVE_URL)
+    def healthz_live():
+        return jsonify({'status': 'alive', 'pid': os.getpid()})
+
+    @server.route(READY_URL)
+    def healthz_ready():
+        state = warmup_state()
+        return jsonify(state), (200 if is_ready() else 503)
@@ -0,0 +1,55 @@
+"""
+Tabs del dashboard, un módulo por tab, importados en la primera navegación.
+
+Dash congela el mapa de callbacks en la primera petición y el navegador pide
+las dependencias una sola vez, así que los callbacks se declaran al arrancar
+(en ``app.py``, solo con ids). Lo que sí se difiere es su implementación: los
+layouts, los accesores de datos y los constructores de figuras viven en
+``src/tabs/<tab>.py`` junto con sus imports pesados (plotly, numpy) y se
+cargan con ``load_tab`` cuando el tab se abre por primera vez.
+
+Cada módulo expone ``layout()`` (el render del tab) y sus funciones
+``create_*``. Con el warm-up activo el master de gunicorn los carga todos
+antes del fork; con ``AIFA_WARMUP=0`` cada worker carga solo los tabs que
+se visitan.
+"""
+
+import importlib
+import logging
+import sys
+import time
+
+from ..perf.instrument import span
+
+logger = logging.getLogger('aifa.tabs')
+
+TAB_MODULES = {
+    'strategic': 'src.tabs.strategic',
+    'geographic': 'src.tabs.geographic',
+    'control-360': 'src.tabs.control_360',
+    'financial': 'src.tabs.financial',
+    'capacity': 'src.tabs.capacity',
+    'security': 'src.tabs.security',
+    'quality': 'src.tabs.quality',
+    'productivity': 'src.tabs.productivity',
+    'metodologia': 'src.tabs.metodologia',
+    'sistema': 'src.tabs.sistema',
+}
+
+
+def load_tab(tab_id):
+    """Módulo del tab ``tab_id``; lo importa la primera vez"""
+    name = TAB_MODULES[tab_id]
+    if name not in sys.modules:
+        start = time.perf_counter()
+        with span(f'import {name}', 'data'):
+            importlib.import_module(name)
+        logger.info("Tab cargado", extra={'tab': tab_id,
+                                          'import_ms': round((time.perf_counter() - start) * 1000, 2)})
+    # import_module espera si otro hilo aún está inicializando el módulo
+    return importlib.import_module(name)
+
+
+def loaded_tabs():
+    """Ids de los tabs ya importados en este proceso"""
+    return [tab_id for tab_id, name in TAB_MODULES.items() if name in sys.modules]
@@ -0,0 +1,90 @@
+"""
+Componentes compartidos entre tabs (tarjetas KPI y layout estilo Bloomberg).
+"""
+
+from dash import html
+import dash_bootstrap_components as dbc
+from dash_iconify import DashIconify
+
+from ..perf.memo import memoize_component
+
+# KPI Card component
+@memoize_component
+def create_kpi_card(title, value, change, icon, target=None, unit="", format_type="percent"):
+    trend_color = '#00ff88' if change > 0 else '#ff4757'
+    trend_arrow = '↗' if change > 0 else '↘'
+    
+    if format_type == "percent":
+        value_display = f"{value}%"
+        change_display = f"{change:+.1f}%"
+    elif format_type == "decimal":
+        value_display = f"{value:.2f}{unit}"
+        change_display = f"{change:+.2f}"
+    elif format_type == "integer":
+        value_display = f"{value:,}{unit}"
+        change_display = f"{change:+.0f}"
+    else:
+        value_display = f"{value}{unit}"
+        change_display = f"{change:+.1f}"
+    
+    progress = (value / target * 100) if target else None
+    
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                html.Div([
+                    DashIconify(icon=icon, width=30, height=30, style={'color': '#00d4ff'})
+                ], className="kpi-icon"),
+                html.Div([
+                    html.H6(title, className="kpi-title"),
+                    html.H3(value_display, className="kpi-value"),
+                    html.Div([
+                        html.Span(trend_arrow, style={'color': trend_color, 'fontSize': '16px'}),
+                        html.Span(change_display, style={'color': trend_color, 'marginLeft': '5px'})
+                    ], className="kpi-change"),
+                    html.Small("vs mes anterior", className="kpi-period")
+                ], className="kpi-content")
+            ], className="kpi-header"),
+            
+            # Progress bar if target exists
+            html.Div([
+                dbc.Progress(
+                    value=progress if progress else 0,
+                    color="info" if progress and progress >= 90 else "warning" if progress and progress >= 70 else "danger",
+                    style={'height': '4px', 'background': 'rgba(255,255,255,0.1)'}
+                ) if target else None,
+                html.Small(f"Meta: {target}{unit if format_type != 'percent' else '%'}" if target else "", className="kpi-target")
+            ], className="kpi-progress") if target else None
+        ])
+    ], className="kpi-card")
+
+def create_financial_kpi(title, value, change, icon):
+    """Crear KPI financiero con icono"""
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                DashIconify(icon=icon, width=32, height=32, className="financial-icon"),
+                html.Div([
+                    html.H4(value, className="financial-kpi-value"),
+                    html.P(title, className="financial-kpi-title"),
+                    html.Small(change, className="financial-kpi-change")
+                ])
+            ], className="d-flex align-items-center")
+        ])
+    ], className="financial-kpi-card")
+
+# Bloomberg Terminal Layout Helper
+def get_bloomberg_layout():
+    return {
+        'paper_bgcolor': 'rgba(0,0,0,0)',
+        'plot_bgcolor': 'rgba(10, 14, 39, 0.9)',
+        'font': {'color': 'white', 'family': 'Inter'},
+        'margin': {'l': 40, 'r': 40, 't': 40, 'b': 40},
+        'showlegend': True,
+        'legend': {
+            'font': {'color': 'white'},
+            'bgcolor': 'rgba(26, 31, 58, 0.8)'
+        },
+        'xaxis': {'color': '#a0aec0', 'gridcolor': 'rgba(0, 212, 255, 0.1)'},
+        'yaxis': {'color': '#a0aec0', 'gridcolor': 'rgba(0, 212, 255, 0.1)'}
+    }
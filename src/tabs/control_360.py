@@ -0,0 +1,28 @@
+"""
+Tab Control 360°.
+"""
+
+from dash import html
+
+from ..perf.instrument import instrument
+
+@instrument(kind='layout')
+def render_control_360_tab():
+    """Renderiza el tab del Control 360° con la demo 3D interactiva"""
+    return html.Div([
+        html.H4("Control 360° - Red Global de Rutas AIFA", className="page-title"),
+        html.P("Sistema de Navegación Ejecutiva | Tecnología Aeroportuaria Premium", 
+               className="page-subtitle"),
+        
+        # Container principal para la demo 3D
+        html.Div([
+            # Iframe que carga la demo 3D routes
+            html.Iframe(
+                src="/assets/demo_3d_routes.html",
+                className="control-360-iframe"
+            )
+        ], className="control-360-container")
+    ])
+
+# Punto de entrada para src.tabs.load_tab
+layout = render_control_360_tab
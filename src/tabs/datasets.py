@@ -0,0 +1,40 @@
+"""
+Datasets compartidos con el navegador en ``dcc.Store`` versionados.
+
+Cada dataset viaja completo una sola vez y el navegador lo guarda en el
+storage de sesión junto con su huella (``dataset-<nombre>`` y
+``dataset-<nombre>-version``). Los callbacks del lado del cliente
+(``assets/datasets.js``) derivan de él la vista de cada gráfica. Cuando se
+abre un tab que usa el dataset, o llega una versión de datos nueva, el
+servidor compara la huella del cliente con la actual y solo reenvía los
+datos si cambiaron; la petición lleva la huella, no los datos.
+"""
+
+from ..data.accessors import fingerprint
+
+# nombre -> (tab que lo usa, accesor del módulo del tab)
+DATASETS = {
+    'routes': ('geographic', 'get_route_columns'),
+    'kpi': ('strategic', 'get_kpi_data'),
+}
+
+
+def store_id(name):
+    return f'dataset-{name}'
+
+
+def version_store_id(name):
+    return f'dataset-{name}-version'
+
+
+def load_dataset(name):
+    from . import load_tab
+    tab, accessor = DATASETS[name]
+    return getattr(load_tab(tab), accessor)()
+
+
+def dataset_update(name, client_version):
+    """``(datos, huella)`` si el cliente no tiene la versión actual; ``None`` si está al día"""
+    data = load_dataset(name)
+    version = fingerprint(data)
+    return None if version == client_version else (data, version)
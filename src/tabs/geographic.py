@@ -0,0 +1,389 @@
+"""
+Tab Análisis Geográfico: rutas (``src/data/routes.py``), layout y mapa de red.
+
+La distribución por región se deriva en el navegador del dataset ``routes``. Las bandas de
+distancia desde el AIFA salen del índice espacial (``src/data/spatial.py``) y
+el panel de destinos del top-K en streaming (``src/data/topk.py``), con su
+propio callback (``update_top_destinations`` en ``app.py``) porque cambia con
+cada evento de pasajeros y no con la versión de datos.
+"""
+
+import logging
+
+from dash import html, dcc
+import dash_bootstrap_components as dbc
+from dash_iconify import DashIconify
+import plotly.graph_objects as go
+
+from ..data.accessors import ttl_cached
+from ..data.routes import HUB, route_table
+from ..data.spatial import route_index
+from ..data.topk import destination_tracker, top_destinations
+from ..perf.instrument import instrument
+from .components import create_kpi_card
+
+logger = logging.getLogger('aifa.callbacks')
+
+@instrument(kind='data')
+@ttl_cached('routes', ttl=900)
+def get_route_table():
+    return route_table()
+
+@instrument(kind='data')
+def get_route_index():
+    return route_index(get_route_table())
+
+@instrument(kind='data')
+def get_top_destinations():
+    return top_destinations(get_route_table())
+
+def get_destinations_revision():
+    """Eventos registrados en el tracker de destinos; cambia cuando hay que redibujar el panel"""
+    return destination_tracker(get_route_table()).revision
+
+@instrument(kind='data')
+def get_route_columns():
+    """Rutas en columnas para el dataset ``routes`` del navegador"""
+    return get_route_table().to_columns()
+
+# Enhanced destination card for geographic tab
+def create_enhanced_destination_card(route):
+    """Crear tarjeta mejorada de destino con glassmorphism"""
+    return html.Div([
+        html.Div([
+            html.Div([
+                html.H6(f"{route['city']}, {route['country']}", style={
+                    'color': '#ffffff', 
+                    'margin': '0 0 0.5rem 0', 
+                    'fontWeight': '600',
+                    'fontSize': '0.95rem'
+                }),
+                html.Div([
+                    html.Span(f"{route['passengers']:,}", style={
+                        'color': '#00d4ff', 
+                        'fontWeight': '700',
+                        'fontSize': '1.1rem'
+                    }),
+                    html.Span(" pax/año", style={
+                        'color': '#8b92a9', 
+                        'fontSize': '0.8rem',
+                        'marginLeft': '4px'
+                    })
+                ], style={'marginBottom': '0.25rem'}),
+            ], className="destination-info"),
+            html.Div([
+                html.Div(f"{route['load_factor']}%", style={
+                    'color': '#f59e0b',
+                    'fontWeight': '600',
+                    'fontSize': '0.9rem'
+                }),
+                html.Div("Load Factor", style={
+                    'color': '#8b92a9',
+                    'fontSize': '0.7rem'
+                })
+            ], className="destination-metric")
+        ], className="destination-row"),
+        
+        html.Div([
+            DashIconify(icon="mdi:calendar", width=16, height=16, style={'marginRight': '6px', 'color': '#8b92a9'}),
+            html.Span(f"{route['frequency']} vuelos/mes", style={
+                'color': '#8b92a9',
+                'fontSize': '0.75rem'
+            }),
+            html.Span(" | ", style={
+                'color': '#8b92a9',
+                'margin': '0 6px'
+            }),
+            DashIconify(icon="mdi:airplane", width=16, height=16, style={'marginRight': '4px', 'color': '#8b92a9'}),
+            html.Span(f"{route['frequency']//4} vuelos/sem", style={
+                'color': '#8b92a9',
+                'fontSize': '0.75rem'
+            })
+        ], className="destination-details")
+    ], className="enhanced-destination-card")
+
+def create_distance_band_card(band):
+    """Totales de una banda de distancia al AIFA (estilos en ``.distance-band-card``)"""
+    if band['high_km'] == float('inf'):
+        distance = f"> {band['low_km']:,.0f} km"
+    else:
+        distance = f"{band['low_km']:,.0f} – {band['high_km']:,.0f} km"
+    return html.Div([
+        html.Div([
+            html.Div([
+                html.H6(band['label'], className="band-label"),
+                html.Div([
+                    html.Span(f"{band['passengers']:,}", className="band-value"),
+                    html.Span(" pax/año", className="band-unit")
+                ], className="band-total"),
+            ], className="destination-info"),
+            html.Div([
+                html.Div(f"{band['routes']}", className="band-metric-value"),
+                html.Div("Rutas", className="band-metric-label")
+            ], className="destination-metric")
+        ], className="destination-row"),
+
+        html.Div([
+            DashIconify(icon="mdi:map-marker-distance", width=16, height=16, className="band-icon"),
+            html.Span(distance),
+            html.Span("|", className="band-separator"),
+            DashIconify(icon="mdi:airplane", width=16, height=16, className="band-icon"),
+            html.Span(f"{band['frequency']} vuelos/mes")
+        ], className="destination-details")
+    ], className="enhanced-destination-card distance-band-card")
+
+@instrument(kind='layout')
+def render_top_destinations():
+    """Tarjetas del panel Principales Destinos"""
+    return [create_enhanced_destination_card(route) for route in get_top_destinations()]
+
+@instrument(kind='layout')
+def render_geographic_tab():
+    distance_bands = get_route_index().bands()
+    
+    return html.Div([
+        html.H4("Análisis Geográfico", className="page-title"),
+        html.P("Red de destinos, rutas estratégicas y análisis de mercado", className="page-subtitle"),
+        
+        # KPIs Geográficos - Grid 2x3 Balanceado y Responsive
+        dbc.Row([
+            dbc.Col([
+                create_kpi_card("Destinos Activos", 28, 3, "mdi:map-marker-multiple", None, "", "integer")
+            ], lg=4, md=6, sm=12),
+            dbc.Col([
+                create_kpi_card("Países Conectados", 8, 2, "mdi:earth", None, "", "integer")
+            ], lg=4, md=6, sm=12),
+            dbc.Col([
+                create_kpi_card("Rutas Internacionales", 12, 4, "mdi:airplane", None, "", "integer")
+            ], lg=4, md=6, sm=12)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                create_kpi_card("Rutas Domésticas", 16, 1, "mdi:home-map-marker", None, "", "integer")
+            ], lg=4, md=6, sm=12),
+            dbc.Col([
+                create_kpi_card("Nuevas Rutas 2024", 7, 7, "mdi:plus-circle", None, "", "integer")
+            ], lg=4, md=6, sm=12),
+            dbc.Col([
+                create_kpi_card("Factor Carga Promedio", 84.2, 2.1, "mdi:gauge", None, "%", "decimal")
+            ], lg=4, md=6, sm=12)
+        ], className="mb-4"),
+        
+        
+        # Bandas de distancia desde el AIFA (índice espacial)
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Rutas por Distancia", className="chart-title"),
+                        html.Small("Distancia de gran círculo desde el AIFA", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dbc.Row([
+                            dbc.Col([create_distance_band_card(band)], lg=4, md=6, sm=12)
+                            for band in distance_bands
+                        ])
+                    ])
+                ], className="chart-card")
+            ], width=12)
+        ], className="mb-4"),
+        
+        # Panel de Destinos
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Principales Destinos", className="chart-title"),
+                        html.Small("Red de rutas y conexiones AIFA", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        # Se llena con update_top_destinations, fuera del layout cacheado
+                        html.Div(id="top-destinations-panel"),
+                        dcc.Store(id="top-destinations-revision")
+                    ])
+                ], className="chart-card")
+            ], width=12)
+        ], className="mb-4"),
+        
+        # Gráficas Simplificadas
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Distribución por Región", className="chart-title"),
+                        html.Small("Tráfico de pasajeros por zona geográfica", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="geographic-distribution-chart")
+                    ])
+                ], className="chart-card")
+            ], width=12)
+        ])
+    ])
+
+@instrument(kind='figure')
+def create_route_network_figure(filter_type):
+    """Construye el mapa de rutas para un filtro: 'all', 'international' o 'domestic'"""
+    try:
+        # Obtener datos
+        table = get_route_table()
+        hub = HUB
+        route_type = filter_type if filter_type in ('international', 'domestic') else None
+        routes = table.records(table.rows(route_type=route_type))
+        
+        # Crear figura
+        fig = go.Figure()
+        
+        # 1. Hub AIFA - Marker central premium
+        fig.add_trace(go.Scattergeo(
+            lat=[hub['lat']],
+            lon=[hub['lon']],
+            text=['✈️ AIFA HUB'],
+            mode='markers+text',
+            marker=dict(
+                size=45,
+                color='#f59e0b',  # Color dorado para destacar
+                line=dict(width=6, color='white'),
+                symbol='star',
+                opacity=1.0
+            ),
+            textposition='bottom center',
+            textfont=dict(size=16, color='white', family='Inter'),
+            name='AIFA Hub',
+            hovertemplate='<b>🛬 AIFA - Hub Principal</b><br>📍 Felipe Ángeles International<br>🌐 Rutas Activas: ' + str(len(routes)) + '<br>📊 Estado: Operacional<extra></extra>'
+        ))
+        
+        # 2. Líneas de rutas - Mejoradas para mayor visibilidad
+        for route in routes:
+            # Colores más contrastantes y visibles
+            if route['type'] == 'international':
+                line_color = '#00d4ff'  # Azul brillante para internacionales
+                line_dash = 'solid'
+            else:
+                line_color = '#00ff88'  # Verde brillante para domésticas  
+                line_dash = 'solid'
+            
+            # Grosor basado en volumen pero más grueso
+            line_width = max(4, min(route['passengers']/20000, 12))  # Entre 4 y 12px
+            
+            fig.add_trace(go.Scattergeo(
+                lat=[hub['lat'], route['lat']],
+                lon=[hub['lon'], route['lon']],
+                mode='lines',
+                line=dict(
+                    width=line_width,
+                    color=line_color,
+                    opacity=1.0,  # Opacity completa para máxima visibilidad
+                    dash=line_dash
+                ),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+        
+        # 3. Markers de destinos - Rediseñados para mayor visibilidad
+        for route in routes:
+            # Tamaños más grandes y distintivos
+            marker_size = max(18, min(route['passengers']/8000, 35))  # Entre 18 y 35px
+            
+            # Colores más vibrantes y diferenciados
+            if route['type'] == 'international':
+                marker_color = '#ff6b35'  # Naranja vibrante para internacionales
+                marker_symbol = 'square'
+            else:
+                marker_color = '#00ff88'  # Verde brillante para domésticas
+                marker_symbol = 'circle'
+            
+            fig.add_trace(go.Scattergeo(
+                lat=[route['lat']],
+                lon=[route['lon']],
+                text=[route['city']],
+                mode='markers+text',
+                marker=dict(
+                    size=marker_size,
+                    color=marker_color,
+                    line=dict(width=4, color='white'),  # Border más grueso
+                    symbol=marker_symbol,
+                    opacity=1.0
+                ),
+                textposition='top center',
+                textfont=dict(size=11, color='white', family='Inter'),
+                showlegend=False,
+                hovertemplate='<b>🎯 ' + route['city'] + '</b><br>' +
+                             '👥 Pasajeros: ' + f"{route['passengers']:,}" + '/año<br>' +
+                             '✈️ Vuelos: ' + str(route['frequency']) + '/mes<br>' +
+                             '🌐 Tipo: ' + route['type'].title() + '<br>' +
+                             '📈 Load Factor: Excelente<extra></extra>'
+            ))
+        
+        # Layout del mapa - Optimizado para mejor contraste
+        fig.update_layout(
+            geo=dict(
+                scope='world',
+                projection_type='natural earth',
+                showland=True,
+                landcolor='rgba(15, 20, 35, 0.95)',  # Más oscuro para contraste
+                showocean=True,
+                oceancolor='rgba(5, 10, 25, 0.98)',  # Océano más profundo
+                showcountries=True,
+                countrycolor='rgba(0, 212, 255, 0.6)',  # Borders más visibles
+                coastlinecolor='rgba(0, 212, 255, 0.7)',
+                showlakes=False,  # Eliminar lagos para simplificar
+                bgcolor='rgba(0,0,0,0)',
+                showframe=False,
+                center=dict(lat=25, lon=-95),
+                projection_scale=1.1,  # Zoom ligeramente menor
+                resolution=50  # Mejor resolución
+            ),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white', family='Inter'),
+            margin=dict(l=0, r=0, t=0, b=0),
+            showlegend=False,
+            height=500,
+            title=dict(
+                text="",
+                x=0.5,
+                font=dict(size=18, color='white')
+            )
+        )
+        
+        return fig
+        
+    except Exception:
+        # En caso de error, devolver mapa básico
+        logger.exception("Error en update_route_network", extra={'callback': 'route-network-map.figure'})
+        
+        # Mapa de respaldo básico
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scattergeo(
+            lat=[19.7373],
+            lon=[-99.0068],
+            text=['AIFA'],
+            mode='markers+text',
+            marker=dict(size=30, color='#00d4ff'),
+            textposition='bottom center'
+        ))
+        
+        fig.update_layout(
+            geo=dict(
+                scope='world',
+                projection_type='natural earth',
+                showland=True,
+                landcolor='rgba(26, 31, 58, 0.8)',
+                showocean=True,
+                oceancolor='rgba(10, 14, 39, 0.9)',
+                center=dict(lat=25, lon=-95)
+            ),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            margin=dict(l=0, r=0, t=0, b=0),
+            height=500
+        )
+        
+        return fig
+
+# Punto de entrada para src.tabs.load_tab
+layout = render_geographic_tab
@@ -0,0 +1,784 @@
+"""
+Tab Productividad: dashboard ejecutivo y sus seis figuras.
+"""
+
+from dash import html, dcc
+import dash_bootstrap_components as dbc
+from dash_iconify import DashIconify
+import plotly.graph_objects as go
+import numpy as np
+
+from ..perf.background import PROGRESS_CLASS
+from ..data.accessors import ttl_cached
+from ..perf.instrument import instrument
+from ..perf.memo import memoize_component
+
+@instrument(kind='data')
+@ttl_cached('productivity', ttl=3600)
+def get_productivity_data():
+    """Datos completos de los 5 KPIs oficiales de Productividad AIFA"""
+    return {
+        # KPIs Principales - Executive Dashboard
+        'movements_per_hour': {
+            'current': 18.2,
+            'benchmark': 16.0,
+            'unit': 'mov/hr',
+            'trend': 'up',
+            'performance': 113.8,
+            'change': 1.2
+        },
+        'turnaround_time': {
+            'current': 35,
+            'benchmark': 40,
+            'unit': 'min',
+            'trend': 'down',  # down is good for turnaround time
+            'performance': 114.3,
+            'change': -3
+        },
+        'gate_utilization': {
+            'current': 78.4,
+            'benchmark': 75.0,
+            'unit': '%',
+            'trend': 'up',
+            'performance': 104.5,
+            'change': 2.8
+        },
+        'staff_productivity': {
+            'current': 1380,
+            'benchmark': 1200,
+            'unit': 'pax/emp',
+            'trend': 'up',
+            'performance': 115.0,
+            'change': 85
+        },
+        'cost_per_wlu': {
+            'current': 11.20,
+            'benchmark': 12.50,
+            'unit': 'USD',
+            'trend': 'down',  # down is good for costs
+            'performance': 110.4,
+            'change': -0.95
+        }
+    }
+
+@instrument(kind='data')
+@ttl_cached('executive_metrics', ttl=3600)
+def get_executive_metrics():
+    """Métricas ejecutivas derivadas para dashboard de productividad"""
+    return {
+        'revenue_per_movement': 2450,
+        'revenue_per_movement_change': '+3.2%',
+        'asset_utilization': 84.5,
+        'asset_utilization_change': '+2.1%',
+        'labor_efficiency': 91.8,
+        'labor_efficiency_change': '+1.8%',
+        'process_optimization': 87.3,
+        'process_optimization_change': '+4.2%'
+    }
+
+@instrument(kind='data')
+@ttl_cached('benchmark', ttl=3600)
+def get_benchmark_data():
+    """Datos de benchmark internacional para comparación"""
+    return {
+        'aifa': [112.7, 114.0, 112.5, 104.9, 111.9, 108.5],
+        'promedio_latam': [95, 92, 88, 90, 85, 87],
+        'promedio_global': [100, 100, 100, 100, 100, 100],
+        'top_performer': [125, 130, 120, 115, 125, 118],
+        'categorias': ['Pax/Empleado', 'Ops/Empleado', 'Carga/Empleado', 'Ops/Puerta', 'Pax/Puerta', 'Eficiencia']
+    }
+
+# Executive Dashboard Components for Productivity
+@memoize_component
+def create_productivity_kpi_enhanced(title, current, benchmark, unit, trend, icon, performance):
+    """KPI card ejecutiva con benchmark comparison"""
+    trend_color = "#00ff88" if trend == 'up' else "#ff4757" if trend == 'down' else "#f59e0b"
+    perf_color = "#00ff88" if performance >= 110 else "#f59e0b" if performance >= 100 else "#ff4757"
+    
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                DashIconify(icon=icon, width=48, height=48, style={'color': '#00d4ff', 'marginBottom': '0.75rem'}),
+                html.H3(f"{current:,}" if isinstance(current, int) else str(current), 
+                       style={'color': '#00d4ff', 'fontSize': '1.8rem', 'fontWeight': '700', 'margin': '0.5rem 0'}),
+                html.P(unit, style={'color': '#ffffff', 'fontSize': '0.9rem', 'margin': '0.25rem 0'}),
+                html.H6(title, style={'color': '#ffffff', 'fontSize': '1rem', 'fontWeight': '600', 'margin': '0.75rem 0 0.5rem 0'}),
+                
+                # Benchmark comparison bar
+                html.Div([
+                    html.Small(f"Benchmark: {benchmark:,}", style={'color': '#a0aec0', 'fontSize': '0.75rem', 'display': 'block', 'marginBottom': '0.5rem'}),
+                    dbc.Progress([
+                        dbc.Progress(value=min(performance, 150), 
+                                   color="success" if performance >= 110 else "warning" if performance >= 100 else "danger",
+                                   bar=True, 
+                                   style={'height': '6px'})
+                    ], max=150, style={'height': '6px', 'backgroundColor': 'rgba(255,255,255,0.1)'}),
+                    html.Div([
+                        html.Span(f"{performance:.1f}%", style={'color': perf_color, 'fontWeight': '600', 'fontSize': '0.85rem'}),
+                        html.Span(" vs benchmark", style={'color': '#a0aec0', 'fontSize': '0.75rem', 'marginLeft': '4px'})
+                    ], style={'marginTop': '0.5rem'})
+                ], style={'marginTop': '1rem'})
+            ], style={'textAlign': 'center', 'padding': '1rem'})
+        ], style={'padding': '0.5rem'})
+    ], className="productivity-kpi-card", style={'height': '240px'})
+
+def create_executive_metric(title, value, change, unit):
+    """Métrica ejecutiva para summary section"""
+    change_color = "#00ff88" if change.startswith('+') else "#ff4757" if change.startswith('-') else "#f59e0b"
+    
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                html.H4(value, style={'color': '#00d4ff', 'fontSize': '1.4rem', 'fontWeight': '700', 'margin': '0'}),
+                html.P(title, style={'color': '#ffffff', 'fontSize': '0.85rem', 'margin': '0.5rem 0 0.25rem 0'}),
+                html.Div([
+                    html.Span(change, style={'color': change_color, 'fontSize': '0.8rem', 'fontWeight': '600'}),
+                    html.Span(f" {unit}", style={'color': '#a0aec0', 'fontSize': '0.75rem', 'marginLeft': '4px'})
+                ])
+            ], style={'textAlign': 'center'})
+        ], style={'padding': '1rem'})
+    ], className="executive-metric-card")
+
+def calculate_productivity_index(kpis_dict):
+    """Calcula índice consolidado de productividad"""
+    performances = [kpi['performance'] for kpi in kpis_dict.values()]
+    return sum(performances) / len(performances)
+
+def get_productivity_chart_layout():
+    """Layout estándar para gráficos ejecutivos de productividad"""
+    return {
+        'paper_bgcolor': 'rgba(0,0,0,0)',
+        'plot_bgcolor': 'rgba(10, 14, 39, 0.95)',
+        'font': {'color': 'white', 'family': 'Inter', 'size': 12},
+        'margin': {'l': 80, 'r': 40, 't': 40, 'b': 80},
+        'xaxis': {'color': '#a0aec0', 'gridcolor': 'rgba(0, 212, 255, 0.15)', 'showgrid': True},
+        'yaxis': {'color': '#a0aec0', 'gridcolor': 'rgba(0, 212, 255, 0.15)', 'showgrid': True},
+        'legend': {'font': {'color': 'white'}, 'bgcolor': 'rgba(26, 31, 58, 0.9)'},
+        'hovermode': 'x unified'
+    }
+
+@instrument(kind='layout')
+def render_productivity_tab():
+    """
+    Render productivity operational tab with Executive Dashboard
+    """
+    productivity_data = get_productivity_data()
+    executive_metrics = get_executive_metrics()
+    
+    # Calculate global efficiency index
+    efficiency_index = calculate_productivity_index(productivity_data)
+    
+    return html.Div([
+        # Executive Header
+        html.Div([
+            html.Div([
+                DashIconify(icon="mdi:factory", width=32, height=32, style={'marginRight': '15px', 'color': '#00d4ff'}),
+                html.Div([
+                    html.H3("Executive Dashboard - Productividad Operacional", 
+                           style={'margin': 0, 'fontWeight': '600', 'color': '#ffffff'}),
+                    html.P("AIFA Operations Command Center", 
+                          style={'margin': 0, 'fontSize': '14px', 'color': '#8b92a9'})
+                ])
+            ], style={'display': 'flex', 'alignItems': 'center'}),
+            
+            html.Div([
+                html.Div([
+                    html.P("ÍNDICE GLOBAL DE EFICIENCIA", 
+                          style={'margin': 0, 'fontSize': '12px', 'color': '#8b92a9', 'letterSpacing': '1px'}),
+                    html.H2(f"{efficiency_index}%", 
+                           style={'margin': 0, 'color': '#00ff88' if efficiency_index >= 85 else '#ffa726', 'fontWeight': '700'})
+                ], style={'textAlign': 'right'})
+            ])
+        ], style={
+            'display': 'flex',
+            'justifyContent': 'space-between',
+            'alignItems': 'center',
+            'marginBottom': '30px',
+            'padding': '20px',
+            'background': 'rgba(255, 255, 255, 0.05)',
+            'borderRadius': '12px',
+            'backdropFilter': 'blur(10px)'
+        }),
+        
+        # Main KPIs Grid - Official AIFA Productivity KPIs
+        dbc.Row([
+            dbc.Col([
+                create_productivity_kpi_enhanced(
+                    title="Movimientos por Hora",
+                    current=productivity_data['movements_per_hour']['current'],
+                    benchmark=productivity_data['movements_per_hour']['benchmark'],
+                    unit="mov/hr",
+                    trend=productivity_data['movements_per_hour']['trend'],
+                    icon="mdi:airplane-clock",
+                    performance=productivity_data['movements_per_hour']['performance']
+                )
+            ], width=12, md=6, lg=4, xl=2.4, style={'marginBottom': '20px'}),
+            
+            dbc.Col([
+                create_productivity_kpi_enhanced(
+                    title="Tiempo de Rotación",
+                    current=productivity_data['turnaround_time']['current'],
+                    benchmark=productivity_data['turnaround_time']['benchmark'],
+                    unit="min",
+                    trend=productivity_data['turnaround_time']['trend'],
+                    icon="mdi:timer-outline",
+                    performance=productivity_data['turnaround_time']['performance']
+                )
+            ], width=12, md=6, lg=4, xl=2.4, style={'marginBottom': '20px'}),
+            
+            dbc.Col([
+                create_productivity_kpi_enhanced(
+                    title="Utilización de Puertas",
+                    current=productivity_data['gate_utilization']['current'],
+                    benchmark=productivity_data['gate_utilization']['benchmark'],
+                    unit="%",
+                    trend=productivity_data['gate_utilization']['trend'],
+                    icon="mdi:gate",
+                    performance=productivity_data['gate_utilization']['performance']
+                )
+            ], width=12, md=6, lg=4, xl=2.4, style={'marginBottom': '20px'}),
+            
+            dbc.Col([
+                create_productivity_kpi_enhanced(
+                    title="Productividad Personal",
+                    current=productivity_data['staff_productivity']['current'],
+                    benchmark=productivity_data['staff_productivity']['benchmark'],
+                    unit="pax/emp",
+                    trend=productivity_data['staff_productivity']['trend'],
+                    icon="mdi:account-group",
+                    performance=productivity_data['staff_productivity']['performance']
+                )
+            ], width=12, md=6, lg=4, xl=2.4, style={'marginBottom': '20px'}),
+            
+            dbc.Col([
+                create_productivity_kpi_enhanced(
+                    title="Costo por UTC",
+                    current=productivity_data['cost_per_wlu']['current'],
+                    benchmark=productivity_data['cost_per_wlu']['benchmark'],
+                    unit="USD",
+                    trend=productivity_data['cost_per_wlu']['trend'],
+                    icon="mdi:currency-usd",
+                    performance=productivity_data['cost_per_wlu']['performance']
+                )
+            ], width=12, md=6, lg=4, xl=2.4, style={'marginBottom': '20px'})
+        ], justify="center"),
+        
+        # Analytics Section
+        html.Div([
+            html.H5("Analytics Operacionales", 
+                   style={'marginBottom': '20px', 'color': '#ffffff', 'fontWeight': '500'}),
+            html.Progress(id='productivity-figures-progress', value='0', max='1',
+                          className=PROGRESS_CLASS)
+        ], style={'marginTop': '30px', 'marginBottom': '20px'}),
+        
+        # Charts Grid
+        dbc.Row([
+            # Efficiency Matrix
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H6("Matriz de Eficiencia", 
+                               style={'marginBottom': '15px', 'color': '#8b92a9'}),
+                        dcc.Graph(
+                            id='productivity-efficiency-matrix',
+                            config={'displayModeBar': False}
+                        )
+                    ])
+                ], className="glass-card", style={'height': '400px'})
+            ], width=12, lg=6, style={'marginBottom': '20px'}),
+            
+            # Benchmark Comparison Radar
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H6("Comparación Benchmark Internacional", 
+                               style={'marginBottom': '15px', 'color': '#8b92a9'}),
+                        dcc.Graph(
+                            id='productivity-benchmark-radar',
+                            config={'displayModeBar': False}
+                        )
+                    ])
+                ], className="glass-card", style={'height': '400px'})
+            ], width=12, lg=6, style={'marginBottom': '20px'}),
+            
+            # Productivity Trends
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H6("Análisis de Tendencias de Productividad", 
+                               style={'marginBottom': '15px', 'color': '#8b92a9'}),
+                        dcc.Graph(
+                            id='productivity-trends',
+                            config={'displayModeBar': False}
+                        )
+                    ])
+                ], className="glass-card", style={'height': '400px'})
+            ], width=12, lg=8, style={'marginBottom': '20px'}),
+            
+            # Resource Allocation
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H6("Análisis ROI de Recursos", 
+                               style={'marginBottom': '15px', 'color': '#8b92a9'}),
+                        dcc.Graph(
+                            id='productivity-roi-scatter',
+                            config={'displayModeBar': False}
+                        )
+                    ])
+                ], className="glass-card", style={'height': '400px'})
+            ], width=12, lg=4, style={'marginBottom': '20px'}),
+            
+            # Capacity Utilization Gauges
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H6("Métricas de Utilización de Capacidad", 
+                               style={'marginBottom': '15px', 'color': '#8b92a9'}),
+                        dcc.Graph(
+                            id='productivity-capacity-gauges',
+                            config={'displayModeBar': False}
+                        )
+                    ])
+                ], className="glass-card", style={'height': '350px'})
+            ], width=12, lg=6, style={'marginBottom': '20px'}),
+            
+            # Cost Breakdown Waterfall
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.H6("Desglose de Costos Operacionales", 
+                               style={'marginBottom': '15px', 'color': '#8b92a9'}),
+                        dcc.Graph(
+                            id='productivity-cost-waterfall',
+                            config={'displayModeBar': False}
+                        )
+                    ])
+                ], className="glass-card", style={'height': '350px'})
+            ], width=12, lg=6, style={'marginBottom': '20px'})
+        ]),
+        
+        # Executive Metrics Summary
+        html.Div([
+            html.H5("Resumen Ejecutivo de Métricas", 
+                   style={'marginBottom': '20px', 'color': '#ffffff', 'fontWeight': '500'})
+        ], style={'marginTop': '30px', 'marginBottom': '20px'}),
+        
+        dbc.Row([
+            dbc.Col([
+                create_executive_metric(
+                    title="Ingresos por Movimiento",
+                    value=f"${executive_metrics['revenue_per_movement']:,.0f}",
+                    change=executive_metrics['revenue_per_movement_change'],
+                    unit="USD"
+                )
+            ], width=6, md=3),
+            
+            dbc.Col([
+                create_executive_metric(
+                    title="Utilización de Activos",
+                    value=f"{executive_metrics['asset_utilization']:.1f}%",
+                    change=executive_metrics['asset_utilization_change'],
+                    unit="percent"
+                )
+            ], width=6, md=3),
+            
+            dbc.Col([
+                create_executive_metric(
+                    title="Eficiencia Laboral",
+                    value=f"{executive_metrics['labor_efficiency']:.1f}%",
+                    change=executive_metrics['labor_efficiency_change'],
+                    unit="percent"
+                )
+            ], width=6, md=3),
+            
+            dbc.Col([
+                create_executive_metric(
+                    title="Optimización de Procesos",
+                    value=f"{executive_metrics['process_optimization']:.1f}%",
+                    change=executive_metrics['process_optimization_change'],
+                    unit="percent"
+                )
+            ], width=6, md=3)
+        ])
+    ], className="tab-content")
+
+# Productivity Chart Functions
+@instrument(kind='figure')
+def create_efficiency_matrix():
+    """Create efficiency matrix heatmap"""
+    departments = ['Operaciones Terrestres', 'Seguridad', 'Servicio al Cliente', 'Mantenimiento', 'Carga', 'Migración']
+    metrics = ['Productividad', 'Calidad', 'Control de Costos', 'Gestión del Tiempo']
+    
+    # Datos más realistas y consistentes
+    values = np.array([
+        [88, 85, 82, 90],  # Operaciones Terrestres
+        [76, 92, 78, 85],  # Seguridad  
+        [82, 88, 75, 80],  # Servicio al Cliente
+        [91, 83, 85, 87],  # Mantenimiento
+        [78, 80, 88, 82],  # Carga
+        [74, 85, 72, 78]   # Migración
+    ])
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=values,
+        x=metrics,
+        y=departments,
+        colorscale='RdYlGn',
+        showscale=True,
+        text=[[f"{val:.0f}%" for val in row] for row in values],
+        texttemplate="%{text}",
+        textfont={"size": 11, "color": "white", "family": "Inter"},
+        hovertemplate='<b>%{y}</b><br>%{x}: %{z:.0f}%<extra></extra>',
+        colorbar=dict(
+            title="Eficiencia (%)",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10)
+        )
+    ))
+    
+    fig.update_layout(
+        title=dict(
+            text="Eficiencia Operacional por Departamento",
+            font=dict(color='white', size=14, family='Inter'),
+            x=0.5
+        ),
+        xaxis=dict(
+            title="Métricas",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10)
+        ),
+        yaxis=dict(
+            title="Departamentos", 
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10)
+        ),
+        font=dict(color='white', family='Inter'),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=350,
+        margin=dict(l=120, r=60, t=60, b=60)
+    )
+    
+    return fig
+
+@instrument(kind='figure')
+def create_benchmark_radar():
+    """Create international benchmark radar chart"""
+    categories = ['Productividad Personal', 'Eficiencia de Costos', 'Tiempo de Rotación', 
+                 'Utilización de Puertas', 'Satisfacción del Cliente']
+    
+    aifa_values = [92, 85, 94, 81, 88]
+    benchmark_values = [85, 80, 88, 75, 82]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=aifa_values + [aifa_values[0]],
+        theta=categories + [categories[0]],
+        fill='toself',
+        name='AIFA',
+        line=dict(color='#00d4ff', width=3),
+        fillcolor='rgba(0, 212, 255, 0.3)',
+        marker=dict(size=8, color='#00d4ff')
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=benchmark_values + [benchmark_values[0]],
+        theta=categories + [categories[0]],
+        fill='toself',
+        name='Benchmark Internacional',
+        line=dict(color='#ffa726', width=3),
+        fillcolor='rgba(255, 167, 38, 0.2)',
+        marker=dict(size=8, color='#ffa726')
+    ))
+    
+    fig.update_layout(
+        title=dict(
+            text="Comparación con Benchmark Internacional",
+            font=dict(color='white', size=14, family='Inter'),
+            x=0.5
+        ),
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                color='white',
+                tickfont=dict(size=10),
+                gridcolor='rgba(255,255,255,0.2)'
+            ),
+            angularaxis=dict(
+                color='white',
+                tickfont=dict(size=10, family='Inter')
+            )
+        ),
+        showlegend=True,
+        legend=dict(
+            font=dict(color='white', size=11, family='Inter'),
+            x=0.85,
+            y=0.95
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=350,
+        margin=dict(l=60, r=60, t=60, b=60)
+    )
+    
+    return fig
+
+@instrument(kind='figure')
+def create_productivity_trends():
+    """Create productivity trends time series"""
+    months = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+    
+    movements_per_hour = [15.2, 15.8, 16.1, 15.9, 16.4, 16.8, 17.1, 17.3, 17.0, 17.5, 17.8, 18.2]
+    staff_productivity = [1185, 1205, 1240, 1228, 1265, 1290, 1315, 1325, 1308, 1340, 1355, 1380]
+    cost_per_wlu = [12.8, 12.5, 12.3, 12.4, 12.1, 11.9, 11.8, 11.6, 11.7, 11.5, 11.3, 11.2]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=months, y=movements_per_hour,
+        mode='lines+markers',
+        name='Movimientos/Hora',
+        line=dict(color='#00d4ff', width=3),
+        marker=dict(size=8, color='#00d4ff'),
+        hovertemplate='<b>Movimientos/Hora</b><br>%{x}: %{y:.1f}<extra></extra>',
+        yaxis='y'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=months, y=[x/100 for x in staff_productivity],
+        mode='lines+markers',
+        name='Productividad Personal (x100)',
+        line=dict(color='#00ff88', width=3),
+        marker=dict(size=8, color='#00ff88'),
+        hovertemplate='<b>Productividad Personal</b><br>%{x}: %{customdata}<extra></extra>',
+        customdata=staff_productivity,
+        yaxis='y'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=months, y=cost_per_wlu,
+        mode='lines+markers',
+        name='Costo por UTC',
+        line=dict(color='#ffa726', width=3),
+        marker=dict(size=8, color='#ffa726'),
+        hovertemplate='<b>Costo por UTC</b><br>%{x}: $%{y:.2f}<extra></extra>',
+        yaxis='y2'
+    ))
+    
+    fig.update_layout(
+        title=dict(
+            text="Tendencias de Productividad - 12 Meses",
+            font=dict(color='white', size=14, family='Inter'),
+            x=0.5
+        ),
+        xaxis=dict(
+            title="Mes",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis=dict(
+            title="Índice de Productividad",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            side='left',
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis2=dict(
+            title="Costo por UTC (USD)",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            overlaying='y',
+            side='right'
+        ),
+        legend=dict(
+            font=dict(color='white', size=11, family='Inter'),
+            x=0.02,
+            y=0.98
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=350,
+        margin=dict(l=60, r=60, t=60, b=60)
+    )
+    
+    return fig
+
+@instrument(kind='figure')
+def create_roi_scatter():
+    """Create resource ROI scatter plot"""
+    departments = ['Ops. Terrestres', 'Seguridad', 'Servicio Cliente', 'Mantenimiento', 'Carga', 'Migración', 'TI', 'Admin']
+    investment = [850, 420, 320, 1200, 380, 180, 520, 240]
+    roi = [185, 142, 138, 168, 155, 134, 172, 125]
+    
+    fig = go.Figure(data=go.Scatter(
+        x=investment,
+        y=roi,
+        mode='markers+text',
+        text=departments,
+        textposition='top center',
+        marker=dict(
+            size=20,
+            color=roi,
+            colorscale='RdYlGn',
+            showscale=True,
+            colorbar=dict(
+                title="ROI (%)",
+                titlefont=dict(color='white', size=12),
+                tickfont=dict(color='white', size=10)
+            ),
+            line=dict(width=2, color='white')
+        ),
+        textfont=dict(color='white', size=11, family='Inter'),
+        hovertemplate='<b>%{text}</b><br>Inversión: $%{x}K USD<br>ROI: %{y}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(
+            text="Inversión vs ROI por Departamento",
+            font=dict(color='white', size=14, family='Inter'),
+            x=0.5
+        ),
+        xaxis=dict(
+            title="Inversión (K USD)",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis=dict(
+            title="ROI (%)",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=350,
+        margin=dict(l=60, r=60, t=60, b=60)
+    )
+    
+    return fig
+
+@instrument(kind='figure')
+def create_capacity_gauges():
+    """Create capacity utilization gauge charts"""
+    resources = ['Puertas', 'Check-in', 'Seguridad', 'Equipajes']
+    utilizations = [78, 85, 72, 80]
+    colors = ['#00d4ff', '#00ff88', '#ffa726', '#ff6b6b']
+    
+    fig = go.Figure()
+    
+    for i, (resource, util, color) in enumerate(zip(resources, utilizations, colors)):
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=util,
+            domain={'row': i//2, 'column': i%2},
+            title={
+                'text': f"<b>{resource}</b>",
+                'font': {'color': 'white', 'size': 14, 'family': 'Inter'}
+            },
+            gauge={
+                'axis': {
+                    'range': [None, 100],
+                    'tickcolor': 'white',
+                    'tickfont': {'size': 10, 'color': 'white'}
+                },
+                'bar': {'color': color, 'thickness': 0.8},
+                'bgcolor': 'rgba(255,255,255,0.1)',
+                'borderwidth': 2,
+                'bordercolor': 'rgba(255,255,255,0.3)',
+                'steps': [
+                    {'range': [0, 50], 'color': 'rgba(255, 71, 87, 0.2)'},
+                    {'range': [50, 80], 'color': 'rgba(255, 167, 38, 0.2)'},
+                    {'range': [80, 100], 'color': 'rgba(0, 255, 136, 0.2)'}
+                ],
+                'threshold': {
+                    'line': {'color': "#ff4757", 'width': 3},
+                    'thickness': 0.75,
+                    'value': 90
+                }
+            },
+            number={
+                'font': {'color': 'white', 'size': 18, 'family': 'Inter'},
+                'suffix': '%'
+            }
+        ))
+    
+    fig.update_layout(
+        title=dict(
+            text="Utilización de Recursos Críticos",
+            font=dict(color='white', size=14, family='Inter'),
+            x=0.5,
+            y=0.95
+        ),
+        grid={'rows': 2, 'columns': 2, 'pattern': "independent"},
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+    
+    return fig
+
+@instrument(kind='figure')
+def create_cost_waterfall():
+    """Create operational cost breakdown waterfall chart"""
+    categories = ['Personal', 'Infraestructura', 'Tecnología', 'Energía', 'Mantenimiento', 'Otros']
+    values = [4500, 2800, 1200, 800, 1100, 600]
+    
+    fig = go.Figure(go.Waterfall(
+        name="Desglose de Costos",
+        orientation="v",
+        measure=["relative"]*len(categories),
+        x=categories,
+        textposition="auto",
+        text=[f"${v}K" for v in values],
+        y=values,
+        textfont=dict(color='white', size=12, family='Inter'),
+        connector={"line": {"color": "rgba(255,255,255,0.3)", "width": 2}},
+        increasing={"marker": {"color": "#00d4ff", "line": {"color": "white", "width": 2}}},
+        decreasing={"marker": {"color": "#ff4757", "line": {"color": "white", "width": 2}}},
+        totals={"marker": {"color": "#00ff88", "line": {"color": "white", "width": 2}}},
+        hovertemplate='<b>%{x}</b><br>Costo: $%{y}K USD<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(
+            text="Desglose de Costos Operacionales Mensuales",
+            font=dict(color='white', size=14, family='Inter'),
+            x=0.5
+        ),
+        xaxis=dict(
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis=dict(
+            title="Costo (K USD)",
+            titlefont=dict(color='white', size=12),
+            tickfont=dict(color='white', size=10),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=300,
+        margin=dict(l=60, r=20, t=60, b=60)
+    )
+    
+    return fig
+
+# Productivity Chart Callbacks
+PRODUCTIVITY_FIGURES = {
+    'productivity-efficiency-matrix': create_efficiency_matrix,
+    'productivity-benchmark-radar': create_benchmark_radar,
+    'productivity-trends': create_productivity_trends,
+    'productivity-roi-scatter': create_roi_scatter,
+    'productivity-capacity-gauges': create_capacity_gauges,
+    'productivity-cost-waterfall': create_cost_waterfall,
+}
+
+# Punto de entrada para src.tabs.load_tab
+layout = render_productivity_tab
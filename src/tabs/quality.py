@@ -0,0 +1,543 @@
+"""
+Tab Calidad de Servicio: customer journey y las cuatro figuras de satisfacción.
+"""
+
+from dash import html, dcc
+import dash_bootstrap_components as dbc
+from dash_iconify import DashIconify
+import plotly.graph_objects as go
+
+from ..data.accessors import ttl_cached
+from ..perf.instrument import instrument
+from ..perf.memo import memoize_component
+
+@instrument(kind='data')
+@ttl_cached('quality', ttl=3600)
+def get_quality_data():
+    """Datos completos de los 11 KPIs oficiales de Calidad de Servicio AIFA"""
+    return {
+        # KPIs oficiales del documento AIFA (11 métricas mandatorias)
+        'capacidad_diaria': {'value': 485, 'target': 450, 'unit': 'movimientos/día', 'status': 'excellent', 'trend': 12},
+        'demoras_motivo': {'total': 47, 'climaticas': 18, 'tecnicas': 15, 'operacionales': 14, 'unit': 'demoras/día'},
+        'demora_promedio': {'avg': 12.3, 'target': 15.0, 'unit': 'min/vuelo', 'status': 'excellent', 'trend': -1.2},
+        'tiempo_seguridad': {'avg': 6.4, 'target': 8.0, 'unit': 'min', 'status': 'excellent', 'trend': -0.3},
+        'disponibilidad_equipaje': {'availability': 98.5, 'target': 95.0, 'unit': '%', 'status': 'excellent', 'trend': 1.2},
+        'tiempo_checkin_pico': {'avg': 3.2, 'target': 5.0, 'unit': 'min', 'status': 'excellent', 'trend': -0.1},
+        'tiempo_equipaje_pico': {'avg': 8.1, 'target': 12.0, 'unit': 'min', 'status': 'excellent', 'trend': 0.4},
+        'facilidad_ubicacion': {'score': 4.4, 'target': 4.0, 'unit': '/5', 'status': 'excellent', 'trend': 0.1},
+        'precision_informacion': {'score': 4.6, 'target': 4.0, 'unit': '/5', 'status': 'excellent', 'trend': 0.2},
+        'limpieza_banos': {'score': 4.5, 'target': 4.0, 'unit': '/5', 'status': 'excellent', 'trend': 0.2},
+        'satisfaccion_general': {'score': 4.6, 'target': 4.0, 'unit': '/5', 'status': 'excellent', 'trend': 0.1},
+        
+        # NPS Score y breakdown
+        'nps_score': {'score': 67, 'target': 50, 'unit': '/100', 'status': 'excellent', 'trend': 3},
+        'nps_breakdown': {'promotores': 58, 'pasivos': 33, 'detractores': 9}
+    }
+
+@instrument(kind='data')
+@ttl_cached('customer_journey', ttl=3600)
+def get_customer_journey_data():
+    """Datos del Customer Journey con 6 touchpoints principales"""
+    return {
+        'llegada': {'score': 4.8, 'time': 2.1, 'target': 3.0, 'status': 'excellent', 'icon': 'mdi:car-arrow-right'},
+        'checkin': {'score': 4.6, 'time': 3.2, 'target': 5.0, 'status': 'excellent', 'icon': 'mdi:airplane-check'},
+        'seguridad': {'score': 4.4, 'time': 6.4, 'target': 8.0, 'status': 'good', 'icon': 'mdi:security'},
+        'comercial': {'score': 4.2, 'time': 15.3, 'target': 'libre', 'status': 'good', 'icon': 'mdi:shopping'},
+        'embarque': {'score': 4.7, 'time': 4.1, 'target': 5.0, 'status': 'excellent', 'icon': 'mdi:gate'},
+        'equipaje': {'score': 4.1, 'time': 8.1, 'target': 12.0, 'status': 'warning', 'icon': 'mdi:baggage-claim'}
+    }
+
+@instrument(kind='data')
+@ttl_cached('satisfaction_heatmap', ttl=3600)
+def get_satisfaction_heatmap_data():
+    """Datos para heatmap de satisfacción por áreas del aeropuerto"""
+    return [
+        ['Terminal', 'Check-in', 'Seguridad', 'Comercial'],
+        [4.8, 4.6, 4.4, 4.2],
+        [4.7, 4.5, 4.3, 4.1],
+        [4.6, 4.4, 4.2, 4.0]
+    ]
+
+# Customer Journey Experience Components
+@memoize_component
+def create_journey_touchpoint_card(title, metric, unit, target, status, icon):
+    """Crear card para cada punto del customer journey"""
+    status_colors = {
+        'excellent': '#00ff88',
+        'good': '#f59e0b', 
+        'warning': '#ff4757'
+    }
+    
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                DashIconify(icon=icon, width=36, height=36, style={'color': '#00d4ff', 'marginBottom': '0.75rem'}),
+                html.H4(f"{metric}", style={'color': '#00d4ff', 'fontSize': '1.5rem', 'fontWeight': '700', 'margin': '0.5rem 0'}),
+                html.P(unit, style={'color': '#ffffff', 'fontSize': '0.85rem', 'margin': '0.25rem 0'}),
+                html.H6(title, style={'color': '#ffffff', 'fontSize': '0.95rem', 'fontWeight': '600', 'margin': '0.75rem 0 0.5rem 0'}),
+                html.Small(f"Meta: {target}", style={'color': '#a0aec0', 'fontSize': '0.75rem', 'marginBottom': '0.75rem', 'display': 'block'}),
+                dbc.Badge(status.upper(), style={
+                    'backgroundColor': status_colors[status], 
+                    'color': '#ffffff',
+                    'fontSize': '0.7rem',
+                    'fontWeight': '600',
+                    'padding': '0.35rem 0.85rem',
+                    'borderRadius': '8px',
+                    'border': 'none',
+                    'textShadow': '0 1px 2px rgba(0,0,0,0.3)',
+                    'marginTop': '0.5rem'
+                })
+            ], style={'textAlign': 'center', 'padding': '1rem', 'minHeight': '180px', 'display': 'flex', 'flexDirection': 'column', 'justifyContent': 'space-between'})
+        ], style={'padding': '0.5rem'})
+    ], className="journey-touchpoint-card", style={'height': '200px'})
+
+@memoize_component
+def create_quality_kpi_card(title, value, unit, change, trend, icon):
+    """KPI card con indicador de tendencia para calidad"""
+    trend_icon = "mdi:trending-up" if trend == 'up' else "mdi:trending-down" if trend == 'down' else "mdi:trending-neutral"
+    trend_color = "#00ff88" if trend == 'up' else "#ff4757" if trend == 'down' else "#f59e0b"
+    
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                DashIconify(icon=icon, width=44, height=44, style={'color': '#00d4ff', 'marginBottom': '0.75rem'}),
+                html.H3(f"{value}", style={'color': '#00d4ff', 'fontSize': '1.7rem', 'fontWeight': '700', 'margin': '0.5rem 0'}),
+                html.P(unit, style={'color': '#ffffff', 'fontSize': '0.9rem', 'margin': '0.25rem 0'}),
+                html.H6(title, style={'color': '#ffffff', 'fontSize': '1rem', 'fontWeight': '600', 'margin': '0.75rem 0 0.5rem 0'}),
+                html.Div([
+                    DashIconify(icon=trend_icon, width=18, height=18, style={'color': trend_color}),
+                    html.Small(f"{change:+.1f}" if isinstance(change, (int, float)) else str(change), 
+                              style={'color': trend_color, 'marginLeft': '6px', 'fontSize': '0.85rem', 'fontWeight': '600'})
+                ], style={'display': 'flex', 'alignItems': 'center', 'justifyContent': 'center', 'gap': '0.25rem', 'marginTop': '0.5rem'})
+            ], style={'textAlign': 'center', 'padding': '1rem', 'minHeight': '180px', 'display': 'flex', 'flexDirection': 'column', 'justifyContent': 'space-between'})
+        ], style={'padding': '0.5rem'})
+    ], className="quality-kpi-card", style={'height': '200px'})
+
+def create_nps_score_display(score, promoters, passives, detractors):
+    """Display principal del NPS con breakdown"""
+    return dbc.Card([
+        dbc.CardBody([
+            html.Div([
+                html.H2(f"{score}", style={
+                    'fontSize': '2.2rem', 'fontWeight': '800', 'color': '#00d4ff', 
+                    'margin': '0 0 0.5rem 0', 'textShadow': '0 0 20px rgba(0, 212, 255, 0.3)'
+                }),
+                html.P("NPS Score", style={'fontSize': '1rem', 'color': '#ffffff', 'marginBottom': '1rem'}),
+                html.Div([
+                    html.Div([
+                        html.Span(f"{promoters}%", style={'fontSize': '1rem', 'fontWeight': '700', 'color': '#00ff88', 'display': 'block', 'marginBottom': '0.25rem'}),
+                        html.P("Promotores", style={'fontSize': '0.75rem', 'color': '#ffffff', 'margin': '0'})
+                    ], style={'textAlign': 'center', 'flex': '1'}),
+                    html.Div([
+                        html.Span(f"{passives}%", style={'fontSize': '1rem', 'fontWeight': '700', 'color': '#f59e0b', 'display': 'block', 'marginBottom': '0.25rem'}), 
+                        html.P("Pasivos", style={'fontSize': '0.75rem', 'color': '#ffffff', 'margin': '0'})
+                    ], style={'textAlign': 'center', 'flex': '1'}),
+                    html.Div([
+                        html.Span(f"{detractors}%", style={'fontSize': '1rem', 'fontWeight': '700', 'color': '#ff4757', 'display': 'block', 'marginBottom': '0.25rem'}),
+                        html.P("Detractores", style={'fontSize': '0.75rem', 'color': '#ffffff', 'margin': '0'})
+                    ], style={'textAlign': 'center', 'flex': '1'})
+                ], style={'display': 'flex', 'justifyContent': 'space-around', 'gap': '0.5rem'})
+            ], style={'textAlign': 'center', 'padding': '1rem', 'minHeight': '180px', 'display': 'flex', 'flexDirection': 'column', 'justifyContent': 'space-between'})
+        ], style={'padding': '0.5rem'})
+    ], className="nps-score-card", style={'height': '200px'})
+
+def create_satisfaction_stars(rating):
+    """Crear display de estrellas para rating de satisfacción"""
+    stars = []
+    for i in range(5):
+        if i < int(rating):
+            stars.append(DashIconify(icon="mdi:star", width=24, height=24, style={'color': '#f59e0b'}))
+        elif i < rating:
+            stars.append(DashIconify(icon="mdi:star-half-full", width=24, height=24, style={'color': '#f59e0b'}))
+        else:
+            stars.append(DashIconify(icon="mdi:star-outline", width=24, height=24, style={'color': '#8b92a9'}))
+    return html.Div(stars, className="satisfaction-stars")
+
+def get_quality_chart_layout():
+    """Layout base para gráficos de calidad de servicio"""
+    return {
+        'paper_bgcolor': 'rgba(0,0,0,0)',
+        'plot_bgcolor': 'rgba(10, 14, 39, 0.95)',
+        'font': {'color': 'white', 'family': 'Inter', 'size': 12},
+        'margin': {'l': 80, 'r': 40, 't': 40, 'b': 80},
+        'xaxis': {'color': '#a0aec0', 'gridcolor': 'rgba(0, 212, 255, 0.15)', 'showgrid': True},
+        'yaxis': {'color': '#a0aec0', 'gridcolor': 'rgba(0, 212, 255, 0.15)', 'showgrid': True},
+        'legend': {'font': {'color': 'white'}, 'bgcolor': 'rgba(26, 31, 58, 0.9)'},
+        'hovermode': 'x unified'
+    }
+
+@instrument(kind='layout')
+def render_quality_tab():
+    """Customer Journey Experience Dashboard con 11 KPIs oficiales AIFA"""
+    quality_data = get_quality_data()
+    journey_data = get_customer_journey_data()
+    nps_breakdown = quality_data['nps_breakdown']
+    
+    return html.Div([
+        # Customer Journey Experience Header
+        dbc.Card([
+            dbc.CardBody([
+                html.Div([
+                    html.H1("Customer Journey Experience AIFA", className="quality-header-title"),
+                    html.P("Monitoreo 11 KPIs Oficiales • Experiencia del Pasajero • NPS 67/100", 
+                           className="quality-header-subtitle"),
+                    html.Div([
+                        dbc.Badge("SATISFACCIÓN 4.6/5", color="success", className="me-2"),
+                        dbc.Badge("NPS EXCELENTE", color="info", className="me-2"),
+                        dbc.Badge("ESTÁNDARES OACI", color="warning", className="me-2"),
+                        dbc.Badge("TIEMPO REAL", color="success")
+                    ], className="quality-status-badges")
+                ])
+            ])
+        ], className="quality-operations-header mb-4"),
+        
+        # Customer Journey Timeline (6 Touchpoints)
+        html.H5("Customer Journey Timeline", className="section-subtitle mb-3"),
+        dbc.Card([
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        create_journey_touchpoint_card(
+                            "Llegada/Acceso",
+                            f"{journey_data['llegada']['score']}/5",
+                            f"{journey_data['llegada']['time']} min",
+                            f"<{journey_data['llegada']['target']} min",
+                            journey_data['llegada']['status'],
+                            journey_data['llegada']['icon']
+                        )
+                    ], width=2),
+                    dbc.Col([
+                        create_journey_touchpoint_card(
+                            "Check-in",
+                            f"{journey_data['checkin']['score']}/5",
+                            f"{journey_data['checkin']['time']} min",
+                            f"<{journey_data['checkin']['target']} min",
+                            journey_data['checkin']['status'],
+                            journey_data['checkin']['icon']
+                        )
+                    ], width=2),
+                    dbc.Col([
+                        create_journey_touchpoint_card(
+                            "Control Seguridad",
+                            f"{journey_data['seguridad']['score']}/5",
+                            f"{journey_data['seguridad']['time']} min",
+                            f"<{journey_data['seguridad']['target']} min",
+                            journey_data['seguridad']['status'],
+                            journey_data['seguridad']['icon']
+                        )
+                    ], width=2),
+                    dbc.Col([
+                        create_journey_touchpoint_card(
+                            "Área Comercial",
+                            f"{journey_data['comercial']['score']}/5",
+                            f"{journey_data['comercial']['time']} min",
+                            journey_data['comercial']['target'],
+                            journey_data['comercial']['status'],
+                            journey_data['comercial']['icon']
+                        )
+                    ], width=2),
+                    dbc.Col([
+                        create_journey_touchpoint_card(
+                            "Embarque",
+                            f"{journey_data['embarque']['score']}/5",
+                            f"{journey_data['embarque']['time']} min",
+                            f"<{journey_data['embarque']['target']} min",
+                            journey_data['embarque']['status'],
+                            journey_data['embarque']['icon']
+                        )
+                    ], width=2),
+                    dbc.Col([
+                        create_journey_touchpoint_card(
+                            "Equipaje",
+                            f"{journey_data['equipaje']['score']}/5",
+                            f"{journey_data['equipaje']['time']} min",
+                            f"<{journey_data['equipaje']['target']} min",
+                            journey_data['equipaje']['status'],
+                            journey_data['equipaje']['icon']
+                        )
+                    ], width=2)
+                ])
+            ])
+        ], className="journey-timeline-container mb-4"),
+        
+        # KPIs Dashboard Principal (4 cards principales)
+        html.H5("KPIs Dashboard Principal", className="section-subtitle mb-3"),
+        dbc.Row([
+            dbc.Col([
+                create_nps_score_display(
+                    quality_data['nps_score']['score'],
+                    nps_breakdown['promotores'],
+                    nps_breakdown['pasivos'],
+                    nps_breakdown['detractores']
+                )
+            ], width=3),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardBody([
+                        html.Div([
+                            DashIconify(icon="mdi:heart", width=44, height=44, style={'color': '#00d4ff', 'marginBottom': '0.75rem'}),
+                            html.H3(f"{quality_data['satisfaccion_general']['score']}/5", style={'color': '#00d4ff', 'fontSize': '1.7rem', 'fontWeight': '700', 'margin': '0.5rem 0'}),
+                            html.P("Satisfacción General", style={'color': '#ffffff', 'fontSize': '1rem', 'fontWeight': '600', 'margin': '0.75rem 0 0.5rem 0'}),
+                            create_satisfaction_stars(quality_data['satisfaccion_general']['score']),
+                            html.Small(f"Meta: >{quality_data['satisfaccion_general']['target']}/5", style={'color': '#a0aec0', 'fontSize': '0.8rem', 'marginTop': '0.5rem', 'display': 'block'})
+                        ], style={'textAlign': 'center', 'padding': '1rem', 'minHeight': '180px', 'display': 'flex', 'flexDirection': 'column', 'justifyContent': 'space-between'})
+                    ], style={'padding': '0.5rem'})
+                ], className="quality-kpi-card", style={'height': '200px'})
+            ], width=3),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Capacidad Diaria",
+                    quality_data['capacidad_diaria']['value'],
+                    quality_data['capacidad_diaria']['unit'],
+                    quality_data['capacidad_diaria']['trend'],
+                    'up',
+                    "mdi:airplane-takeoff"
+                )
+            ], width=3),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Demora Promedio",
+                    quality_data['demora_promedio']['avg'],
+                    quality_data['demora_promedio']['unit'],
+                    quality_data['demora_promedio']['trend'],
+                    'down',
+                    "mdi:clock-outline"
+                )
+            ], width=3)
+        ], className="mb-4"),
+        
+        # Analytics Avanzados (4 gráficos)
+        html.H5("Analytics Avanzados", className="section-subtitle mb-3"),
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H6("Heatmap Satisfacción por Áreas", className="chart-title")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="quality-satisfaction-heatmap", style={"height": "300px"})
+                    ])
+                ], className="chart-card")
+            ], width=6),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H6("NPS Breakdown", className="chart-title")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="quality-nps-chart", style={"height": "300px"})
+                    ])
+                ], className="chart-card")
+            ], width=6)
+        ], className="mb-3"),
+        
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H6("Tendencias Calidad (12 meses)", className="chart-title")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="quality-trends-chart", style={"height": "300px"})
+                    ])
+                ], className="chart-card")
+            ], width=6),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H6("Matriz Performance: Tiempo vs Satisfacción", className="chart-title")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="quality-performance-matrix", style={"height": "300px"})
+                    ])
+                ], className="chart-card")
+            ], width=6)
+        ], className="mb-4"),
+        
+        # Métricas Operacionales (Grid de 6 mini-cards)
+        html.H5("Métricas Operacionales Oficiales", className="section-subtitle mb-3"),
+        dbc.Row([
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Disponibilidad Equipaje",
+                    f"{quality_data['disponibilidad_equipaje']['availability']}%",
+                    "disponibilidad",
+                    quality_data['disponibilidad_equipaje']['trend'],
+                    'up',
+                    "mdi:baggage-claim"
+                )
+            ], width=2),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Precisión Información",
+                    f"{quality_data['precision_informacion']['score']}/5",
+                    "pantallas",
+                    quality_data['precision_informacion']['trend'],
+                    'up',
+                    "mdi:information"
+                )
+            ], width=2),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Facilidad Ubicación",
+                    f"{quality_data['facilidad_ubicacion']['score']}/5",
+                    "instalaciones",
+                    quality_data['facilidad_ubicacion']['trend'],
+                    'up',
+                    "mdi:map-marker"
+                )
+            ], width=2),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Limpieza Baños",
+                    f"{quality_data['limpieza_banos']['score']}/5",
+                    "encuesta",
+                    quality_data['limpieza_banos']['trend'],
+                    'up',
+                    "mdi:toilet"
+                )
+            ], width=2),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Check-in Hora Pico",
+                    f"{quality_data['tiempo_checkin_pico']['avg']} min",
+                    "tiempo espera",
+                    quality_data['tiempo_checkin_pico']['trend'],
+                    'down',
+                    "mdi:airplane-check"
+                )
+            ], width=2),
+            dbc.Col([
+                create_quality_kpi_card(
+                    "Equipaje Hora Pico",
+                    f"{quality_data['tiempo_equipaje_pico']['avg']} min",
+                    "tiempo espera",
+                    quality_data['tiempo_equipaje_pico']['trend'],
+                    'stable',
+                    "mdi:clock-fast"
+                )
+            ], width=2)
+        ])
+    ])
+
+# Quality Service Callbacks - Customer Journey Analytics
+@instrument(kind='figure')
+def create_quality_satisfaction_heatmap():
+    areas = ['Terminal', 'Check-in', 'Seguridad', 'Comercial', 'Embarque', 'Equipaje']
+    timeperiods = ['Hora Pico', 'Normal', 'Nocturno']
+    
+    # Matriz de satisfacción por área y período
+    satisfaction_matrix = [
+        [4.8, 4.6, 4.4, 4.2, 4.7, 4.1],  # Hora Pico
+        [4.9, 4.8, 4.6, 4.5, 4.8, 4.3],  # Normal
+        [4.7, 4.5, 4.3, 4.0, 4.6, 4.0]   # Nocturno
+    ]
+    
+    return {
+        'data': [go.Heatmap(
+            z=satisfaction_matrix,
+            x=areas,
+            y=timeperiods,
+            colorscale=[
+                [0, '#ff4757'], [0.25, '#f59e0b'], [0.5, '#00d4ff'], [0.75, '#00ff88'], [1, '#00ff88']
+            ],
+            hovertemplate='<b>%{y} - %{x}</b><br>Satisfacción: %{z}/5<extra></extra>',
+            showscale=True,
+            colorbar=dict(
+                title="Satisfacción",
+                titleside="right",
+                tickmode="array",
+                tickvals=[3.5, 4.0, 4.5, 5.0],
+                ticktext=["3.5", "4.0", "4.5", "5.0"],
+                len=0.6
+            )
+        )],
+        'layout': get_quality_chart_layout()
+    }
+
+@instrument(kind='figure')
+def create_quality_nps_chart():
+    labels = ['Promotores', 'Pasivos', 'Detractores']
+    values = [58, 33, 9]
+    colors = ['#00ff88', '#f59e0b', '#ff4757']
+    
+    return {
+        'data': [go.Pie(
+            labels=labels,
+            values=values,
+            hole=0.5,
+            marker=dict(colors=colors, line=dict(color='#0a0e27', width=2)),
+            hovertemplate='<b>%{label}</b><br>Porcentaje: %{value}%<br>NPS: %{percent}<extra></extra>',
+            textinfo='label+percent',
+            textposition='outside'
+        )],
+        'layout': {
+            **get_quality_chart_layout(),
+            'showlegend': False,
+            'margin': dict(l=20, r=20, t=20, b=20),
+            'annotations': [dict(text=f'NPS<br><b>67</b>', x=0.5, y=0.5, font_size=20, showarrow=False)]
+        }
+    }
+
+@instrument(kind='figure')
+def create_quality_trends_chart():
+    months = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+    
+    return {
+        'data': [
+            go.Scatter(x=months, y=[4.4, 4.5, 4.3, 4.6, 4.5, 4.7, 4.6, 4.8, 4.5, 4.6, 4.6, 4.6],
+                      name='Satisfacción General', line=dict(color='#00ff88', width=3),
+                      hovertemplate='<b>Satisfacción General</b><br>%{x}: %{y}/5<extra></extra>'),
+            go.Scatter(x=months, y=[6.8, 6.5, 6.7, 6.4, 6.6, 6.2, 6.4, 6.1, 6.5, 6.3, 6.4, 6.4],
+                      name='Tiempo Seguridad', line=dict(color='#f59e0b', width=3),
+                      hovertemplate='<b>Tiempo Seguridad</b><br>%{x}: %{y} min<extra></extra>'),
+            go.Scatter(x=months, y=[65, 62, 68, 64, 66, 69, 67, 70, 65, 67, 67, 67],
+                      name='NPS Score', line=dict(color='#00d4ff', width=3),
+                      hovertemplate='<b>NPS Score</b><br>%{x}: %{y}/100<extra></extra>'),
+            go.Scatter(x=months, y=[3.4, 3.3, 3.5, 3.2, 3.4, 3.1, 3.2, 3.0, 3.3, 3.1, 3.2, 3.2],
+                      name='Tiempo Check-in', line=dict(color='#8b5cf6', width=3),
+                      hovertemplate='<b>Tiempo Check-in</b><br>%{x}: %{y} min<extra></extra>')
+        ],
+        'layout': get_quality_chart_layout()
+    }
+
+@instrument(kind='figure')
+def create_quality_performance_matrix():
+    # Scatter plot: X=Tiempo de servicio, Y=Satisfacción, Tamaño=Volumen pasajeros
+    areas = ['Terminal', 'Check-in', 'Seguridad', 'Comercial', 'Embarque', 'Equipaje']
+    tiempo_servicio = [2.1, 3.2, 6.4, 15.3, 4.1, 8.1]
+    satisfaccion = [4.8, 4.6, 4.4, 4.2, 4.7, 4.1]
+    volumen_pax = [100, 85, 95, 60, 90, 80]  # Tamaño de burbuja
+    
+    return {
+        'data': [go.Scatter(
+            x=tiempo_servicio,
+            y=satisfaccion,
+            mode='markers+text',
+            marker=dict(
+                size=[v/2 for v in volumen_pax],
+                color=['#00ff88', '#00d4ff', '#f59e0b', '#ff6b35', '#8b5cf6', '#ff4757'],
+                opacity=0.7,
+                line=dict(width=2, color='white')
+            ),
+            text=areas,
+            textposition='middle center',
+            hovertemplate='<b>%{text}</b><br>Tiempo: %{x} min<br>Satisfacción: %{y}/5<extra></extra>'
+        )],
+        'layout': {
+            **get_quality_chart_layout(),
+            'xaxis': {'title': 'Tiempo de Servicio (min)', 'color': '#a0aec0'},
+            'yaxis': {'title': 'Satisfacción (1-5)', 'color': '#a0aec0', 'range': [3.8, 5.0]},
+            'showlegend': False
+        }
+    }
+
+QUALITY_FIGURES = {
+    'quality-satisfaction-heatmap': create_quality_satisfaction_heatmap,
+    'quality-nps-chart': create_quality_nps_chart,
+    'quality-trends-chart': create_quality_trends_chart,
+    'quality-performance-matrix': create_quality_performance_matrix,
+}
+
+# Punto de entrada para src.tabs.load_tab
+layout = render_quality_tab
@@ -0,0 +1,183 @@
+"""
+Tab Sistema: telemetría del propio dashboard (protegido).
+"""
+
+from datetime import datetime, timedelta
+
+from dash import html, dcc
+import dash_bootstrap_components as dbc
+from dash_iconify import DashIconify
+import plotly.graph_objects as go
+import numpy as np
+
+from ..perf.instrument import instrument
+from .components import create_financial_kpi, get_bloomberg_layout
+
+@instrument(kind='layout')
+def render_sistema_tab():
+    """Render del tab Sistema: acceso y contenedor de telemetría"""
+    return html.Div([
+        dcc.Store(id='sistema-auth', storage_type='session'),
+        dcc.Interval(id='sistema-interval', interval=5*1000, n_intervals=0),
+
+        html.Div([
+            html.Div([
+                DashIconify(icon="mdi:monitor-dashboard", width=32, height=32,
+                           style={'color': '#00d4ff', 'marginRight': '15px'}),
+                html.H3("Sistema - Rendimiento del Dashboard",
+                       style={'color': '#ffffff', 'margin': '0', 'fontWeight': '600'})
+            ], style={'display': 'flex', 'alignItems': 'center', 'marginBottom': '10px'}),
+            html.P("Latencia de callbacks, cachés, tamaño de respuestas, memoria y tasa de peticiones del worker",
+                   style={'color': '#8b92a9', 'margin': '0', 'fontSize': '1.1rem'})
+        ], style={'marginBottom': '30px'}),
+
+        dbc.Card([
+            dbc.CardBody([
+                html.P("🔐 Área restringida - operaciones", style={'color': '#00d4ff', 'marginBottom': '15px'}),
+                dbc.Row([
+                    dbc.Col([
+                        dbc.Input(id="sistema-username", type="text", placeholder="Usuario")
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Input(id="sistema-password", type="password", placeholder="Contraseña")
+                    ], width=4),
+                    dbc.Col([
+                        dbc.Button("Ingresar", id="sistema-submit",
+                                  style={'backgroundColor': '#00d4ff', 'border': 'none'})
+                    ], width=2)
+                ]),
+                html.Div(id="sistema-auth-message", style={'color': '#ff4757', 'marginTop': '10px'})
+            ])
+        ], id="sistema-login", className="chart-card"),
+
+        html.Div(id="sistema-content")
+    ])
+
+def _short_callback_name(callback_id):
+    return callback_id.strip('.').replace('.figure', '').replace('.children', '')[:40]
+
+def create_sistema_latency_chart(callbacks):
+    top = list(callbacks.items())[:12][::-1]
+    names = [_short_callback_name(name) for name, _ in top]
+    fig = go.Figure()
+    for key, label, color in [('p50_ms', 'p50', '#00d4ff'), ('p95_ms', 'p95', '#f59e0b'), ('p99_ms', 'p99', '#ff4757')]:
+        fig.add_trace(go.Bar(y=names, x=[stats[key] for _, stats in top], name=label,
+                             orientation='h', marker_color=color))
+    fig.update_layout(**get_bloomberg_layout())
+    fig.update_layout(barmode='group', height=420, xaxis_title='ms', margin=dict(l=220, r=20, t=20, b=40))
+    return fig
+
+def create_sistema_rate_chart(timeline, bucket_seconds=10, window_seconds=600):
+    now = datetime.now().timestamp()
+    buckets = {}
+    for ts, duration_ms in timeline:
+        if now - ts <= window_seconds:
+            buckets.setdefault(int(ts // bucket_seconds) * bucket_seconds, []).append(duration_ms)
+    times = sorted(buckets)
+    x = [datetime.fromtimestamp(t) for t in times]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=x, y=[len(buckets[t]) * 60 / bucket_seconds for t in times],
+                         name='peticiones/min', marker_color='rgba(0, 212, 255, 0.6)'))
+    fig.add_trace(go.Scatter(x=x, y=[float(np.percentile(buckets[t], 95)) for t in times],
+                             name='p95 ms', yaxis='y2', line=dict(color='#f59e0b', width=2)))
+    fig.update_layout(**get_bloomberg_layout())
+    fig.update_layout(height=300, yaxis_title='peticiones/min',
+                      yaxis2=dict(title='p95 ms', overlaying='y', side='right', color='#f59e0b', showgrid=False))
+    return fig
+
+def create_sistema_memory_chart(rss_series):
+    fig = go.Figure(go.Scatter(
+        x=[datetime.fromtimestamp(ts) for ts, _ in rss_series],
+        y=[rss / (1024 * 1024) for _, rss in rss_series],
+        mode='lines+markers', name='RSS', line=dict(color='#00ff88', width=2), fill='tozeroy',
+        fillcolor='rgba(0, 255, 136, 0.1)'
+    ))
+    fig.update_layout(**get_bloomberg_layout())
+    fig.update_layout(height=300, showlegend=False, yaxis_title='MB')
+    return fig
+
+def render_sistema_content(summary):
+    """Contenido del tab Sistema a partir de ``telemetry.summary()``"""
+    caches = summary['caches']
+    disk = caches['disco']
+    rss_mb = summary['rss'][-1][1] / (1024 * 1024)
+    uptime = timedelta(seconds=summary['uptime_seconds'])
+
+    payload_rows = [
+        html.Tr([
+            html.Td(_short_callback_name(name)),
+            html.Td(f"{stats['requests']:,}"),
+            html.Td(f"{stats['p95_ms']:.1f}"),
+            html.Td(f"{stats['mean_bytes'] / 1024:.1f}"),
+            html.Td(f"{stats['max_bytes'] / 1024:.1f}"),
+            html.Td(stats['errors'], style={'color': '#ff4757' if stats['errors'] else '#00ff88'})
+        ]) for name, stats in sorted(summary['callbacks'].items(),
+                                     key=lambda item: item[1]['max_bytes'], reverse=True)
+    ]
+
+    return html.Div([
+        dbc.Row([
+            dbc.Col([create_financial_kpi("Peticiones por minuto", f"{summary['requests_per_minute']:.1f}",
+                                          f"{summary['requests']:,} en buffer", "mdi:swap-vertical")], width=3),
+            dbc.Col([create_financial_kpi("Latencia p95", f"{summary['p95_ms']:.0f} ms",
+                                          f"p50 {summary['p50_ms']:.0f} ms · p99 {summary['p99_ms']:.0f} ms",
+                                          "mdi:timer-outline")], width=3),
+            dbc.Col([create_financial_kpi("Memoria del worker", f"{rss_mb:.0f} MB",
+                                          f"pid {summary['pid']} · activo {uptime}", "mdi:memory")], width=3),
+            dbc.Col([create_financial_kpi("Tasa de error", f"{summary['error_rate']:.1%}",
+                                          "respuestas 5xx", "mdi:alert-circle-outline")], width=3)
+        ], className="mb-4"),
+
+        dbc.Row([
+            dbc.Col([create_financial_kpi("Caché de respuestas", f"{caches['respuestas']['hit_ratio']:.0%}",
+                                          f"{caches['respuestas']['entries']} entradas", "mdi:cached")], width=4),
+            dbc.Col([create_financial_kpi("Caché en disco",
+                                          f"{disk['hit_ratio']:.0%}" if disk else "—",
+                                          f"{(disk['bytes'] or 0) / (1024 * 1024):.1f} MB" if disk else "desactivada",
+                                          "mdi:database")], width=4),
+            dbc.Col([create_financial_kpi("Componentes memoizados", f"{caches['componentes']['hit_ratio']:.0%}",
+                                          f"{caches['componentes']['hits']:,} aciertos", "mdi:puzzle")], width=4)
+        ], className="mb-4"),
+
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([html.H5("Latencia por Callback (ms)", className="chart-title")]),
+                    dbc.CardBody([dcc.Graph(figure=create_sistema_latency_chart(summary['callbacks']),
+                                            config={'displayModeBar': False})])
+                ], className="chart-card")
+            ], width=7),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([html.H5("Tamaño de Respuestas (KB)", className="chart-title")]),
+                    dbc.CardBody([
+                        dbc.Table([
+                            html.Thead(html.Tr([html.Th("Callback"), html.Th("Peticiones"), html.Th("p95 ms"),
+                                                html.Th("Media"), html.Th("Máx"), html.Th("Errores")])),
+                            html.Tbody(payload_rows)
+                        ], bordered=False, hover=True, size="sm", className="financial-table")
+                    ], style={'maxHeight': '440px', 'overflowY': 'auto'})
+                ], className="chart-card")
+            ], width=5)
+        ], className="mb-4"),
+
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([html.H5("Tasa de Peticiones y p95 (últimos 10 min)", className="chart-title")]),
+                    dbc.CardBody([dcc.Graph(figure=create_sistema_rate_chart(summary['timeline']),
+                                            config={'displayModeBar': False})])
+                ], className="chart-card")
+            ], width=6),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([html.H5("Memoria del Worker (RSS)", className="chart-title")]),
+                    dbc.CardBody([dcc.Graph(figure=create_sistema_memory_chart(summary['rss']),
+                                            config={'displayModeBar': False})])
+                ], className="chart-card")
+            ], width=6)
+        ])
+    ])
+
+# Punto de entrada para src.tabs.load_tab
+layout = render_sistema_tab
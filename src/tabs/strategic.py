@@ -0,0 +1,228 @@
+"""
+Tab KPIs Estratégicos: accesores de datos, layout y figuras.
+"""
+
+from dash import html, dcc
+import dash_bootstrap_components as dbc
+import plotly.graph_objects as go
+
+from ..data.accessors import ttl_cached
+from ..perf.instrument import instrument
+from .components import create_kpi_card
+
+# Simulated data functions
+@instrument(kind='data')
+@ttl_cached('kpi', ttl=300)
+def get_kpi_data():
+    return {
+        'participation_passengers': {'current': 12.8, 'change': 2.3, 'target': 15.0},
+        'participation_operations': {'current': 9.7, 'change': 1.8, 'target': 12.0},
+        'participation_cargo': {'current': 8.4, 'change': 3.1, 'target': 10.0},
+        'growth_vs_market': {'current': 5.5, 'change': 0.8},
+        'punctuality': {'current': 87.2, 'change': -1.3, 'target': 90.0},
+        'route_utilization': {'current': 78.4, 'change': 2.1, 'target': 85.0}
+    }
+
+@instrument(kind='data')
+@ttl_cached('historical', ttl=3600)
+def get_historical_data():
+    months = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 
+              'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+    passengers = [8.2, 8.6, 9.1, 9.5, 10.2, 10.8, 11.3, 11.7, 12.1, 12.4, 12.6, 12.8]
+    operations = [6.8, 7.1, 7.5, 7.9, 8.3, 8.7, 9.0, 9.3, 9.5, 9.6, 9.7, 9.7]
+    cargo = [5.1, 5.4, 5.8, 6.2, 6.7, 7.1, 7.5, 7.8, 8.0, 8.1, 8.2, 8.4]
+    return {'months': months, 'passengers': passengers, 'operations': operations, 'cargo': cargo}
+
+@instrument(kind='data')
+@ttl_cached('airport_comparison', ttl=3600)
+def get_airport_comparison():
+    return [
+        {'name': 'AICM', 'passengers': 48.2, 'change': -2.1},
+        {'name': 'AIFA', 'passengers': 12.8, 'change': 2.3},
+        {'name': 'Guadalajara', 'passengers': 8.9, 'change': 0.8},
+        {'name': 'Cancún', 'passengers': 15.4, 'change': 1.2},
+        {'name': 'Monterrey', 'passengers': 7.2, 'change': -0.3},
+        {'name': 'Tijuana', 'passengers': 4.9, 'change': 0.5},
+        {'name': 'Otros', 'passengers': 2.6, 'change': -0.4}
+    ]
+
+@instrument(kind='layout')
+def render_strategic_tab():
+    kpi_data = get_kpi_data()
+    
+    return html.Div([
+        # KPI Cards Row 1
+        dbc.Row([
+            dbc.Col([
+                create_kpi_card(
+                    "Participación Nacional Pasajeros",
+                    kpi_data['participation_passengers']['current'],
+                    kpi_data['participation_passengers']['change'],
+                    "mdi:account-group",
+                    kpi_data['participation_passengers']['target']
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Participación Nacional Operaciones",
+                    kpi_data['participation_operations']['current'],
+                    kpi_data['participation_operations']['change'],
+                    "mdi:airplane-takeoff",
+                    kpi_data['participation_operations']['target']
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Participación Nacional Carga",
+                    kpi_data['participation_cargo']['current'],
+                    kpi_data['participation_cargo']['change'],
+                    "mdi:package-variant",
+                    kpi_data['participation_cargo']['target']
+                )
+            ], width=4)
+        ], className="mb-4"),
+        
+        dbc.Row([
+            dbc.Col([
+                create_kpi_card(
+                    "Crecimiento vs Mercado",
+                    kpi_data['growth_vs_market']['current'],
+                    kpi_data['growth_vs_market']['change'],
+                    "mdi:trending-up"
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Puntualidad de Vuelos",
+                    kpi_data['punctuality']['current'],
+                    kpi_data['punctuality']['change'],
+                    "mdi:clock-check-outline",
+                    kpi_data['punctuality']['target']
+                )
+            ], width=4),
+            dbc.Col([
+                create_kpi_card(
+                    "Utilización de Rutas",
+                    kpi_data['route_utilization']['current'],
+                    kpi_data['route_utilization']['change'],
+                    "mdi:map-marker-path",
+                    kpi_data['route_utilization']['target']
+                )
+            ], width=4)
+        ], className="mb-4"),
+        
+        # Charts Row
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Evolución Participación de Mercado", className="chart-title"),
+                        html.Small("Últimos 12 meses", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="participation-trend-chart")
+                    ])
+                ], className="chart-card")
+            ], width=8),
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Progreso Meta Anual", className="chart-title"),
+                        html.Small("Participación de pasajeros", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="progress-gauge")
+                    ])
+                ], className="chart-card")
+            ], width=4)
+        ], className="mb-4"),
+        
+        # Comparison Table
+        dbc.Row([
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader([
+                        html.H5("Comparativo Aeropuertos Mexicanos", className="chart-title"),
+                        html.Small("Participación de mercado nacional", className="chart-subtitle")
+                    ]),
+                    dbc.CardBody([
+                        dcc.Graph(id="airport-comparison-chart")
+                    ])
+                ], className="chart-card")
+            ], width=12)
+        ])
+    ])
+
+# Callbacks for charts
+@instrument(kind='figure')
+def create_participation_trend():
+    data = get_historical_data()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=data['months'],
+        y=data['passengers'],
+        mode='lines+markers',
+        name='Pasajeros',
+        line=dict(color='#00d4ff', width=3),
+        marker=dict(size=8, color='#00d4ff')
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=data['months'],
+        y=data['operations'],
+        mode='lines+markers',
+        name='Operaciones',
+        line=dict(color='#f59e0b', width=3),
+        marker=dict(size=8, color='#f59e0b')
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=data['months'],
+        y=data['cargo'],
+        mode='lines+markers',
+        name='Carga',
+        line=dict(color='#00ff88', width=3),
+        marker=dict(size=8, color='#00ff88')
+    ))
+    
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Mes'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Participación (%)'),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    
+    return fig
+
+@instrument(kind='figure')
+def create_airport_comparison():
+    data = get_airport_comparison()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=[x['name'] for x in data],
+        y=[x['passengers'] for x in data],
+        marker_color='#00d4ff',
+        text=[f"{x['passengers']}%" for x in data],
+        textposition='auto',
+    ))
+    
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Aeropuerto'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Participación (%)'),
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    
+    return fig
+
+# Punto de entrada para src.tabs.load_tab
+layout = render_strategic_tab
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Pruebas de los endpoints de administración (src/perf/admin.py)"""
+
+import cProfile
+import os
+import pstats
+from types import SimpleNamespace
+
+from flask import Flask
+
+import tracemalloc
+
+from src.perf import memory, profiling
+from src.perf.admin import TOKEN_HEADER
+
+
+def make_client(module, **env):
+    os.environ.update(env)
+    try:
+        app = SimpleNamespace(server=Flask(__name__))
+        module.init_app(app)
+        return app.server.test_client()
+    finally:
+        for key in env:
+            os.environ.pop(key)
+
+
+def test_profiling_requires_configured_token():
+    client = make_client(profiling, AIFA_PROFILING='1')
+    assert client.get('/_admin/profiles').status_code == 404
+
+    client = make_client(profiling, AIFA_PROFILING='1', AIFA_ADMIN_TOKEN='secreto')
+    os.environ['AIFA_ADMIN_TOKEN'] = 'secreto'
+    try:
+        assert client.get('/_admin/profiles').status_code == 403
+        assert client.get('/_admin/profiles', headers={TOKEN_HEADER: 'otro'}).status_code == 403
+        assert client.get('/_admin/profiles', headers={TOKEN_HEADER: 'secreto'}).status_code == 200
+    finally:
+        os.environ.pop('AIFA_ADMIN_TOKEN')
+
+
+def test_profile_detail_accepts_any_limit():
+    profiler = cProfile.Profile()
+    profiler.runcall(sorted, range(10))
+    stats = pstats.Stats(profiler)
+    profile_id = profiling.store.add({
+        'created_at': 0.0, 'output': 'test.figure', 'inputs': [], 'cache_bypassed': False,
+        'duration_ms': 1.0, 'status': 200, 'bytes': 0, 'total_calls': stats.total_calls, 'stats': stats.stats,
+    })
+    client = make_client(profiling, AIFA_PROFILING='1', AIFA_ADMIN_TOKEN='secreto')
+    os.environ['AIFA_ADMIN_TOKEN'] = 'secreto'
+    try:
+        for limit in ('abc', '-5', '0', '999999', '10'):
+            response = client.get(f'/_admin/profiles/{profile_id}?limit={limit}', headers={TOKEN_HEADER: 'secreto'})
+            assert response.status_code == 200, limit
+            assert 'callback: test.figure' in response.get_data(as_text=True)
+    finally:
+        os.environ.pop('AIFA_ADMIN_TOKEN')
+
+
+def test_memory_trace_requires_configured_token():
+    tracing = tracemalloc.is_tracing()
+    client = make_client(memory, AIFA_MEMORY_TRACE='1')
+    assert client.get('/_admin/memory').status_code == 404
+    assert tracemalloc.is_tracing() == tracing
+
+
+if __name__ == "__main__":
+    test_profiling_requires_configured_token()
+    test_profile_detail_accepts_any_limit()
+    test_memory_trace_requires_configured_token()
+    print("✅ Endpoints de administración OK")
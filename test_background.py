@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Pruebas de los callbacks en segundo plano (src/perf/background.py)"""
+
+import os
+import tempfile
+
+import json
+
+import dash
+from dash import DiskcacheManager, _callback as dash_callback
+from dash.dependencies import Output
+from dash.long_callback.managers import BaseLongCallbackManager
+
+from src.perf import background
+from src.perf import cache
+
+
+def test_background_callback_registers_with_diskcache_manager():
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ.update(AIFA_BACKGROUND='1', AIFA_BACKGROUND_DIR=directory)
+        background._manager, background._manager_loaded = None, False
+        try:
+            @background.background_callback(Output('test-background', 'figure'),
+                                             background.mount_input('test-background'),
+                                             **background.graph_progress('test-background', stages=True))
+            def build(set_progress, _):
+                return {}
+
+            entry = dash_callback.GLOBAL_CALLBACK_LIST[-1]
+            manager = background.background_manager()
+            assert isinstance(manager, DiskcacheManager)
+            assert entry['output'] == 'test-background.figure'
+            assert entry['long']['interval'] == 500
+            # El registro es global al manager: otros callbacks (p. ej. los de app) pueden estar ahí
+            assert BaseLongCallbackManager.hash_function(build, entry['output']) in manager.func_registry
+        finally:
+            dash_callback.GLOBAL_CALLBACK_LIST.pop()
+            dash_callback.GLOBAL_CALLBACK_MAP.pop('test-background.figure', None)
+            background._manager, background._manager_loaded = None, False
+            for key in ('AIFA_BACKGROUND', 'AIFA_BACKGROUND_DIR'):
+                os.environ.pop(key)
+
+
+def test_cached_result_is_served_without_a_job():
+    calls = []
+    disk_cache, cache.disk_cache = cache.disk_cache, None
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ.update(AIFA_BACKGROUND='1', AIFA_BACKGROUND_DIR=directory)
+        background._manager, background._manager_loaded = None, False
+        try:
+            @background.background_callback(Output('test-background-cached', 'figure'),
+                                             background.mount_input('test-background-cached'),
+                                             **background.graph_progress('test-background-cached'))
+            @cache.cached_output('test-background-cached')
+            def build(_):
+                calls.append(1)
+                return {'data': [], 'layout': {'title': {'text': 'en caché'}}}
+
+            assert build.lookup('test-background-cached') == (False, None)
+            build('test-background-cached')
+            dispatch = dash_callback.GLOBAL_CALLBACK_MAP['test-background-cached.figure']['callback']
+            with dash.Dash(__name__).server.test_request_context('/_dash-update-component', method='POST'):
+                body = json.loads(dispatch('test-background-cached',
+                                           outputs_list={'id': 'test-background-cached', 'property': 'figure'}))
+            assert 'job' not in body
+            assert body['response']['test-background-cached']['figure']['layout']['title']['text'] == 'en caché'
+            assert len(calls) == 1
+        finally:
+            dash_callback.GLOBAL_CALLBACK_LIST.pop()
+            dash_callback.GLOBAL_CALLBACK_MAP.pop('test-background-cached.figure', None)
+            cache.disk_cache = disk_cache
+            background._manager, background._manager_loaded = None, False
+            for key in ('AIFA_BACKGROUND', 'AIFA_BACKGROUND_DIR'):
+                os.environ.pop(key)
+
+
+if __name__ == "__main__":
+    test_background_callback_registers_with_diskcache_manager()
+    test_cached_result_is_served_without_a_job()
+    print("✅ Callbacks en segundo plano OK")
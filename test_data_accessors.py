@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Pruebas de los accesores de datos con TTL (src/data/accessors.py)"""
+
+import itertools
+
+from src.data.accessors import ttl_cached
+from src.data.version import data_version
+
+
+def test_ttl_reuses_until_invalidated():
+    counter = itertools.count()
+
+    @ttl_cached('test_ttl', ttl=3600)
+    def get_value():
+        return {'n': next(counter)}
+
+    assert get_value() == get_value() == {'n': 0}
+    get_value.invalidate()
+    assert get_value() == {'n': 1}
+
+
+def test_refresh_with_new_data_changes_version():
+    counter = itertools.count()
+
+    @ttl_cached('test_version', ttl=0)
+    def get_value():
+        return [next(counter)]
+
+    get_value()
+    before = data_version()
+    assert get_value() == [1]
+    assert data_version() != before
+
+
+def test_tab_data_is_served_by_accessors():
+    from src.data.version import _data_fingerprints
+    from src.tabs import load_tab
+
+    get_kpi_data = load_tab('strategic').get_kpi_data
+    assert get_kpi_data() is get_kpi_data()
+    load_tab('geographic').get_route_table()
+    assert {'kpi', 'routes'} <= set(_data_fingerprints)
+
+
+if __name__ == "__main__":
+    test_ttl_reuses_until_invalidated()
+    test_refresh_with_new_data_changes_version()
+    test_tab_data_is_served_by_accessors()
+    print("✅ Accesores con TTL OK")
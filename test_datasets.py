@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""Pruebas de los datasets versionados compartidos con el navegador (src/tabs/datasets.py)"""
+
+from src.tabs import datasets
+
+
+def test_dataset_sent_only_when_client_is_stale():
+    data, version = datasets.dataset_update('routes', None)
+    assert data == datasets.load_dataset('routes')
+    assert datasets.dataset_update('routes', version) is None
+    assert datasets.dataset_update('routes', 'vieja') == (data, version)
+
+
+if __name__ == "__main__":
+    test_dataset_sent_only_when_client_is_stale()
+    print("✅ Datasets versionados OK")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Pruebas de la caché persistente en SQLite (src/perf/disk_cache.py)"""
+
+import os
+import tempfile
+
+from src.perf import cache as cache_module, styles
+from src.perf.disk_cache import DiskCache
+
+
+def test_roundtrip_and_stats():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, max_bytes=1024 * 1024)
+        assert cache.get('v1|chart|[]') == (False, None)
+        cache.set('v1|chart|[]', 'v1', '{"data": []}')
+        assert cache.get('v1|chart|[]') == (True, '{"data": []}')
+        stats = cache.stats()
+        assert stats['entries'] == 1 and stats['hits'] == 1 and stats['misses'] == 1
+
+
+def test_shared_between_instances():
+    with tempfile.TemporaryDirectory() as directory:
+        DiskCache(directory).set('v1|tab|["strategic"]', 'v1', '{"props": {}}')
+        assert DiskCache(directory).get('v1|tab|["strategic"]')[0]
+
+
+def test_eviction_prefers_stale_versions_then_lru():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, max_bytes=300)
+        cache.set('old|a', 'old', 'x' * 100)
+        cache.set('new|b', 'new', 'x' * 100)
+        cache.set('new|c', 'new', 'x' * 100)
+        cache.get('new|b')
+        cache.set('new|d', 'new', 'x' * 100)
+        cache.evict('new')
+        assert not cache.get('old|a')[0]
+        assert cache.get('new|b')[0] and cache.get('new|d')[0]
+        assert cache.stats()['bytes'] <= 300
+
+        cache.set('new|e', 'new', 'x' * 100)
+        cache.evict('new')
+        assert cache.stats()['bytes'] <= 300
+        assert cache.get('new|e')[0]
+
+
+def test_key_includes_mode_and_style_classes():
+    calls = []
+
+    @cache_module.cached_output('test-variant')
+    def render():
+        calls.append((os.environ.get('AIFA_MODE'), styles.is_enabled()))
+        return {'props': {}}
+
+    enabled, saved = styles.is_enabled(), cache_module.disk_cache
+    with tempfile.TemporaryDirectory() as directory:
+        cache_module.disk_cache = DiskCache(directory)
+        try:
+            for mode, classes in (('full', True), ('full', False), ('lite', True), ('full', True)):
+                os.environ['AIFA_MODE'] = mode
+                styles.set_enabled(classes)
+                cache_module.response_cache.clear()
+                render()
+            assert calls == [('full', True), ('full', False), ('lite', True)]
+        finally:
+            os.environ.pop('AIFA_MODE')
+            styles.set_enabled(enabled)
+            cache_module.disk_cache = saved
+            cache_module.response_cache.clear()
+
+
+def test_first_tab_still_hits_after_opening_another():
+    from src.data.accessors import ttl_cached
+
+    calls = []
+    sources = {tab: ttl_cached(f'test_tab_{tab}', ttl=3600)(lambda tab=tab: {'tab': tab}) for tab in 'ab'}
+
+    @cache_module.cached_output('test-tabs', vary_on=(0,))
+    def render_tab(tab):
+        calls.append(tab)
+        return {'props': sources[tab]()}
+
+    saved = cache_module.disk_cache
+    with tempfile.TemporaryDirectory() as directory:
+        cache_module.disk_cache = DiskCache(directory)
+        try:
+            render_tab('a')
+            render_tab('b')  # primera carga de test_tab_b: cambia la versión global
+            render_tab('a')
+            assert calls == ['a', 'b']
+
+            # Otro worker: sin LRU ni fuentes en memoria, la llave sale del registro en disco
+            cache_module.response_cache.clear()
+            cache_module._sources.clear()
+            render_tab('a')
+            assert calls == ['a', 'b'] and cache_module.disk_cache.stats()['hits'] >= 2
+        finally:
+            cache_module.disk_cache = saved
+            cache_module.response_cache.clear()
+
+
+if __name__ == "__main__":
+    test_roundtrip_and_stats()
+    test_shared_between_instances()
+    test_eviction_prefers_stale_versions_then_lru()
+    test_key_includes_mode_and_style_classes()
+    test_first_tab_still_hits_after_opening_another()
+    print("✅ Caché en disco OK")
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""Pruebas de los nombres de callbacks instrumentados (src/perf/instrument.py)"""
+
+from dash import Input, Output, State
+
+from src.perf.instrument import callback_name, callback_outputs
+
+
+def test_callback_name_with_either_declaration_style():
+    outputs = [Output('a', 'children'), Output('b', 'interval')]
+    inputs = [Input('c', 'n_intervals'), State('b', 'interval')]
+    assert callback_name(callback_outputs((outputs, inputs), {})) == '..a.children...b.interval..'
+    assert callback_name(callback_outputs((*outputs, *inputs), {})) == '..a.children...b.interval..'
+    assert callback_name(callback_outputs((outputs[0], inputs[0]), {})) == 'a.children'
+    assert callback_name(callback_outputs((), {'output': outputs[1]})) == 'b.interval'
+
+
+if __name__ == "__main__":
+    test_callback_name_with_either_declaration_style()
+    print("✅ Nombres de callbacks OK")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Pruebas de la construcción concurrente de figuras (src/perf/parallel.py)"""
+
+from src.perf import cache
+from src.perf.parallel import build_figures
+
+
+def test_failed_figure_is_not_cached():
+    calls = []
+    broken = [True]
+
+    def ok():
+        return {'data': [], 'layout': {'title': {'text': 'ok'}}}
+
+    def flaky():
+        if broken[0]:
+            raise RuntimeError("fuente caída")
+        return {'data': [], 'layout': {'title': {'text': 'flaky'}}}
+
+    @cache.cached_output('test-parallel-figures')
+    def figures():
+        calls.append(1)
+        return build_figures([ok, flaky])
+
+    disk_cache, cache.disk_cache = cache.disk_cache, None
+    try:
+        first = figures()
+        assert first[0]['layout']['title']['text'] == 'ok' and first[1] == {}
+        figures()
+        assert len(calls) == 2
+
+        broken[0] = False
+        assert figures()[1]['layout']['title']['text'] == 'flaky'
+        figures()
+        assert len(calls) == 3
+    finally:
+        cache.disk_cache = disk_cache
+
+
+if __name__ == "__main__":
+    test_failed_figure_is_not_cached()
+    print("✅ Figuras en paralelo OK")
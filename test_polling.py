@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Pruebas del intervalo de polling adaptativo (src/perf/polling.py)"""
+
+from src.data.accessors import ttl_cached
+from src.data.version import data_changed_at
+from src.perf import polling
+
+
+def test_interval_follows_data_changes_up_to_cap():
+    rows = [1]
+
+    @ttl_cached('test_polling', ttl=0)
+    def get_rows():
+        return list(rows)
+
+    get_rows()
+    loaded_at = data_changed_at()
+    # Recargar los mismos datos no es un cambio
+    get_rows()
+    assert data_changed_at() == loaded_at
+    rows.append(2)
+    get_rows()
+    changed_at = data_changed_at()
+    assert changed_at > loaded_at
+    assert polling.recommended_interval(changed_at + 1) == 10_000
+    assert polling.recommended_interval(changed_at + 400) == 100_000
+    assert polling.recommended_interval(changed_at + 8 * 3600) == 300_000
+
+
+def test_load_stretches_interval():
+    rows = [1]
+
+    @ttl_cached('test_polling_load', ttl=0)
+    def get_rows():
+        return list(rows)
+
+    get_rows()
+    rows.append(2)
+    get_rows()
+    now = data_changed_at() + 1
+    polling._state.update(latency_ms=1500.0, sampled_at=now)
+    try:
+        assert polling.recommended_interval(now) == 30_000
+    finally:
+        polling._state.update(latency_ms=0.0)
+
+
+def test_interval_without_data_is_minimum():
+    saved = polling.data_changed_at
+    polling.data_changed_at = lambda: None
+    try:
+        assert polling.recommended_interval(1000.0) == 10_000
+    finally:
+        polling.data_changed_at = saved
+
+
+if __name__ == "__main__":
+    test_interval_follows_data_changes_up_to_cap()
+    test_load_stretches_interval()
+    test_interval_without_data_is_minimum()
+    print("✅ Polling adaptativo OK")
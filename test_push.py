@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Pruebas del canal de eventos de versión de datos (src/perf/push.py)"""
+
+import os
+from types import SimpleNamespace
+
+from flask import Flask
+
+from src.data.accessors import fingerprint, ttl_cached
+from src.data.version import _data_fingerprints, data_version
+from src.perf import push
+
+
+def make_client():
+    app = SimpleNamespace(server=Flask(__name__))
+    push.init_app(app)
+    return app.server.test_client()
+
+
+def test_disabled_channel_answers_no_content():
+    os.environ.pop('AIFA_PUSH', None)
+    assert make_client().get(push.PUSH_URL).status_code == 204
+
+
+def test_accessor_refresh_is_pushed():
+    os.environ.update(AIFA_PUSH='1', AIFA_PUSH_HEARTBEAT='0.1')
+    rows = [1]
+
+    @ttl_cached('test_push', ttl=0)
+    def get_rows():
+        return list(rows)
+
+    get_rows()
+    response = make_client().get(push.PUSH_URL, buffered=False)
+    assert response.mimetype == 'text/event-stream'
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b'retry:')
+    assert data_version().encode() in next(chunks)
+    assert push.connected_clients() == 1
+
+    # Con datos nuevos el heartbeat recarga la fuente y avisa; mientras tanto solo hay keep-alive
+    rows.append(2)
+    event = next(chunks)
+    while event == b': ping\n\n':
+        event = next(chunks)
+    assert b'event: data-version' in event and data_version().encode() in event
+    assert _data_fingerprints['test_push'] == fingerprint([1, 2])
+    response.close()
+    assert push.connected_clients() == 0
+    for key in ('AIFA_PUSH', 'AIFA_PUSH_HEARTBEAT'):
+        os.environ.pop(key)
+
+
+if __name__ == "__main__":
+    test_disabled_channel_answers_no_content()
+    test_accessor_refresh_is_pushed()
+    print("✅ Canal de eventos OK")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Pruebas de la tabla columnar de rutas (src/data/routes.py)"""
+
+import numpy as np
+
+from src.data.routes import COUNTRIES, COUNTRY_REGIONS, RouteTable, route_table
+
+
+def random_table(size, seed=0):
+    rng = np.random.default_rng(seed)
+    country = rng.choice(COUNTRIES, size)
+    return RouteTable([f'Ciudad {i}' for i in range(size)], country,
+                      rng.uniform(-40, 50, size), rng.uniform(-120, 0, size),
+                      rng.integers(1_000, 200_000, size), rng.integers(1, 60, size),
+                      rng.uniform(60, 95, size)), country
+
+
+def test_current_routes_by_region_and_type():
+    table = route_table()
+    assert table.aggregate('passengers') == {'USA': 255000, 'México': 379000, 'LATAM': 83000, 'Europa': 67000}
+    assert [r['city'] for r in table.records(table.rows(route_type='domestic'), order_by='passengers')] == \
+        ['Cancún', 'Guadalajara', 'Monterrey']
+
+
+def test_vectorized_lookups_match_scan_on_thousands_of_routes():
+    table, country = random_table(5000)
+    records = table.records()
+    for region in set(COUNTRY_REGIONS.values()):
+        expected = [r for r in records if r['region'] == region]
+        assert table.aggregate('passengers').get(region, 0) == sum(r['passengers'] for r in expected)
+        assert len(table.rows(region=region, route_type='international')) == \
+            sum(1 for r in expected if r['country'] != 'México')
+    assert sorted(r['country'] for r in records) == sorted(country)
+
+
+if __name__ == "__main__":
+    test_current_routes_by_region_and_type()
+    test_vectorized_lookups_match_scan_on_thousands_of_routes()
+    print("✅ Tabla de rutas OK")
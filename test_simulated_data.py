@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Pruebas de los generadores de datos simulados (src/data/simulated_data.py)"""
+
+import pandas as pd
+
+from src.data.simulated_data import (
+    STATE_PENETRATION, generate_financial_data, generate_historical_data, generate_state_penetration,
+)
+
+
+def test_shapes_and_ranges():
+    historical = generate_historical_data(periods=3 * 365, freq='D', seed=1)
+    assert historical.shape == (3 * 365, 4)
+    assert historical['date'].is_monotonic_increasing
+    assert (historical[['passengers', 'operations', 'cargo']] >= 0).all().all()
+    # +0.4 puntos por mes: unos 14 puntos en tres años
+    assert 10 < historical['passengers'].iloc[-30:].mean() - historical['passengers'].iloc[:30].mean() < 18
+
+    financial = generate_financial_data(periods=24, seed=1)
+    assert list(financial.columns) == ['month', 'revenue', 'costs', 'ebitda', 'margin']
+    assert len(financial) == 24
+    assert (financial['ebitda'] - (financial['revenue'] - financial['costs'])).abs().max() < 1e-9
+    assert financial['margin'].between(0, 50).all()
+
+    states = generate_state_penetration(32, seed=1)
+    assert list(states['state']) == list(STATE_PENETRATION)
+    assert (states['passengers'] > 0).all()
+    assert (states['passengers'] - states['penetration'] * 25000).abs().max() <= 5000
+
+
+def test_same_seed_same_data():
+    # Las fechas terminan en ``datetime.now()``; la semilla fija los valores
+    for generate in (generate_historical_data, generate_financial_data, generate_state_penetration):
+        first, second = (generate(seed=7).select_dtypes('number') for _ in range(2))
+        pd.testing.assert_frame_equal(first, second)
+        assert not first.equals(generate(seed=8).select_dtypes('number'))
+
+
+def test_state_penetration_size_is_validated():
+    assert len(generate_state_penetration()) == 16
+    for size in (0, 33):
+        try:
+            generate_state_penetration(size)
+        except ValueError:
+            continue
+        raise AssertionError(f"size={size} debió fallar")
+
+
+if __name__ == "__main__":
+    test_shapes_and_ranges()
+    test_same_seed_same_data()
+    test_state_penetration_size_is_validated()
+    print("✅ Datos simulados OK")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Pruebas del índice espacial de destinos (src/data/spatial.py)"""
+
+import numpy as np
+
+from src.data.routes import HUB, route_table
+from src.data.spatial import BallTree, DISTANCE_BANDS, haversine_km, route_index
+
+
+def test_distance_bands_from_hub():
+    table = route_table()
+    index = route_index(table)
+    bands = {band['key']: band for band in index.bands()}
+    assert [bands[key]['routes'] for key, *_ in DISTANCE_BANDS] == [4, 4, 1]
+    assert bands['long_haul']['passengers'] == 67000
+    assert sum(band['passengers'] for band in bands.values()) == table.passengers.sum()
+    assert [table.city[i] for i in index.within(700)] == ['Guadalajara', 'Monterrey']
+    nearest, distances = index.nearest(HUB['lat'], HUB['lon'], k=1)
+    assert table.city[nearest[0]] == 'Guadalajara' and 450 < distances[0] < 470
+    # Misma tabla, mismo índice; una tabla nueva (fuente refrescada) lo reconstruye
+    assert route_index(table) is index
+    assert route_index(route_table()) is not index
+
+
+def test_ball_tree_matches_brute_force():
+    rng = np.random.default_rng(0)
+    lat, lon = rng.uniform(-80, 80, 3000), rng.uniform(-180, 180, 3000)
+    tree = BallTree(lat, lon, leaf_size=8)
+    for qlat, qlon, radius in [(19.7, -99.0, 2500), (60.0, 179.0, 1500), (-45.0, 10.0, 8000)]:
+        distances = haversine_km(qlat, qlon, lat, lon)
+        found, found_distances = tree.query_radius(qlat, qlon, radius)
+        assert sorted(found) == sorted(np.flatnonzero(distances <= radius))
+        assert np.all(np.diff(found_distances) >= 0)
+        nearest, _ = tree.query_nearest(qlat, qlon, k=5)
+        assert list(nearest) == list(np.argsort(distances, kind='stable')[:5])
+
+
+if __name__ == "__main__":
+    test_distance_bands_from_hub()
+    test_ball_tree_matches_brute_force()
+    print("✅ Índice espacial OK")
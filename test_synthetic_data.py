@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Pruebas del generador sintético de alto volumen (src/data/synthetic.py)"""
+
+import pandas as pd
+
+from src.data.synthetic import generate_dataset
+
+
+def test_same_seed_same_data():
+    first = generate_dataset(flights=2000, seed=3)
+    second = generate_dataset(flights=2000, seed=3)
+    for name in first:
+        pd.testing.assert_frame_equal(first[name], second[name])
+    assert not first['flights'].equals(generate_dataset(flights=2000, seed=4)['flights'])
+
+
+def test_sizes_and_seasonal_patterns():
+    dataset = generate_dataset(flights=50000, seed=0)
+    flights = dataset['flights']
+    assert [len(dataset[name]) for name in ('flights', 'scans', 'surveys', 'ledger')] == [50000, 500000, 25000, 12500]
+    assert flights['scheduled'].is_monotonic_increasing
+    assert (flights['passengers'] <= flights['seats']).all()
+    assert dataset['scans']['flight_id'].isin(flights['flight_id']).all()
+
+    # Diciembre > febrero y el banco de las 7 h > madrugada
+    by_month = flights['scheduled'].dt.month.value_counts()
+    by_hour = flights['scheduled'].dt.hour.value_counts()
+    assert by_month[12] > by_month[2] and by_hour[7] > 5 * by_hour[3]
+    assert dataset['surveys']['score'].between(1, 5).all()
+    assert (dataset['ledger'].groupby('kind', observed=True)['amount_mxn'].max()['costo'] < 0)
+
+
+if __name__ == "__main__":
+    test_same_seed_same_data()
+    test_sizes_and_seasonal_patterns()
+    print("✅ Generador sintético OK")
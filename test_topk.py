@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Pruebas del top-K de destinos en streaming (src/data/topk.py)"""
+
+import os
+from collections import Counter
+from types import SimpleNamespace
+
+import dash
+from flask import Flask
+
+from src.data.routes import route_table
+from src.data.synthetic import generate_flights
+from src.data import topk
+from src.data.topk import TopK, top_destinations
+from src.perf import passenger_feed
+from src.perf.admin import TOKEN_HEADER
+
+
+def test_top_destinations_from_route_table():
+    top = top_destinations(route_table())
+    assert len(top) == 8
+    assert [r['city'] for r in top[:3]] == ['Cancún', 'Guadalajara', 'Monterrey']
+    assert top[0]['passengers'] == 156000 and top[0]['country'] == 'México'
+    assert 'Lima' not in [r['city'] for r in top]
+
+
+def test_streaming_top_k_matches_exact_counts():
+    flights = generate_flights(20_000, seed=3)
+    exact = Counter()
+    tracker = TopK(k=5)
+    for city, passengers in zip(flights['destination'].astype(str), flights['passengers'].tolist()):
+        tracker.add(city, passengers)
+        exact[city] += passengers
+    assert tracker.top() == exact.most_common(5)
+    # El índice del heap sigue coherente tras los reemplazos
+    assert all(tracker._heap[i][1] == key for key, i in tracker._position.items())
+    assert tracker.sketch.estimate('Tijuana') >= exact['Tijuana']
+
+
+def test_passenger_events_refresh_the_panel():
+    import app as dashboard
+    geographic = dashboard.load_tab('geographic')
+    server = SimpleNamespace(server=Flask(__name__))
+    passenger_feed.init_app(server)
+    client = server.server.test_client()
+
+    cards, revision = dashboard.update_top_destinations('top-destinations-panel', 0, None)
+    assert len(cards) == 8
+    assert dashboard.update_top_destinations('top-destinations-panel', 1, revision) == (dash.no_update,) * 2
+
+    os.environ['AIFA_ADMIN_TOKEN'] = 'secreto'
+    try:
+        headers = {TOKEN_HEADER: 'secreto'}
+        url = passenger_feed.PASSENGERS_URL
+        assert client.post(url, json={'city': 'Atlantis', 'passengers': 5}, headers=headers).status_code == 400
+        assert client.post(url, json=[{'city': 'Lima', 'passengers': -1}], headers=headers).status_code == 400
+        response = client.post(url, json=[{'city': 'Lima', 'passengers': 500000}], headers=headers)
+        assert response.status_code == 200 and response.get_json()['recorded'] == 1
+    finally:
+        os.environ.pop('AIFA_ADMIN_TOKEN')
+
+    try:
+        assert geographic.get_destinations_revision() == revision + 1
+        cards, current = dashboard.update_top_destinations('top-destinations-panel', 2, revision)
+        assert current == revision + 1
+        assert geographic.get_top_destinations()[0]['city'] == 'Lima'
+    finally:
+        topk._tracker = None  # el resto de las pruebas parte del tracker sembrado
+
+
+if __name__ == "__main__":
+    test_top_destinations_from_route_table()
+    test_streaming_top_k_matches_exact_counts()
+    test_passenger_events_refresh_the_panel()
+    print("✅ Top-K de destinos OK")